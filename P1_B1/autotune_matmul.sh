@@ -0,0 +1,53 @@
+#!/bin/bash
+# autotune_matmul.sh
+# Sweep block sizes across all six tiled loop orders and report the best tile.
+# Independent configurations run concurrently, one worker per pinned core.
+#
+# Override from the environment, e.g.
+#   CORES="0 2 4 6" BLOCK_SIZES="16 32 48 64" ./autotune_matmul.sh
+# Prefer one logical CPU per physical core: SMT siblings share L1/L2 and
+# would skew the counters. All workers still share L3 and DRAM bandwidth.
+
+TARGET=./matmul
+RESULTS_DIR=./reports/autotune
+BLOCK_SIZES=${BLOCK_SIZES:-"8 12 16 24 32 48 64 96 128 192 256 384 512"}
+CORES=${CORES:-$(seq -s ' ' 0 $(( $(nproc) - 1 )))}
+EVENTS=fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch
+
+tiled_funcs=("matmul_tiled_ijk" "matmul_tiled_ikj" "matmul_tiled_jik" "matmul_tiled_jki" "matmul_tiled_kij" "matmul_tiled_kji")
+
+# Make sure target is compiled
+make
+
+mkdir -p "$RESULTS_DIR"
+rm -f "$RESULTS_DIR"/*.txt
+
+# Build the list of (function, block size) configurations
+configs=()
+for bs in $BLOCK_SIZES; do
+    for func in "${tiled_funcs[@]}"; do
+        configs+=("$func $bs")
+    done
+done
+
+core_list=($CORES)
+ncores=${#core_list[@]}
+echo "Running ${#configs[@]} configurations on $ncores cores (${CORES})..."
+
+# Worker w takes configurations w, w+ncores, w+2*ncores, ... on its own core.
+# matmul's timing line (stdout) and perf's counters (stderr) go to one report.
+for w in "${!core_list[@]}"; do
+    (
+        core=${core_list[$w]}
+        for (( c = w; c < ${#configs[@]}; c += ncores )); do
+            read -r func bs <<< "${configs[$c]}"
+            report="${RESULTS_DIR}/${func}_b${bs}.txt"
+            echo "[core $core] Running $func with block size $bs..."
+            taskset -c "$core" perf stat -e $EVENTS $TARGET "$func" "$bs" > "$report" 2>&1
+        done
+    ) &
+done
+wait
+echo "All runs completed, reports saved to ${RESULTS_DIR}"
+
+python3 vizualization_script/autotune_report.py "$RESULTS_DIR"
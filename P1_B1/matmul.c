@@ -2,8 +2,18 @@
 #include <stdlib.h>
 #include <time.h>
 #include <string.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
-#define N 4096   // matrix size (adjust as needed)
+#ifndef N
+#define N 4096   // matrix size (adjust as needed, or build with -DN=<size>)
+#endif
+
+// Smaller of two ints, used to clip the last tile when b does not divide N
+static inline int imin(int a, int b) {
+    return a < b ? a : b;
+}
 
 // Fill matrix with random doubles
 void fill_matrix(double A[N][N]) {
@@ -16,6 +26,7 @@ void fill_matrix(double A[N][N]) {
 
 // ijk
 void matmul_ijk(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i++) {
         for (int j = 0; j < N; j++) {
             C[i][j] = 0.0;
@@ -27,6 +38,7 @@ void matmul_ijk(double A[N][N], double B[N][N], double C[N][N]) {
 
 // jik
 void matmul_jik(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int j = 0; j < N; j++) {
         for (int i = 0; i < N; i++) {
             C[i][j] = 0.0;
@@ -38,11 +50,15 @@ void matmul_jik(double A[N][N], double B[N][N], double C[N][N]) {
 
 // kij
 void matmul_kij(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i++)
         for (int j = 0; j < N; j++)
             C[i][j] = 0.0;
 
+    // k carries a dependence on C, so share out the rows within each k step
+    #pragma omp parallel
     for (int k = 0; k < N; k++) {
+        #pragma omp for
         for (int i = 0; i < N; i++) {
             for (int j = 0; j < N; j++)
                 C[i][j] += A[i][k] * B[k][j];
@@ -52,6 +68,7 @@ void matmul_kij(double A[N][N], double B[N][N], double C[N][N]) {
 
 // ikj
 void matmul_ikj(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i++) {
         for (int j = 0; j < N; j++)
             C[i][j] = 0.0;
@@ -65,10 +82,12 @@ void matmul_ikj(double A[N][N], double B[N][N], double C[N][N]) {
 
 // jki
 void matmul_jki(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i++)
         for (int j = 0; j < N; j++)
             C[i][j] = 0.0;
 
+    #pragma omp parallel for
     for (int j = 0; j < N; j++) {
         for (int k = 0; k < N; k++) {
             for (int i = 0; i < N; i++)
@@ -79,11 +98,15 @@ void matmul_jki(double A[N][N], double B[N][N], double C[N][N]) {
 
 // kji
 void matmul_kji(double A[N][N], double B[N][N], double C[N][N]) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i++)
         for (int j = 0; j < N; j++)
             C[i][j] = 0.0;
 
+    // k carries a dependence on C, so share out the columns within each k step
+    #pragma omp parallel
     for (int k = 0; k < N; k++) {
+        #pragma omp for
         for (int j = 0; j < N; j++) {
             for (int i = 0; i < N; i++)
                 C[i][j] += A[i][k] * B[k][j];
@@ -92,62 +115,70 @@ void matmul_kji(double A[N][N], double B[N][N], double C[N][N]) {
 }
 
 void matmul_tiled_ijk(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel for collapse(2)
     for (int i = 0; i < N; i += b)
         for (int j = 0; j < N; j += b)
             for (int k = 0; k < N; k += b)
-                for (int ii = i; ii < i + b; ii++)
-                    for (int jj = j; jj < j + b; jj++)
-                        for (int kk = k; kk < k + b; kk++)
+                for (int ii = i; ii < imin(i + b, N); ii++)
+                    for (int jj = j; jj < imin(j + b, N); jj++)
+                        for (int kk = k; kk < imin(k + b, N); kk++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
 void matmul_tiled_ikj(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel for
     for (int i = 0; i < N; i += b)
         for (int k = 0; k < N; k += b)
             for (int j = 0; j < N; j += b)
-                for (int ii = i; ii < i + b; ii++)
-                    for (int kk = k; kk < k + b; kk++)
-                        for (int jj = j; jj < j + b; jj++)
+                for (int ii = i; ii < imin(i + b, N); ii++)
+                    for (int kk = k; kk < imin(k + b, N); kk++)
+                        for (int jj = j; jj < imin(j + b, N); jj++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
 void matmul_tiled_jik(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel for collapse(2)
     for (int j = 0; j < N; j += b)
         for (int i = 0; i < N; i += b)
             for (int k = 0; k < N; k += b)
-                for (int jj = j; jj < j + b; jj++)
-                    for (int ii = i; ii < i + b; ii++)
-                        for (int kk = k; kk < k + b; kk++)
+                for (int jj = j; jj < imin(j + b, N); jj++)
+                    for (int ii = i; ii < imin(i + b, N); ii++)
+                        for (int kk = k; kk < imin(k + b, N); kk++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
 void matmul_tiled_jki(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel for
     for (int j = 0; j < N; j += b)
         for (int k = 0; k < N; k += b)
             for (int i = 0; i < N; i += b)
-                for (int jj = j; jj < j + b; jj++)
-                    for (int kk = k; kk < k + b; kk++)
-                        for (int ii = i; ii < i + b; ii++)
+                for (int jj = j; jj < imin(j + b, N); jj++)
+                    for (int kk = k; kk < imin(k + b, N); kk++)
+                        for (int ii = i; ii < imin(i + b, N); ii++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
 void matmul_tiled_kij(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel
     for (int k = 0; k < N; k += b)
+        #pragma omp for collapse(2)
         for (int i = 0; i < N; i += b)
             for (int j = 0; j < N; j += b)
-                for (int kk = k; kk < k + b; kk++)
-                    for (int ii = i; ii < i + b; ii++)
-                        for (int jj = j; jj < j + b; jj++)
+                for (int kk = k; kk < imin(k + b, N); kk++)
+                    for (int ii = i; ii < imin(i + b, N); ii++)
+                        for (int jj = j; jj < imin(j + b, N); jj++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
 void matmul_tiled_kji(double A[N][N], double B[N][N], double C[N][N], int b) {
+    #pragma omp parallel
     for (int k = 0; k < N; k += b)
+        #pragma omp for collapse(2)
         for (int j = 0; j < N; j += b)
             for (int i = 0; i < N; i += b)
-                for (int kk = k; kk < k + b; kk++)
-                    for (int jj = j; jj < j + b; jj++)
-                        for (int ii = i; ii < i + b; ii++)
+                for (int kk = k; kk < imin(k + b, N); kk++)
+                    for (int jj = j; jj < imin(j + b, N); jj++)
+                        for (int ii = i; ii < imin(i + b, N); ii++)
                             A[ii][jj] += B[ii][kk] * C[kk][jj];
 }
 
@@ -161,29 +192,49 @@ int main(int argc, char **argv) {
     fill_matrix(B);
 
     if (argc < 2) {
-        printf("Usage: %s <function_name> [block_size]\n", argv[0]);
+        printf("Usage: %s <function_name> [block_size] [repetitions]\n", argv[0]);
         return 1;
     }
 
     char *func = argv[1];
     int b = (argc > 2) ? atoi(argv[2]) : 64;
-
-    if (strcmp(func, "matmul_ijk") == 0) matmul_ijk(A, B, C);
-    else if (strcmp(func, "matmul_jik") == 0) matmul_jik(A, B, C);
-    else if (strcmp(func, "matmul_kij") == 0) matmul_kij(A, B, C);
-    else if (strcmp(func, "matmul_ikj") == 0) matmul_ikj(A, B, C);
-    else if (strcmp(func, "matmul_jki") == 0) matmul_jki(A, B, C);
-    else if (strcmp(func, "matmul_kji") == 0) matmul_kji(A, B, C);
-    else if (strcmp(func, "matmul_tiled_ijk") == 0) matmul_tiled_ijk(A, B, C, b);
-    else if (strcmp(func, "matmul_tiled_ikj") == 0) matmul_tiled_ikj(A, B, C, b);
-    else if (strcmp(func, "matmul_tiled_jik") == 0) matmul_tiled_jik(A, B, C, b);
-    else if (strcmp(func, "matmul_tiled_jki") == 0) matmul_tiled_jki(A, B, C, b);
-    else if (strcmp(func, "matmul_tiled_kij") == 0) matmul_tiled_kij(A, B, C, b);
-    else if (strcmp(func, "matmul_tiled_kji") == 0) matmul_tiled_kji(A, B, C, b);
-    else {
-        printf("Unknown function: %s\n", func);
+    // Small N finish in microseconds, so let the caller repeat the kernel
+    int reps = (argc > 3) ? atoi(argv[3]) : 1;
+    if (b <= 0 || reps <= 0) {
+        printf("Invalid block size or repetitions: %d %d\n", b, reps);
         return 1;
     }
 
+    // Time only the kernel so that fill_matrix does not skew GFLOP/s
+    struct timespec start, end;
+    clock_gettime(CLOCK_MONOTONIC, &start);
+
+    for (int r = 0; r < reps; r++) {
+        if (strcmp(func, "matmul_ijk") == 0) matmul_ijk(A, B, C);
+        else if (strcmp(func, "matmul_jik") == 0) matmul_jik(A, B, C);
+        else if (strcmp(func, "matmul_kij") == 0) matmul_kij(A, B, C);
+        else if (strcmp(func, "matmul_ikj") == 0) matmul_ikj(A, B, C);
+        else if (strcmp(func, "matmul_jki") == 0) matmul_jki(A, B, C);
+        else if (strcmp(func, "matmul_kji") == 0) matmul_kji(A, B, C);
+        else if (strcmp(func, "matmul_tiled_ijk") == 0) matmul_tiled_ijk(A, B, C, b);
+        else if (strcmp(func, "matmul_tiled_ikj") == 0) matmul_tiled_ikj(A, B, C, b);
+        else if (strcmp(func, "matmul_tiled_jik") == 0) matmul_tiled_jik(A, B, C, b);
+        else if (strcmp(func, "matmul_tiled_jki") == 0) matmul_tiled_jki(A, B, C, b);
+        else if (strcmp(func, "matmul_tiled_kij") == 0) matmul_tiled_kij(A, B, C, b);
+        else if (strcmp(func, "matmul_tiled_kji") == 0) matmul_tiled_kji(A, B, C, b);
+        else {
+            printf("Unknown function: %s\n", func);
+            return 1;
+        }
+    }
+
+    clock_gettime(CLOCK_MONOTONIC, &end);
+    double seconds = (end.tv_sec - start.tv_sec) + (end.tv_nsec - start.tv_nsec) * 1e-9;
+    int threads = 1;
+#ifdef _OPENMP
+    threads = omp_get_max_threads();
+#endif
+    printf("%s N=%d b=%d threads=%d reps=%d time=%.6f s\n", func, N, b, threads, reps, seconds);
+
     return 0;
 }
@@ -5,6 +5,21 @@
 TARGET=./matmul
 BLOCK_SIZE=64
 RESULTS_DIR=./reports
+# Scalar mode for the hierarchical roofline: SCALAR=1 ./run_matmul_perf.sh
+# runs matmul_scalar (built with -fno-tree-vectorize) and saves to ${RESULTS_DIR}/scalar
+if [ "${SCALAR:-0}" -eq 1 ]; then
+    TARGET=./matmul_scalar
+    RESULTS_DIR=${RESULTS_DIR}/scalar
+    mkdir -p "$RESULTS_DIR"
+fi
+EVENTS=fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch
+
+# Repetition mode: REPEAT=10 WARMUP=2 ./run_matmul_perf.sh
+# Each variant is run WARMUP times unmeasured, then REPEAT times under perf stat,
+# one report per repetition in ${REPEAT_DIR}/<func>.r<rep>.txt
+REPEAT=${REPEAT:-1}
+WARMUP=${WARMUP:-0}
+REPEAT_DIR=${RESULTS_DIR}/repeat
 # List of normal matrix multiplication functions
 # normal_funcs=("matmul_ijk" "matmul_jik" "matmul_kij" "matmul_ikj" "matmul_jki" "matmul_kji")
 
@@ -12,19 +27,48 @@ RESULTS_DIR=./reports
 tiled_funcs=("matmul_tiled_ijk" "matmul_tiled_ikj" "matmul_tiled_jik" "matmul_tiled_jki" "matmul_tiled_kij" "matmul_tiled_kji")
 # tiled_funcs=("matmul_tiled_ikj")
 # Make sure target is compiled
-make
+make ${TARGET#./}
+
+# Run one variant: a single perf stat run, or warm-ups followed by REPEAT runs
+run_variant() {
+    local func=$1
+    shift
+    if [ "$REPEAT" -le 1 ]; then
+        taskset -c 0 perf stat -e $EVENTS $TARGET "$func" "$@" 2> "${RESULTS_DIR}/${func}.txt"
+        return
+    fi
+    for w in $(seq 1 $WARMUP); do
+        taskset -c 0 $TARGET "$func" "$@" > /dev/null
+    done
+    for r in $(seq 1 $REPEAT); do
+        taskset -c 0 perf stat -e $EVENTS $TARGET "$func" "$@" > "${REPEAT_DIR}/${func}.r${r}.txt" 2>&1
+    done
+}
+
+if [ "$REPEAT" -gt 1 ]; then
+    mkdir -p "$REPEAT_DIR"
+    rm -f "$REPEAT_DIR"/*.txt
+    RESULTS_DIR=$REPEAT_DIR
+    echo "Repetition mode: $WARMUP warm-up and $REPEAT measured runs per variant"
+fi
 
 echo "Running normal matrix multiplication variants..."
 for func in "${normal_funcs[@]}"; do
     echo "Running $func..."
-    taskset -c 0 perf stat -e fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch $TARGET "$func" 2> "${RESULTS_DIR}/${func}.txt"
-    echo "$func done, output saved to ${func}.txt"
+    run_variant "$func"
+    echo "$func done, output saved to ${RESULTS_DIR}"
 done
 
 echo "Running tiled matrix multiplication variants (block size $BLOCK_SIZE)..."
 for func in "${tiled_funcs[@]}"; do
     echo "Running $func..."
-    taskset -c 0 perf stat -e fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch $TARGET "$func" "$BLOCK_SIZE" 2> "${RESULTS_DIR}/${func}.txt"
-    echo "$func done, output saved to ./reports/${func}.txt"
+    run_variant "$func" "$BLOCK_SIZE"
+    echo "$func done, output saved to ${RESULTS_DIR}"
 done
 echo "All runs completed."
+
+if [ "$REPEAT" -gt 1 ]; then
+    cd vizualization_script
+    python3 perf_stats.py "../${REPEAT_DIR}"
+    python3 viz.py "../${REPEAT_DIR}"
+fi
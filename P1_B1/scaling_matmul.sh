@@ -0,0 +1,38 @@
+#!/bin/bash
+# scaling_matmul.sh
+# Strong-scaling sweep of the OpenMP matmul kernels over 1..nproc threads.
+#
+# Threads are pinned one per CPU, taking one CPU of every physical core first
+# and SMT siblings only after all cores are busy. Override from the environment:
+#   FUNCS="matmul_ikj matmul_tiled_kij" THREADS="1 2 4 8" ./scaling_matmul.sh
+
+TARGET=./matmul_omp
+BLOCK_SIZE=${BLOCK_SIZE:-64}
+RESULTS_DIR=./reports/scaling
+FUNCS=${FUNCS:-"matmul_ikj matmul_tiled_ikj matmul_tiled_kij"}
+THREADS=${THREADS:-$(seq -s ' ' 1 $(nproc))}
+EVENTS=fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch
+
+# CPU order: first CPU of each core, then the remaining SMT siblings
+cpu_order=($(lscpu -p=CPU,CORE | grep -v '^#' | awk -F, '!seen[$2]++ {print $1}')
+           $(lscpu -p=CPU,CORE | grep -v '^#' | awk -F, 'seen[$2]++ {print $1}'))
+
+# Make sure target is compiled
+make $TARGET
+
+mkdir -p "$RESULTS_DIR"
+rm -f "$RESULTS_DIR"/*.txt
+
+for func in $FUNCS; do
+    for t in $THREADS; do
+        cpus=$(IFS=, ; echo "${cpu_order[*]:0:$t}")
+        report="${RESULTS_DIR}/${func}_t${t}.txt"
+        echo "Running $func with $t threads on CPUs $cpus..."
+        OMP_NUM_THREADS=$t OMP_PLACES=threads OMP_PROC_BIND=close \
+            taskset -c "$cpus" perf stat -e $EVENTS $TARGET "$func" "$BLOCK_SIZE" > "$report" 2>&1
+    done
+done
+echo "All runs completed, reports saved to ${RESULTS_DIR}"
+
+cd vizualization_script
+python3 scaling_report.py "../${RESULTS_DIR}"
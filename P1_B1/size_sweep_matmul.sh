@@ -0,0 +1,32 @@
+#!/bin/bash
+# size_sweep_matmul.sh
+# Build matmul for a range of N and run every loop order at each size, to find
+# where performance falls off as the working set (3 * N^2 doubles) outgrows
+# L1, L2 and L3. Override from the environment, e.g.
+#   SIZES="64 256 1024 4096" FUNCS="matmul_ikj matmul_tiled_ikj" ./size_sweep_matmul.sh
+
+BLOCK_SIZE=${BLOCK_SIZE:-64}
+RESULTS_DIR=./reports/sizes
+SIZES=${SIZES:-"32 48 64 96 128 192 256 384 512 768 1024 1536 2048"}
+FUNCS=${FUNCS:-"matmul_ijk matmul_jik matmul_kij matmul_ikj matmul_jki matmul_kji"}
+# Repeat small sizes so every run does at least ~2 * TARGET_N^3 FLOPs
+TARGET_N=${TARGET_N:-1024}
+EVENTS=fp_ret_sse_avx_ops.all,ls_dc_accesses,l1_data_cache_fills_all,l2_cache_req_stat.ic_access_in_l2,l2_cache_req_stat.ic_dc_hit_in_l2,l2_cache_req_stat.ic_dc_miss_in_l2,ls_dmnd_fills_from_sys.int_cache,ls_dmnd_fills_from_sys.mem_io_local,ls_dispatch.ld_dispatch
+
+mkdir -p "$RESULTS_DIR"
+rm -f "$RESULTS_DIR"/*.txt
+
+for n in $SIZES; do
+    make matmul_n$n
+    reps=$(( TARGET_N * TARGET_N * TARGET_N / (n * n * n) ))
+    [ "$reps" -lt 1 ] && reps=1
+    for func in $FUNCS; do
+        report="${RESULTS_DIR}/${func}_n${n}.txt"
+        echo "Running $func with N=$n ($reps repetitions)..."
+        taskset -c 0 perf stat -e $EVENTS ./matmul_n$n "$func" "$BLOCK_SIZE" "$reps" > "$report" 2>&1
+    done
+done
+echo "All runs completed, reports saved to ${RESULTS_DIR}"
+
+cd vizualization_script
+python3 size_sweep_report.py "../${RESULTS_DIR}"
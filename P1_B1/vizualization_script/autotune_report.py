@@ -0,0 +1,84 @@
+import os
+import sys
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from perf_reports import TILED_FUNCS, gflops, load_reports
+
+
+def collect(results_dir):
+    """Return (block_sizes, perf) where perf[i, j] is GFLOP/s of TILED_FUNCS[i] at block_sizes[j]."""
+    reports = [r for r in load_reports(results_dir) if r["func"] in TILED_FUNCS]
+    if not reports:
+        raise SystemExit(f"No tiled matmul reports found in {results_dir}")
+
+    block_sizes = sorted({r["block_size"] for r in reports})
+    perf = np.full((len(TILED_FUNCS), len(block_sizes)), np.nan)
+    for r in reports:
+        perf[TILED_FUNCS.index(r["func"]), block_sizes.index(r["block_size"])] = gflops(r)
+    return block_sizes, perf
+
+
+def tile_footprint_kib(b):
+    # One b x b tile of each of the three matrices, in doubles
+    return 3 * b * b * 8 / 1024
+
+
+def print_summary(block_sizes, perf, csv_file):
+    with open(csv_file, "w") as f:
+        f.write("func,block_size,tile_footprint_kib,gflops\n")
+        for i, func in enumerate(TILED_FUNCS):
+            for j, b in enumerate(block_sizes):
+                f.write(f"{func},{b},{tile_footprint_kib(b):.1f},{perf[i, j]:.4f}\n")
+
+    print("Best block size per loop order:")
+    for i, func in enumerate(TILED_FUNCS):
+        if np.all(np.isnan(perf[i])):
+            print(f"  {func:18s} no data")
+            continue
+        j = np.nanargmax(perf[i])
+        print(f"  {func:18s} b={block_sizes[j]:4d}  {perf[i, j]:8.3f} GFLOP/s  (tile footprint {tile_footprint_kib(block_sizes[j]):.1f} KiB)")
+
+    i, j = np.unravel_index(np.nanargmax(perf), perf.shape)
+    print(f"\nBest configuration: {TILED_FUNCS[i]} with block size {block_sizes[j]} -> {perf[i, j]:.3f} GFLOP/s")
+    print(f"Summary saved to {csv_file}")
+    return i, j
+
+
+def plot_heatmap(block_sizes, perf, best, plot_file):
+    fig, ax = plt.subplots(figsize=(max(8, 0.9 * len(block_sizes)), 5))
+    im = ax.imshow(perf, cmap="viridis", aspect="auto")
+    fig.colorbar(im, ax=ax, label="Performance (GFLOPS/sec)")
+
+    ax.set_xticks(range(len(block_sizes)))
+    ax.set_xticklabels(block_sizes)
+    ax.set_yticks(range(len(TILED_FUNCS)))
+    ax.set_yticklabels([f.replace("matmul_tiled_", "") for f in TILED_FUNCS])
+    ax.set_xlabel("Block size")
+    ax.set_ylabel("Loop order (tiled)")
+    ax.set_title("Tiled MM autotuning: GFLOP/s per block size and loop order")
+
+    threshold = np.nanmax(perf) / 2
+    for i in range(perf.shape[0]):
+        for j in range(perf.shape[1]):
+            if not np.isnan(perf[i, j]):
+                ax.text(j, i, f"{perf[i, j]:.1f}", ha="center", va="center", fontsize=8,
+                        color="k" if perf[i, j] > threshold else "w")
+
+    # Outline the overall best configuration
+    bi, bj = best
+    ax.add_patch(plt.Rectangle((bj - 0.5, bi - 0.5), 1, 1, fill=False, edgecolor="red", linewidth=2.5))
+
+    fig.tight_layout()
+    fig.savefig(plot_file, dpi=200)
+    print(f"Heatmap saved to {plot_file}")
+
+
+if __name__ == "__main__":
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "../reports/autotune"
+    block_sizes, perf = collect(results_dir)
+    best = print_summary(block_sizes, perf, os.path.join(results_dir, "autotune_summary.csv"))
+    plot_heatmap(block_sizes, perf, best, os.path.join(results_dir, "autotune_heatmap.png"))
@@ -0,0 +1,139 @@
+import glob
+import os
+import re
+
+# --- Counters collected by the matmul harnesses ---
+EVENTS = [
+    "fp_ret_sse_avx_ops.all",
+    "ls_dc_accesses",
+    "l1_data_cache_fills_all",
+    "l2_cache_req_stat.ic_access_in_l2",
+    "l2_cache_req_stat.ic_dc_hit_in_l2",
+    "l2_cache_req_stat.ic_dc_miss_in_l2",
+    "ls_dmnd_fills_from_sys.int_cache",
+    "ls_dmnd_fills_from_sys.mem_io_local",
+    "ls_dispatch.ld_dispatch",
+]
+
+TILED_FUNCS = ["matmul_tiled_ijk", "matmul_tiled_ikj", "matmul_tiled_jik",
+               "matmul_tiled_jki", "matmul_tiled_kij", "matmul_tiled_kji"]
+
+CACHE_LINE_BYTES = 64
+# ls_dc_accesses counts load/store ops, not bytes: one op moves one double only in
+# matmul_scalar (-fno-tree-vectorize); vectorized -O3 -march=native ops move up to 32 B
+L1_ACCESS_BYTES = 8
+
+# "matmul_tiled_ikj N=4096 b=64 threads=1 reps=1 time=1.234567 s" printed by matmul.c
+KERNEL_RE = re.compile(r"^(\S+) N=(\d+) b=(\d+)(?: threads=(\d+))?(?: reps=(\d+))? time=([0-9.eE+-]+) s")
+COUNTER_RE = re.compile(r"^\s*([0-9][0-9,.]*|<not counted>|<not supported>)\s+(\S+)")
+
+
+def parse_perf_report(path):
+    """
+    Parse one report file: the perf stat block (stderr) and, when present,
+    the kernel timing line that matmul prints on stdout.
+    Counters that perf could not count are stored as None.
+    """
+    report = {
+        "path": path,
+        "func": None,
+        "n": None,
+        "block_size": None,
+        "threads": None,
+        "reps": 1,
+        "kernel_time": None,
+        "elapsed": None,
+        "counters": {},
+    }
+    with open(path) as f:
+        for line in f:
+            m = KERNEL_RE.match(line)
+            if m:
+                report["func"] = m.group(1)
+                report["n"] = int(m.group(2))
+                report["block_size"] = int(m.group(3))
+                report["threads"] = int(m.group(4)) if m.group(4) else 1
+                report["reps"] = int(m.group(5)) if m.group(5) else 1
+                report["kernel_time"] = float(m.group(6))
+                continue
+            if "seconds time elapsed" in line:
+                report["elapsed"] = float(line.split()[0])
+                continue
+            m = COUNTER_RE.match(line)
+            if m and m.group(2) in EVENTS:
+                value = m.group(1)
+                report["counters"][m.group(2)] = None if value.startswith("<") else float(value.replace(",", ""))
+    return report
+
+
+def func_name(report):
+    """Kernel name from matmul's timing line, else from <func>[.r<rep>].txt."""
+    if report["func"]:
+        return report["func"]
+    return re.sub(r"(\.r\d+)?\.txt$", "", os.path.basename(report["path"]))
+
+
+def load_reports(directory, pattern="*.txt"):
+    """Parse every report in a directory, sorted by file name."""
+    return [parse_perf_report(p) for p in sorted(glob.glob(os.path.join(directory, pattern)))]
+
+
+def flops(report):
+    """FLOPs retired, falling back to 2*N^3 per repetition when the FP counter is missing."""
+    value = report["counters"].get("fp_ret_sse_avx_ops.all")
+    if value:
+        return value
+    if report["n"] is not None:
+        return 2.0 * report["n"] ** 3 * report["reps"]
+    return None
+
+
+def runtime(report):
+    """Kernel time if matmul printed one, otherwise perf's wall-clock time."""
+    return report["kernel_time"] if report["kernel_time"] is not None else report["elapsed"]
+
+
+def gflops(report):
+    f, t = flops(report), runtime(report)
+    if not f or not t:
+        return float("nan")
+    return f / t / 1e9
+
+
+def dram_bytes(report):
+    """DRAM traffic estimated from demand fills served by local memory."""
+    fills = report["counters"].get("ls_dmnd_fills_from_sys.mem_io_local")
+    return fills * CACHE_LINE_BYTES if fills else None
+
+
+def operational_intensity(report):
+    """FLOPs per byte of DRAM traffic."""
+    f, b = flops(report), dram_bytes(report)
+    if not f or not b:
+        return float("nan")
+    return f / b
+
+
+def level_traffic(report):
+    """
+    Bytes moved at each level of the hierarchy:
+      L1   - every load/store hitting the data cache (ls_dc_accesses), one
+             double each: measure with matmul_scalar (SCALAR=1), otherwise
+             vectorized accesses make this an undercount
+      L2   - lines filled into L1, i.e. traffic from L2 and beyond
+      DRAM - demand fills served by local memory
+    """
+    c = report["counters"]
+    def scaled(event, nbytes):
+        return c[event] * nbytes if c.get(event) else None
+    return {
+        "L1": scaled("ls_dc_accesses", L1_ACCESS_BYTES),
+        "L2": scaled("l1_data_cache_fills_all", CACHE_LINE_BYTES),
+        "DRAM": scaled("ls_dmnd_fills_from_sys.mem_io_local", CACHE_LINE_BYTES),
+    }
+
+
+def level_intensities(report):
+    """FLOPs per byte against each level's traffic (NaN when a counter is missing)."""
+    f = flops(report)
+    return {level: (f / b if f and b else float("nan")) for level, b in level_traffic(report).items()}
@@ -0,0 +1,131 @@
+import os
+import re
+import sys
+from itertools import combinations
+
+import numpy as np
+from scipy import stats
+
+from perf_reports import EVENTS, gflops, load_reports, operational_intensity
+
+CONFIDENCE = 0.95
+ALPHA = 0.05
+# Modified z-score cut-off for outlier rejection (Iglewicz & Hoaglin)
+OUTLIER_Z = 3.5
+
+# Repetition reports are named <func>.r<rep>.txt by run_matmul_perf.sh
+REP_RE = re.compile(r"^(.+)\.r(\d+)\.txt$")
+
+
+def outlier_mask(values):
+    """True for samples to keep, using the median absolute deviation."""
+    values = np.asarray(values, dtype=float)
+    median = np.median(values)
+    mad = np.median(np.abs(values - median))
+    if mad == 0:
+        return np.ones(len(values), dtype=bool)
+    z = 0.6745 * (values - median) / mad
+    return np.abs(z) <= OUTLIER_Z
+
+
+def summarize(values):
+    """Mean, median, stddev and CI half-width of the samples left after outlier rejection."""
+    values = np.asarray([v for v in values if v is not None and np.isfinite(v)], dtype=float)
+    if len(values) == 0:
+        return None
+    kept = values[outlier_mask(values)]
+    n = len(kept)
+    std = np.std(kept, ddof=1) if n > 1 else 0.0
+    ci = stats.t.ppf((1 + CONFIDENCE) / 2, n - 1) * std / np.sqrt(n) if n > 1 else float("nan")
+    return {
+        "n": n,
+        "rejected": len(values) - n,
+        "mean": float(np.mean(kept)),
+        "median": float(np.median(kept)),
+        "std": float(std),
+        "ci": float(ci),
+        "samples": kept,
+    }
+
+
+def group_by_func(results_dir):
+    """Map function name -> list of parsed repetition reports."""
+    groups = {}
+    for report in load_reports(results_dir):
+        m = REP_RE.match(os.path.basename(report["path"]))
+        if not m:
+            continue
+        groups.setdefault(m.group(1), []).append(report)
+    return groups
+
+
+def summarize_func(reports):
+    """Statistics for every counter plus the derived GFLOP/s and DRAM OI."""
+    metrics = {event: summarize([r["counters"].get(event) for r in reports]) for event in EVENTS}
+    metrics["gflops"] = summarize([gflops(r) for r in reports])
+    metrics["oi"] = summarize([operational_intensity(r) for r in reports])
+    return metrics
+
+
+def compare(a, b):
+    """Welch's t-test between two sets of samples; returns the p-value."""
+    if a is None or b is None or a["n"] < 2 or b["n"] < 2:
+        return float("nan")
+    return float(stats.ttest_ind(a["samples"], b["samples"], equal_var=False).pvalue)
+
+
+def pairwise_significance(summaries, metric="gflops"):
+    """
+    Compare every pair of variants on one metric.
+    p-values are Holm-Bonferroni adjusted across all pairs.
+    """
+    pairs = [(a, b, compare(summaries[a][metric], summaries[b][metric]))
+             for a, b in combinations(sorted(summaries), 2)]
+    order = sorted(range(len(pairs)), key=lambda i: (np.isnan(pairs[i][2]), pairs[i][2]))
+    adjusted = [float("nan")] * len(pairs)
+    running = 0.0
+    for rank, i in enumerate(order):
+        p = pairs[i][2]
+        if np.isnan(p):
+            continue
+        running = max(running, min(1.0, (len(pairs) - rank) * p))
+        adjusted[i] = running
+    return [(a, b, p, adj, adj < ALPHA) for (a, b, p), adj in zip(pairs, adjusted)]
+
+
+def load_summaries(results_dir):
+    return {func: summarize_func(reports) for func, reports in group_by_func(results_dir).items()}
+
+
+def save_summaries(summaries, csv_file):
+    with open(csv_file, "w") as f:
+        f.write("func,metric,n,rejected,mean,median,std,ci95\n")
+        for func in sorted(summaries):
+            for metric, s in summaries[func].items():
+                if s is not None:
+                    f.write(f"{func},{metric},{s['n']},{s['rejected']},{s['mean']:.6g},{s['median']:.6g},{s['std']:.6g},{s['ci']:.6g}\n")
+
+
+def print_report(summaries):
+    print(f"{'function':20s} {'n':>3s} {'out':>3s} {'mean GFLOP/s':>13s} {'median':>9s} {'stddev':>9s} {'95% CI':>9s}")
+    for func in sorted(summaries):
+        s = summaries[func]["gflops"]
+        if s is None:
+            continue
+        print(f"{func:20s} {s['n']:3d} {s['rejected']:3d} {s['mean']:13.3f} {s['median']:9.3f} {s['std']:9.3f} {s['ci']:9.3f}")
+
+    print("\nPairwise GFLOP/s comparison (Welch t-test, Holm-adjusted):")
+    for a, b, p, adj, significant in pairwise_significance(summaries):
+        verdict = "significant" if significant else "not significant"
+        print(f"  {a:18s} vs {b:18s} p={p:.3g} adj={adj:.3g}  {verdict}")
+
+
+if __name__ == "__main__":
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "../reports/repeat"
+    summaries = load_summaries(results_dir)
+    if not summaries:
+        raise SystemExit(f"No repetition reports (<func>.r<rep>.txt) found in {results_dir}")
+    print_report(summaries)
+    csv_file = os.path.join(results_dir, "repeat_summary.csv")
+    save_summaries(summaries, csv_file)
+    print(f"\nSummary saved to {csv_file}")
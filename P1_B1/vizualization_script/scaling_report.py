@@ -0,0 +1,91 @@
+import os
+import sys
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from perf_reports import gflops, load_reports, operational_intensity, runtime
+from viz import ALL_CORE_DRAM_BW_GBs, ALL_CORE_PEAK_GFLOPS
+
+
+def collect(results_dir):
+    """Map function -> list of (threads, seconds, GFLOP/s, DRAM OI), sorted by threads."""
+    series = {}
+    for r in load_reports(results_dir):
+        if r["func"] is None:
+            continue
+        series.setdefault(r["func"], []).append((r["threads"], runtime(r), gflops(r), operational_intensity(r)))
+    return {func: sorted(points) for func, points in series.items()}
+
+
+def scaling_table(points):
+    """Speedup and parallel efficiency relative to the smallest thread count measured."""
+    threads = np.array([p[0] for p in points])
+    seconds = np.array([p[1] for p in points])
+    base_threads, base_seconds = threads[0], seconds[0]
+    speedup = base_seconds / seconds * base_threads
+    return threads, seconds, speedup, speedup / threads
+
+
+def save_table(series, csv_file):
+    with open(csv_file, "w") as f:
+        f.write("func,threads,seconds,speedup,efficiency,gflops,oi_dram\n")
+        for func, points in sorted(series.items()):
+            threads, seconds, speedup, efficiency = scaling_table(points)
+            for k, p in enumerate(points):
+                f.write(f"{func},{threads[k]},{seconds[k]:.6f},{speedup[k]:.4f},{efficiency[k]:.4f},{p[2]:.4f},{p[3]:.4f}\n")
+    print(f"Scaling table saved to {csv_file}")
+
+
+def plot_scaling(series, plot_file):
+    fig, (ax_s, ax_e, ax_r) = plt.subplots(1, 3, figsize=(20, 6))
+    max_threads = max(p[0] for points in series.values() for p in points)
+
+    for func, points in sorted(series.items()):
+        threads, _, speedup, efficiency = scaling_table(points)
+        label = func.replace("matmul_", "")
+        ax_s.plot(threads, speedup, marker="o", label=label)
+        ax_e.plot(threads, efficiency, marker="o", label=label)
+
+        # Roofline position of every thread count, annotated with the count
+        oi = np.array([p[3] for p in points])
+        perf = np.array([p[2] for p in points])
+        line, = ax_r.loglog(oi, perf, marker="o", linestyle="-", label=label)
+        for t, x, y in zip(threads, oi, perf):
+            ax_r.annotate(str(t), (x, y), textcoords="offset points", xytext=(4, 4), fontsize=7, color=line.get_color())
+
+    ax_s.plot([1, max_threads], [1, max_threads], "k--", linewidth=1, label="ideal")
+    ax_s.set_xlabel("Threads")
+    ax_s.set_ylabel("Speedup")
+    ax_s.set_title("Strong scaling: speedup")
+    ax_e.axhline(1.0, color="k", linestyle="--", linewidth=1)
+    ax_e.set_xlabel("Threads")
+    ax_e.set_ylabel("Parallel efficiency")
+    ax_e.set_ylim(0, 1.2)
+    ax_e.set_title("Strong scaling: efficiency")
+
+    OI = np.logspace(-2.5, 3, 500)
+    ax_r.loglog(OI, np.minimum(ALL_CORE_PEAK_GFLOPS, OI * ALL_CORE_DRAM_BW_GBs), "k--", linewidth=2,
+                label=f"All-core roof ({ALL_CORE_PEAK_GFLOPS:.0f} GFLOPS, {ALL_CORE_DRAM_BW_GBs:.0f} GB/s DRAM)")
+    ax_r.set_xlabel("Operational Intensity (FLOPs/Byte of DRAM traffic)")
+    ax_r.set_ylabel("Performance (GFLOPS/sec)")
+    ax_r.set_title("Roofline position per thread count")
+
+    for ax in (ax_s, ax_e, ax_r):
+        ax.grid(True, which="both", ls="--", linewidth=0.5, alpha=0.6)
+        ax.legend(fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(plot_file, dpi=200)
+    print(f"Scaling plot saved to {plot_file}")
+
+
+if __name__ == "__main__":
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "../reports/scaling"
+    series = collect(results_dir)
+    if not series:
+        raise SystemExit(f"No scaling reports found in {results_dir}")
+    save_table(series, os.path.join(results_dir, "scaling_summary.csv"))
+    plot_scaling(series, os.path.join(results_dir, "scaling.png"))
@@ -0,0 +1,138 @@
+import glob
+import os
+import sys
+
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from perf_reports import gflops, load_reports
+
+# Fallback capacities (per core L1d/L2, shared L3) of the Ryzen 7 7435HS
+DEFAULT_CACHE_BYTES = {"L1": 32 * 1024, "L2": 512 * 1024, "L3": 16 * 1024 * 1024}
+CACHE_COLORS = {"L1": "#cc00cc", "L2": "#00cc00", "L3": "#ff7700"}
+
+
+def host_cache_sizes():
+    """Data/unified cache sizes of cpu0 from sysfs, falling back to the defaults above."""
+    sizes = dict(DEFAULT_CACHE_BYTES)
+    for index in glob.glob("/sys/devices/system/cpu/cpu0/cache/index*"):
+        try:
+            with open(os.path.join(index, "type")) as f:
+                kind = f.read().strip()
+            with open(os.path.join(index, "level")) as f:
+                level = int(f.read())
+            with open(os.path.join(index, "size")) as f:
+                size = f.read().strip()
+        except OSError:
+            continue
+        if kind == "Instruction":
+            continue
+        units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+        sizes[f"L{level}"] = int(size[:-1]) * units[size[-1]] if size[-1] in units else int(size)
+    return sizes
+
+
+def ratio(num, den):
+    return num / den if num is not None and den else float("nan")
+
+
+def miss_rates(counters):
+    """Per-level miss rates from the harness counters."""
+    c = counters
+    l2_hit = c.get("l2_cache_req_stat.ic_dc_hit_in_l2")
+    l2_miss = c.get("l2_cache_req_stat.ic_dc_miss_in_l2")
+    l3_hit = c.get("ls_dmnd_fills_from_sys.int_cache")
+    dram = c.get("ls_dmnd_fills_from_sys.mem_io_local")
+    return {
+        "L1": ratio(c.get("l1_data_cache_fills_all"), c.get("ls_dc_accesses")),
+        "L2": ratio(l2_miss, (l2_hit or 0) + (l2_miss or 0)),
+        "L3": ratio(dram, (l3_hit or 0) + (dram or 0)),
+    }
+
+
+def collect(results_dir):
+    """Map function -> rows of (N, working-set bytes, GFLOP/s, miss rates), sorted by N."""
+    series = {}
+    for r in load_reports(results_dir):
+        if r["func"] is None:
+            continue
+        working_set = 3 * r["n"] * r["n"] * 8
+        series.setdefault(r["func"], []).append((r["n"], working_set, gflops(r), miss_rates(r["counters"])))
+    return {func: sorted(rows, key=lambda row: row[0]) for func, rows in series.items()}
+
+
+def find_cliff(rows):
+    """The step between consecutive sizes with the largest relative GFLOP/s drop."""
+    perf = np.array([row[2] for row in rows])
+    if len(perf) < 2:
+        return None
+    drops = 1 - perf[1:] / perf[:-1]
+    k = int(np.nanargmax(drops))
+    return rows[k][0], rows[k + 1][0], rows[k + 1][1], drops[k]
+
+
+def save_table(series, csv_file):
+    with open(csv_file, "w") as f:
+        f.write("func,n,working_set_bytes,gflops,l1_miss_rate,l2_miss_rate,l3_miss_rate\n")
+        for func, rows in sorted(series.items()):
+            for n, ws, perf, rates in rows:
+                f.write(f"{func},{n},{ws},{perf:.4f},{rates['L1']:.4f},{rates['L2']:.4f},{rates['L3']:.4f}\n")
+    print(f"Size sweep table saved to {csv_file}")
+
+
+def print_cliffs(series, caches):
+    print("Largest performance drop per loop order:")
+    for func, rows in sorted(series.items()):
+        cliff = find_cliff(rows)
+        if cliff is None:
+            continue
+        n0, n1, ws, drop = cliff
+        crossed = [level for level, size in caches.items() if 3 * n0 * n0 * 8 <= size < ws]
+        where = f"working set crosses {', '.join(crossed)}" if crossed else "no cache boundary crossed"
+        print(f"  {func:18s} N={n0} -> N={n1}: -{drop * 100:.0f}% GFLOP/s ({ws / 1024:.0f} KiB, {where})")
+
+
+def plot_sweep(series, caches, plot_file):
+    fig, axes = plt.subplots(2, 2, figsize=(16, 11))
+    ax_perf = axes[0, 0]
+    miss_axes = {"L1": axes[0, 1], "L2": axes[1, 0], "L3": axes[1, 1]}
+
+    for func, rows in sorted(series.items()):
+        ws = [row[1] for row in rows]
+        label = func.replace("matmul_", "")
+        ax_perf.plot(ws, [row[2] for row in rows], marker="o", label=label)
+        for level, ax in miss_axes.items():
+            ax.plot(ws, [row[3][level] for row in rows], marker="o", label=label)
+
+    ax_perf.set_ylabel("Performance (GFLOPS/sec)")
+    ax_perf.set_title("Performance vs working-set size")
+    for level, ax in miss_axes.items():
+        ax.set_ylabel(f"{level} miss rate")
+        ax.set_title(f"{level} miss rate vs working-set size")
+
+    for ax in [ax_perf] + list(miss_axes.values()):
+        ax.set_xscale("log", base=2)
+        ax.set_xlabel("Working set, 3 x N^2 doubles (bytes)")
+        for level, size in caches.items():
+            ax.axvline(size, color=CACHE_COLORS.get(level, "k"), linestyle="--", linewidth=1.5)
+            ax.annotate(f"{level} {size // 1024} KiB", (size, 1), xycoords=("data", "axes fraction"),
+                        xytext=(3, -12), textcoords="offset points", fontsize=8, color=CACHE_COLORS.get(level, "k"))
+        ax.grid(True, which="both", ls="--", linewidth=0.5, alpha=0.6)
+        ax.legend(fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(plot_file, dpi=200)
+    print(f"Size sweep plot saved to {plot_file}")
+
+
+if __name__ == "__main__":
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "../reports/sizes"
+    series = collect(results_dir)
+    if not series:
+        raise SystemExit(f"No size sweep reports found in {results_dir}")
+    caches = host_cache_sizes()
+    save_table(series, os.path.join(results_dir, "size_sweep_summary.csv"))
+    print_cliffs(series, caches)
+    plot_sweep(series, caches, os.path.join(results_dir, "size_sweep.png"))
@@ -1,3 +1,6 @@
+import argparse
+import os
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
@@ -10,6 +13,11 @@ L3_BW_GBs = 200.0    # Estimated L3 Bandwidth
 L2_BW_GBs = 400.0    # Estimated L2 Bandwidth
 L1_BW_GBs = 900.0    # Estimated L1 Bandwidth
 
+# All-core ceilings for the OpenMP scaling sweep
+NUM_CORES = 8                  # Physical cores on the Ryzen 7 7435HS
+ALL_CORE_PEAK_GFLOPS = 396.8   # 8 cores x 3.1 GHz x 16 DP FLOPs/cycle (2x 256-bit FMA)
+ALL_CORE_DRAM_BW_GBs = DRAM_BW_GBs  # DRAM bandwidth is shared by all cores
+
 # --- 2. MEASURED DATA POINTS (The Performance) ---
 # Organized for easy iteration
 data_points = [
@@ -27,8 +35,33 @@ data_points = [
     {'label': 'k,j,i (T)', 'oi': 0.057, 'perf': 0.114, 'color': 'brown', 'marker': 's'},
 ]
 
+# Colour per loop order, shared by the hardcoded and the measured points
+LOOP_ORDER_COLORS = {'ijk': 'red', 'ikj': 'blue', 'jik': 'green', 'jki': 'purple', 'kij': 'orange', 'kji': 'brown'}
+
+def load_measured_points(results_dir):
+    """
+    Build data_points from a repetition run (see perf_stats.py).
+    Points carry 95% CI half-widths in 'perf_err' and 'oi_err'.
+    """
+    from perf_stats import load_summaries
+
+    points = []
+    for func, metrics in sorted(load_summaries(results_dir).items()):
+        order = func.split('_')[-1]
+        tiled = '_tiled_' in func
+        perf, oi = metrics['gflops'], metrics['oi']
+        if perf is None or oi is None or order not in LOOP_ORDER_COLORS:
+            continue
+        points.append({
+            'label': f"{','.join(order)} ({'T' if tiled else 'S'})",
+            'oi': oi['mean'], 'perf': perf['mean'],
+            'oi_err': oi['ci'], 'perf_err': perf['ci'],
+            'color': LOOP_ORDER_COLORS[order], 'marker': 's' if tiled else 'o',
+        })
+    return points
+
 # --- 3. PLOTTING FUNCTION ---
-def plot_full_roofline():
+def plot_full_roofline(points=data_points, plot_file=None):
     """Generates the comprehensive Roofline Model plot."""
     OI = np.logspace(-2.5, 3, 500) # OI from ~0.003 to 1000
 
@@ -50,11 +83,16 @@ def plot_full_roofline():
 
     # 5. Plot Measured Data Points
 
-    for data in data_points:
-        # Plot the point
-        ax.plot(data['oi'], data['perf'],
-                marker=data['marker'], markersize=10, color=data['color'],
-                linestyle='', markeredgecolor='k', zorder=5)
+    for data in points:
+        # Plot the point, with 95% CI error bars for measured repetitions
+        if 'perf_err' in data:
+            ax.errorbar(data['oi'], data['perf'], xerr=data['oi_err'], yerr=data['perf_err'],
+                        marker=data['marker'], markersize=10, color=data['color'],
+                        linestyle='', markeredgecolor='k', ecolor='k', capsize=3, zorder=5)
+        else:
+            ax.plot(data['oi'], data['perf'],
+                    marker=data['marker'], markersize=10, color=data['color'],
+                    linestyle='', markeredgecolor='k', zorder=5)
 
         # Annotate the point (only label the non-worst performers for clarity)
         if data['perf'] > 0.5 or data['label'] in ['i,j,k (S)', 'k,j,i (S)']:
@@ -104,7 +142,124 @@ def plot_full_roofline():
 
     third_legend = ax.legend(handles=color_legend_handles, loc='upper right', title="Loop Order Pattern", fontsize=10)
 
-    plt.show()
+    if plot_file:
+        plt.savefig(plot_file, dpi=200)
+        print(f"Roofline saved to {plot_file}")
+    else:
+        plt.show()
+
+# --- HIERARCHICAL ROOFLINE ---
+# Each kernel gets one OI per level, plotted against that level's ceiling
+LEVEL_CEILINGS = {'L1': L1_BW_GBs, 'L2': L2_BW_GBs, 'DRAM': DRAM_BW_GBs}
+LEVEL_MARKERS = {'L1': '^', 'L2': 'D', 'DRAM': 'o'}
+LEVEL_COLORS = {'L1': '#cc00cc', 'L2': '#00cc00', 'DRAM': '#00aaff'}
+
+def binding_ceiling(oi_levels):
+    """
+    The level whose roof gives the lowest attainable performance,
+    or 'Compute' when every level's roof is above peak FLOPS.
+    """
+    attainable = {level: min(PEAK_GFLOPS, oi * LEVEL_CEILINGS[level])
+                  for level, oi in oi_levels.items() if np.isfinite(oi)}
+    if not attainable:
+        return None
+    level = min(attainable, key=attainable.get)
+    return 'Compute' if attainable[level] >= PEAK_GFLOPS else level
+
+def load_hierarchical_points(results_dir):
+    """One point per kernel from a report directory, using medians across repetitions."""
+    from perf_reports import func_name, gflops, level_intensities, load_reports
+
+    by_func = {}
+    for report in load_reports(results_dir):
+        by_func.setdefault(func_name(report), []).append(report)
+
+    points = []
+    for func, reports in sorted(by_func.items()):
+        order = func.split('_')[-1]
+        if order not in LOOP_ORDER_COLORS:
+            continue
+        tiled = '_tiled_' in func
+        intensities = [level_intensities(r) for r in reports]
+        oi_levels = {level: float(np.nanmedian([oi[level] for oi in intensities])) for level in LEVEL_CEILINGS}
+        points.append({
+            'label': f"{','.join(order)} ({'T' if tiled else 'S'})",
+            'oi_levels': oi_levels,
+            'perf': float(np.nanmedian([gflops(r) for r in reports])),
+            'bound': binding_ceiling(oi_levels),
+            'color': LOOP_ORDER_COLORS[order], 'marker': 's' if tiled else 'o',
+        })
+    return points
+
+def plot_hierarchical_roofline(points, plot_file=None):
+    """Hierarchical roofline: L1, L2 and DRAM intensities per kernel, connected."""
+    OI = np.logspace(-2.5, 3, 500)
+
+    plt.figure(figsize=(14, 9))
+    ax = plt.gca()
+
+    for level, bw in LEVEL_CEILINGS.items():
+        ax.loglog(OI, np.minimum(PEAK_GFLOPS, OI * bw), label=f'{level} BW ({bw:.0f} GB/s)',
+                  color=LEVEL_COLORS[level], linestyle='--', linewidth=2)
+    ax.axhline(y=PEAK_GFLOPS, color='k', linestyle='-', linewidth=3, label=f'Peak FLOPS ({PEAK_GFLOPS:.1f} GFLOPS)')
+    ceiling_legend_handles = list(ax.lines)
+
+    for data in points:
+        levels = [level for level in LEVEL_CEILINGS if np.isfinite(data['oi_levels'][level])]
+        xs = [data['oi_levels'][level] for level in levels]
+        ax.plot(xs, [data['perf']] * len(xs), color=data['color'], linestyle='-', linewidth=1, zorder=4)
+        for level, x in zip(levels, xs):
+            ax.plot(x, data['perf'], marker=LEVEL_MARKERS[level], markersize=9, color=LEVEL_COLORS[level],
+                    markeredgecolor=data['color'], markeredgewidth=2, linestyle='', zorder=5)
+        if xs and data['bound']:
+            # Label next to the point of the binding level (DRAM-most point for Compute)
+            anchor = data['oi_levels'].get(data['bound'], min(xs))
+            ax.annotate(f"{data['label']}: {data['bound']}-bound", (anchor, data['perf']),
+                        textcoords="offset points", xytext=(5, 5), ha='left', fontsize=8, color=data['color'])
+
+    ax.set_xlabel('Operational Intensity (FLOPs/Byte)', fontsize=14)
+    ax.set_ylabel('Performance (GFLOPS/sec)', fontsize=14)
+    ax.set_title('Hierarchical Roofline Model for MM on AMD Ryzen 7 7435HS', fontsize=16)
+    ax.grid(True, which="both", ls="--", linewidth=0.5, alpha=0.6)
+    ax.set_xlim(5e-3, 1e3)
+    ax.set_ylim(5e-2, 1.5e2)
+
+    level_legend_handles = [
+        Line2D([0], [0], marker=LEVEL_MARKERS[level], color='w', markerfacecolor=LEVEL_COLORS[level],
+               markeredgecolor='k', markersize=9, label=f'OI vs {level} traffic')
+        for level in LEVEL_CEILINGS
+    ]
+    first_legend = ax.legend(handles=level_legend_handles, loc='upper left', title="Intensity Level", fontsize=10)
+    ax.add_artist(first_legend)
+    ax.legend(handles=ceiling_legend_handles, loc='lower right', title="Hardware Ceilings", fontsize=10)
+
+    for data in points:
+        print(f"{data['label']:10s} {data['perf']:8.3f} GFLOP/s  "
+              + "  ".join(f"OI_{level}={data['oi_levels'][level]:.3g}" for level in LEVEL_CEILINGS)
+              + f"  -> {data['bound']}-bound")
+
+    if plot_file:
+        plt.savefig(plot_file, dpi=200)
+        print(f"Hierarchical roofline saved to {plot_file}")
+    else:
+        plt.show()
 
 # Execute the plotting function
-plot_full_roofline()
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roofline plots for the matmul variants")
+    parser.add_argument("results_dir", nargs="?",
+                        help="report directory; without it the hardcoded measurements above are plotted")
+    parser.add_argument("--hierarchical", action="store_true",
+                        help="plot L1/L2/DRAM intensities per kernel and label the binding ceiling")
+    args = parser.parse_args()
+
+    if args.hierarchical:
+        results_dir = args.results_dir or "../reports"
+        plot_hierarchical_roofline(load_hierarchical_points(results_dir),
+                                   plot_file=os.path.join(results_dir, "roofline_hierarchical.png"))
+    elif args.results_dir:
+        # Repetition reports, drawn with error bars
+        plot_full_roofline(load_measured_points(args.results_dir),
+                           plot_file=os.path.join(args.results_dir, "roofline_repeat.png"))
+    else:
+        plot_full_roofline()
\ No newline at end of file
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Unordered vs reordered BFS benchmark, driven from a single Python process.
+
+Each graph is searched by one ./bfs process running all trials (-n), and the
+per-trial times gapbs prints ("Trial Time:") are collected, so process launch
+and graph loading are not part of the measurement. With --wall every trial is
+a separate ./bfs process timed with a monotonic clock instead.
+With --ab the two variants are compared as an A/B experiment instead: short
+./bfs processes of either graph run interleaved in a random order, each
+searching distinct random roots (mapped through the reordering, so both
+graphs search the same vertices) after warm-up trials from other roots that
+are dropped, the process is pinned to an isolated core, and each scale
+reports medians, a paired bootstrap confidence interval of the speedup and
+a Wilcoxon signed-rank test over the per-root pairs.
+Graphs come from the graph cache (graph_cache.py), so they are only generated
+the first time a scale is used. All timings stay in memory; the CSV and plot
+are written once at the end.
+"""
+import argparse
+import random
+import re
+import subprocess
+import time
+
+import numpy as np
+
+import sg_loader
+from graph_cache import GraphCache, graph_spec
+
+BFS = "./bfs"
+# reorder.py ordering the A/B mode compares against the original graph
+AB_ORDERING = "rcm"
+ISOLATED_CPUS = "/sys/devices/system/cpu/isolated"
+
+TRIAL_TIME_RE = re.compile(r"^Trial Time:\s+([0-9.eE+-]+)", re.MULTILINE)
+AVERAGE_TIME_RE = re.compile(r"^Average Time:\s+([0-9.eE+-]+)", re.MULTILINE)
+# Trials shorter than this many ticks of the printed time resolution are
+# quantized too coarsely (over 5% rounding error) to be timed
+MIN_TICKS = 10
+
+
+def run_kernel(args, env=None, cpus=None):
+    """Run a gapbs binary and return its stdout; optionally pinned with taskset."""
+    cmd = list(args)
+    if cpus:
+        cmd = ["taskset", "-c", cpus] + cmd
+    result = subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
+    return result.stdout
+
+
+def run_kernel_perf(args, events, env=None, cpus=None):
+    """Like run_kernel under `perf stat -e events`; returns (stdout, {event: count}).
+    Counters are empty when perf is not available or fails (e.g. denied by
+    perf_event_paranoid); the command is then run without it."""
+    cmd = ["perf", "stat", "-x", ",", "-e", ",".join(events)] + list(args)
+    if cpus:
+        cmd = ["taskset", "-c", cpus] + cmd
+    try:
+        result = subprocess.run(cmd, check=True, capture_output=True, text=True, env=env)
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return run_kernel(args, env=env, cpus=cpus), {}
+    counters = {}
+    for line in result.stderr.splitlines():
+        fields = line.split(",")
+        if len(fields) > 2 and fields[0].isdigit():
+            counters[fields[2]] = int(fields[0])
+    return result.stdout, counters
+
+
+def kernel_counters(cmd, counters, env=None, cpus=None):
+    """
+    Counters of the trials alone, from run_kernel_perf counters of cmd: perf
+    counts the whole process, so the counts of the same command with no
+    trials (-n 0: graph loading and start-up) are subtracted. Events either
+    run did not count are left out.
+    """
+    if not counters:
+        return {}
+    n = cmd.index("-n")
+    _, load = run_kernel_perf(cmd[:n + 1] + ["0"] + cmd[n + 2:], list(counters), env=env, cpus=cpus)
+    return {event: max(count - load[event], 0) for event, count in counters.items() if event in load}
+
+
+def time_tick(value):
+    """Resolution of a time printed in fixed point, e.g. 1e-05 for "0.00012"."""
+    if "e" in value.lower():
+        return 0.0
+    _, _, decimals = value.partition(".")
+    return 10.0 ** -len(decimals)
+
+
+def trial_times(output, min_ticks=MIN_TICKS):
+    """Per-trial times in seconds from gapbs output, NaN for trials shorter than
+    min_ticks ticks of the printed resolution (trial order is kept)."""
+    return [float(t) if float(t) >= min_ticks * time_tick(t) else float("nan")
+            for t in TRIAL_TIME_RE.findall(output)]
+
+
+def time_bfs(graph, runs, source=None, env=None, cpus=None):
+    """Trial times (seconds) of `runs` BFS trials in one process, NaN for trials
+    too short to time. source is a root or a list of roots, one per trial in
+    turn; without one gapbs picks a non-isolated root per trial."""
+    cmd = [BFS, "-f", graph, "-n", str(runs)]
+    if source is not None:
+        cmd += ["-r", ",".join(str(r) for r in np.atleast_1d(source))]
+    times = trial_times(run_kernel(cmd, env=env, cpus=cpus))
+    if len(times) != runs:
+        raise RuntimeError(f"expected {runs} trial times from {BFS} on {graph}, got {len(times)}")
+    return times
+
+
+def time_bfs_wall(graph, runs, num_vertices, seed=None):
+    """Wall time (seconds) of `runs` separate ./bfs processes from random roots.
+    Includes process start and graph loading."""
+    rng = random.Random(seed)
+    times = []
+    for _ in range(runs):
+        cmd = [BFS, "-f", graph, "-n", "1", "-r", str(rng.randrange(num_vertices))]
+        start = time.perf_counter_ns()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter_ns() - start) / 1e9)
+    return times
+
+
+def isolated_cpu():
+    """First CPU isolated from the scheduler (isolcpus=), or None."""
+    try:
+        with open(ISOLATED_CPUS) as f:
+            match = re.match(r"\d+", f.read().strip())
+    except OSError:
+        return None
+    return match.group(0) if match else None
+
+
+def ab_roots(degrees, runs, blocks, warmup, seed=None):
+    """
+    Random non-isolated roots, one row per block: `warmup` warm-up roots, then
+    runs/blocks measured roots. All are distinct unless the graph has fewer
+    non-isolated vertices than that.
+    """
+    rng = np.random.default_rng(seed)
+    per_block = -(-runs // blocks)
+    candidates = np.flatnonzero(degrees > 0)
+    needed = blocks * (warmup + per_block)
+    return rng.choice(candidates, needed, replace=len(candidates) < needed).reshape(blocks, -1)
+
+
+def time_ab(graphs, relabels, roots, warmup, cpus=None, seed=None):
+    """
+    Interleaved trial times (seconds) of each graph. Every graph gets one ./bfs
+    process per row of roots, searching that row's roots renamed by the
+    graph's relabel array (new id of every original vertex, None for the
+    original graph), so all graphs search the same vertices. The processes run
+    in rounds holding one process per graph in a shuffled order, so drift over
+    the experiment hits every graph alike. Warm-up trials are discarded; the
+    returned times are in root order, paired across graphs.
+    """
+    rng = random.Random(seed)
+    order = list(range(len(graphs)))
+    times = [[] for _ in graphs]
+    for row in roots:
+        for k in rng.sample(order, len(order)):
+            sources = row if relabels[k] is None else relabels[k][row]
+            times[k] += time_bfs(graphs[k], len(row), sources, cpus=cpus)[warmup:]
+    return times
+
+
+def relabel_map(graph, ordering):
+    """New id of every vertex of graph under a reorder.py ordering."""
+    import reorder
+    order = reorder.ORDERINGS[ordering](sg_loader.load(graph))
+    new_ids = np.empty(len(order), dtype=np.int64)
+    new_ids[order] = np.arange(len(order))
+    return new_ids
+
+
+def bootstrap_speedup_ci(a, b, resamples=10000, confidence=0.95, seed=None):
+    """Percentile bootstrap interval of median(a) / median(b) for paired samples:
+    every resample draws pair indices and applies them to both arrays."""
+    rng = np.random.default_rng(seed)
+    a, b = np.asarray(a), np.asarray(b)
+    pairs = rng.integers(len(a), size=(resamples, len(a)))
+    ratios = np.median(a[pairs], axis=1) / np.median(b[pairs], axis=1)
+    tail = (1 - confidence) / 2 * 100
+    return tuple(np.percentile(ratios, [tail, 100 - tail]))
+
+
+def ab_sweep(min_scale, max_scale, runs, blocks=20, warmup=1, ordering=AB_ORDERING, cpus=None, cache=None):
+    """
+    Per scale: medians (us), speedup with paired bootstrap CI and Wilcoxon
+    signed-rank p-value; all random choices are seeded with the scale.
+    The reordered graph comes from reorder.py, whose permutation (unlike the
+    converter's -r) can be recomputed to give both graphs the same roots.
+    """
+    from scipy.stats import wilcoxon
+
+    cache = cache or GraphCache()
+    scales = range(min_scale, max_scale + 1)
+    specs = [graph_spec(scale, reorder) for scale in scales for reorder in (False, ordering)]
+    print(f"Preparing unordered and {ordering}-reordered graphs 2^{min_scale}..2^{max_scale} ...")
+    paths = iter(cache.ensure(specs))
+    print(f"Pinned to CPU {cpus}" if cpus else "No isolated CPU found, running unpinned")
+
+    rows = []
+    for scale in scales:
+        unordered, reordered = next(paths), next(paths)
+        print(f"Running interleaved A/B BFS on graphs 2^{scale} ...")
+        roots = ab_roots(sg_loader.load(unordered).out_degrees(), runs, blocks, warmup, seed=scale)
+        t_unordered, t_reordered = time_ab([unordered, reordered], [None, relabel_map(unordered, ordering)],
+                                           roots, warmup, cpus, seed=scale)
+        # Trials within a few ticks of the timer resolution were rejected (NaN), with their pair
+        timed = ~(np.isnan(t_unordered) | np.isnan(t_reordered))
+        t_unordered = np.asarray(t_unordered)[timed]
+        t_reordered = np.asarray(t_reordered)[timed]
+        if len(t_unordered) < 2:
+            print(f"  trials shorter than {MIN_TICKS} timer ticks, skipping")
+            continue
+        med_u, med_r = np.median(t_unordered), np.median(t_reordered)
+        speedup = med_u / med_r
+        ci_low, ci_high = bootstrap_speedup_ci(t_unordered, t_reordered, seed=scale)
+        p_value = wilcoxon(t_unordered, t_reordered).pvalue
+        rows.append({"n_vertices": 2 ** scale, "median_unordered_time": med_u * 1e6,
+                     "median_reordered_time": med_r * 1e6, "speedup": speedup,
+                     "ci_low": ci_low, "ci_high": ci_high, "p_value": p_value,
+                     "samples": len(t_unordered)})
+        print(f"  unordered {med_u * 1e6:.1f} us, reordered {med_r * 1e6:.1f} us, "
+              f"speedup x{speedup:.3f} [{ci_low:.3f}, {ci_high:.3f}], p = {p_value:.3g}")
+    return rows
+
+
+def sweep(min_scale, max_scale, runs, wall=False, cache=None):
+    """Rows of (n_vertices, avg unordered us, avg reordered us) per scale."""
+    cache = cache or GraphCache()
+    scales = range(min_scale, max_scale + 1)
+    specs = [graph_spec(scale, reorder) for scale in scales for reorder in (False, True)]
+    print(f"Preparing unordered and reordered graphs 2^{min_scale}..2^{max_scale} ...")
+    paths = iter(cache.ensure(specs))
+
+    rows = []
+    for scale in scales:
+        n_vertices = 2 ** scale
+        unordered, reordered = next(paths), next(paths)
+        print(f"Running BFS on graphs 2^{scale} ...")
+        if wall:
+            t_unordered = time_bfs_wall(unordered, runs, n_vertices, seed=scale)
+            t_reordered = time_bfs_wall(reordered, runs, n_vertices, seed=scale)
+        else:
+            t_unordered = time_bfs(unordered, runs)
+            t_reordered = time_bfs(reordered, runs)
+
+        if np.isnan(t_unordered).all() or np.isnan(t_reordered).all():
+            print(f"  trials shorter than {MIN_TICKS} timer ticks, skipping")
+            continue
+        # Averages over the trials long enough to time
+        row = (n_vertices, np.nanmean(t_unordered) * 1e6, np.nanmean(t_reordered) * 1e6)
+        print(f"  unordered {row[1]:.1f} us, reordered {row[2]:.1f} us")
+        rows.append(row)
+    return rows
+
+
+def write_csv(rows, csv_file):
+    with open(csv_file, "w") as f:
+        f.write("n_vertices,avg_unordered_time,avg_reordered_time\n")
+        for n_vertices, unordered, reordered in rows:
+            f.write(f"{n_vertices},{unordered:.3f},{reordered:.3f}\n")
+    print(f"Benchmark complete. Results saved in {csv_file}")
+
+
+def write_ab_csv(rows, csv_file):
+    columns = ["n_vertices", "median_unordered_time", "median_reordered_time", "speedup",
+               "ci_low", "ci_high", "p_value", "samples"]
+    with open(csv_file, "w") as f:
+        f.write(",".join(columns) + "\n")
+        for row in rows:
+            f.write(",".join(str(row[c]) for c in columns) + "\n")
+    print(f"A/B benchmark complete. Results saved in {csv_file}")
+
+
+def plot_ab(rows, plot_file, alpha=0.05):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    x = np.array([r["n_vertices"] for r in rows])
+    speedup = np.array([r["speedup"] for r in rows])
+    err = np.array([[r["speedup"] - r["ci_low"], r["ci_high"] - r["speedup"]] for r in rows]).T
+    significant = np.array([r["p_value"] < alpha for r in rows])
+
+    plt.figure(figsize=(10, 6))
+    plt.errorbar(x, speedup, yerr=err, marker='o', capsize=3, label='Median speedup (95% bootstrap CI)')
+    plt.plot(x[significant], speedup[significant], 'r*', markersize=12, label=f'Significant (p < {alpha})')
+    plt.axhline(1.0, color='k', linestyle='--', linewidth=1)
+
+    plt.xlabel("Number of Vertices (log2 scale)")
+    plt.ylabel("Unordered / Reordered median BFS time")
+    plt.title("BFS Reordering Speedup (interleaved A/B)")
+    plt.xscale('log', base=2)
+    plt.grid(True, which="both", ls="--", alpha=0.5)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(plot_file, dpi=300)
+    print(f"Plot saved as {plot_file}")
+
+
+def plot(rows, plot_file):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    n_vertices = [r[0] for r in rows]
+    avg_unordered = [r[1] for r in rows]
+    avg_reordered = [r[2] for r in rows]
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(n_vertices, avg_unordered, marker='o', label='Unordered Graph')
+    plt.plot(n_vertices, avg_reordered, marker='s', label='Reordered Graph')
+
+    plt.xlabel("Number of Vertices (log2 scale)")
+    plt.ylabel("Average BFS Time (µs)")
+    plt.title("BFS Average Runtime vs Graph Size")
+    plt.xscale('log', base=2)
+    plt.grid(True, which="both", ls="--", alpha=0.5)
+    plt.legend()
+
+    max_vertex = n_vertices[-1]
+    plt.annotate(f"{avg_unordered[-1]:.0f} µs", xy=(max_vertex, avg_unordered[-1]),
+                 xytext=(10, 0), textcoords='offset points')
+    plt.annotate(f"{avg_reordered[-1]:.0f} µs", xy=(max_vertex, avg_reordered[-1]),
+                 xytext=(10, -15), textcoords='offset points')
+
+    plt.tight_layout()
+    plt.savefig(plot_file, dpi=300)
+    print(f"Plot saved as {plot_file}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--min-scale", type=int, default=1)
+    parser.add_argument("--max-scale", type=int, default=25)
+    parser.add_argument("--runs", type=int, default=100, help="BFS trials per graph")
+    parser.add_argument("--wall", action="store_true",
+                        help="time one ./bfs process per trial instead of gapbs trial times")
+    parser.add_argument("--ab", action="store_true",
+                        help="interleaved randomized A/B comparison with medians, CIs and a significance test")
+    parser.add_argument("--blocks", type=int, default=20, help="A/B: ./bfs processes per graph")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="A/B: trials from extra roots dropped at the start of each process")
+    parser.add_argument("--ordering", default=AB_ORDERING,
+                        help=f"A/B: reorder.py ordering of the reordered graph (default {AB_ORDERING})")
+    parser.add_argument("--cpus", default=None,
+                        help="A/B: taskset CPU list (default: first isolated CPU, if any)")
+    parser.add_argument("--csv", default=None, help="default bfs_benchmark.csv (bfs_ab.csv with --ab)")
+    parser.add_argument("--plot", default=None,
+                        help="default bfs_runtime_vs_vertices.png (bfs_ab_speedup.png with --ab)")
+    args = parser.parse_args()
+
+    if args.ab:
+        rows = ab_sweep(args.min_scale, args.max_scale, args.runs, args.blocks, args.warmup, args.ordering,
+                        cpus=args.cpus or isolated_cpu())
+        write_ab_csv(rows, args.csv or "bfs_ab.csv")
+        plot_ab(rows, args.plot or "bfs_ab_speedup.png")
+    else:
+        rows = sweep(args.min_scale, args.max_scale, args.runs, wall=args.wall)
+        write_csv(rows, args.csv or "bfs_benchmark.csv")
+        plot(rows, args.plot or "bfs_runtime_vs_vertices.png")
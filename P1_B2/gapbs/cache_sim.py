@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Trace-driven cache simulator for gapbs BFS.
+
+The address stream of src/bfs.cc (direction-optimizing BFS, serial build) is
+generated level by level from a graph's CSR arrays: InitParent, top-down steps
+(queue, offsets, neighbours, parent, queue pushes), bottom-up steps (parent,
+offsets, neighbours, front bitmap words, next bitmap) and the queue/bitmap
+conversions. It is fed through a set-associative, multi-level LRU model sized
+like the Zen 3 caches of our machine (L1d 32 KiB/8-way, L2 512 KiB/8-way,
+L3 16 MiB/16-way, 64-byte lines). Each level sees the misses of the level
+above; hardware prefetchers and the L3 victim policy are not modelled.
+
+The LRU hot loop is vectorized across sets: accesses are grouped by set and
+the k-th access of every set is simulated in the same NumPy step, with the
+cache state carried from chunk to chunk.
+
+    python3 cache_sim.py predict --scale 18 --orderings original rcm gorder
+    python3 cache_sim.py predict some_graph.sg
+    python3 cache_sim.py validate perf_reports
+"""
+import argparse
+import glob
+import os
+import re
+
+import numpy as np
+
+import sg_loader
+from sg_loader import ragged_arange
+
+LINE_BYTES = 64
+ZEN_LEVELS = "L1:32K:8,L2:512K:8,L3:16M:16"
+
+# Arrays of the BFS address space, in layout order
+ARRAYS = ["offsets", "neighbors", "parent", "queue", "front", "next"]
+ARRAY_ALIGN = 2 * 1024 * 1024
+
+# Direction switch parameters of DOBFS
+ALPHA = 15
+BETA = 18
+
+# Addresses generated per chunk before they are fed to the caches
+CHUNK_EDGES = 1 << 22
+
+L2_MISS_EVENT = "l2_cache_req_stat.ic_dc_miss_in_l2"
+
+
+def parse_size(text):
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    return int(text[:-1]) * units[text[-1].upper()] if text[-1].upper() in units else int(text)
+
+
+def parse_levels(text):
+    """'L1:32K:8,L2:512K:8' -> [(name, size bytes, ways), ...]"""
+    levels = []
+    for spec in text.split(","):
+        name, size, ways = spec.split(":")
+        levels.append((name, parse_size(size), int(ways)))
+    return levels
+
+
+class CacheLevel:
+    """One set-associative LRU cache; access() returns which lines missed."""
+
+    def __init__(self, name, size, ways, line=LINE_BYTES):
+        self.name = name
+        self.num_sets = size // (ways * line)
+        self.tags = np.full((self.num_sets, ways), -1, dtype=np.int64)
+        self.stamps = np.zeros((self.num_sets, ways), dtype=np.int64)
+        self.clock = 0
+        self.accesses = 0
+        self.misses = 0
+
+    def access(self, lines):
+        sets = lines % self.num_sets
+        tags = lines // self.num_sets
+
+        # Rank of every access among the accesses to its set
+        by_set = np.argsort(sets, kind="stable")
+        sorted_sets = sets[by_set]
+        starts = np.flatnonzero(np.r_[True, sorted_sets[1:] != sorted_sets[:-1]])
+        counts = np.diff(np.r_[starts, len(lines)])
+        rank = np.arange(len(lines)) - np.repeat(starts, counts)
+        # Step k simulates the k-th access of every set at once; sets in a step are distinct
+        order = by_set[np.argsort(rank, kind="stable")]
+        step_sizes = np.bincount(rank) if len(rank) else []
+
+        miss = np.empty(len(lines), dtype=bool)
+        pos = 0
+        for size in step_sizes:
+            idx = order[pos:pos + size]
+            pos += size
+            s, t = sets[idx], tags[idx]
+            match = self.tags[s] == t[:, None]
+            hit = match.any(axis=1)
+            way = np.where(hit, match.argmax(axis=1), self.stamps[s].argmin(axis=1))
+            self.clock += 1
+            self.tags[s, way] = t
+            self.stamps[s, way] = self.clock
+            miss[idx] = ~hit
+
+        self.accesses += len(lines)
+        self.misses += int(miss.sum())
+        return miss
+
+
+class Hierarchy:
+    """Cache levels in order; each level is accessed with the misses of the previous one."""
+
+    def __init__(self, levels, layout):
+        self.levels = [CacheLevel(*lvl) for lvl in levels]
+        self.layout = layout
+        self.array_misses = {lvl.name: np.zeros(len(ARRAYS), dtype=np.int64) for lvl in self.levels}
+        self.repeats = 0
+        self._last = -1
+
+    def feed(self, addresses):
+        lines = addresses >> 6
+        # Back-to-back accesses to one line hit in L1 without changing LRU state
+        keep = np.empty(len(lines), dtype=bool)
+        keep[0] = lines[0] != self._last
+        keep[1:] = lines[1:] != lines[:-1]
+        self._last = lines[-1]
+        self.repeats += len(lines) - int(keep.sum())
+        lines = lines[keep]
+        for level in self.levels:
+            if not len(lines):
+                break
+            lines = lines[level.access(lines)]
+            self.array_misses[level.name] += np.bincount(self.layout.array_of(lines), minlength=len(ARRAYS))
+
+    def report(self):
+        rows = {}
+        for i, level in enumerate(self.levels):
+            accesses = level.accesses + (self.repeats if i == 0 else 0)
+            rows[level.name] = {"accesses": accesses, "misses": level.misses,
+                                "by_array": dict(zip(ARRAYS, self.array_misses[level.name].tolist()))}
+        return rows
+
+
+class Layout:
+    """Base addresses of the BFS arrays, each aligned like a large allocation."""
+
+    def __init__(self, g):
+        n, m = g.num_nodes, g.num_edges_directed
+        entry = 8 if g.weighted else 4
+        sizes = {"offsets": (n + 1) * 8, "neighbors": m * entry, "parent": n * 4, "queue": n * 4,
+                 "front": (n + 63) // 64 * 8, "next": (n + 63) // 64 * 8}
+        self.entry = entry
+        self.base = {}
+        addr = ARRAY_ALIGN
+        for name in ARRAYS:
+            self.base[name] = addr
+            addr += -(-sizes[name] // ARRAY_ALIGN) * ARRAY_ALIGN + ARRAY_ALIGN
+        self._line_bases = np.array([self.base[a] >> 6 for a in ARRAYS])
+
+    def offsets(self, u):
+        return self.base["offsets"] + 8 * np.asarray(u, dtype=np.int64)
+
+    def neighbors(self, e):
+        return self.base["neighbors"] + self.entry * np.asarray(e, dtype=np.int64)
+
+    def parent(self, v):
+        return self.base["parent"] + 4 * np.asarray(v, dtype=np.int64)
+
+    def queue(self, i):
+        return self.base["queue"] + 4 * np.asarray(i, dtype=np.int64)
+
+    def bitmap(self, name, v):
+        return self.base[name] + 8 * (np.asarray(v, dtype=np.int64) >> 6)
+
+    def array_of(self, lines):
+        return np.searchsorted(self._line_bases, lines, side="right") - 1
+
+
+def interleave(head, edge, counts, tail):
+    """
+    Per-row access sequences: head[r] columns, then edge columns for each of
+    the row's counts[r] edges (edges grouped by row), then tail[r] columns.
+    """
+    rows, h = head.shape
+    k, t = edge.shape[1], tail.shape[1]
+    length = h + k * counts + t
+    start = np.cumsum(length) - length
+    out = np.empty(int(length.sum()), dtype=np.int64)
+    out[(start[:, None] + np.arange(h)).ravel()] = head.ravel()
+    if len(edge):
+        local = np.arange(len(edge)) - np.repeat(np.cumsum(counts) - counts, counts)
+        pos = np.repeat(start + h, counts) + k * local
+        out[(pos[:, None] + np.arange(k)).ravel()] = edge.ravel()
+    out[((start + h + k * counts)[:, None] + np.arange(t)).ravel()] = tail.ravel()
+    return out
+
+
+def frontier_chunks(vertices, deg, chunk_edges):
+    cuts = np.searchsorted(np.cumsum(deg[vertices]), np.arange(chunk_edges, deg[vertices].sum(), chunk_edges))
+    return np.split(vertices, cuts)
+
+
+def bfs_address_stream(g, source, layout, chunk_edges=CHUNK_EDGES):
+    """Yield arrays of byte addresses touched by DOBFS(g, source), in program order.
+    The generator's return value is the BFS parent array."""
+    n = g.num_nodes
+    deg = g.out_degrees()
+    offsets, neighbors = g.offsets, g.neighbors
+    everyone = np.arange(n, dtype=np.int64)
+
+    # InitParent: offsets and parent swept once
+    for part in np.array_split(everyone, max(1, n // chunk_edges)):
+        yield np.column_stack((layout.offsets(part), layout.offsets(part + 1), layout.parent(part))).ravel()
+    parent = np.where(deg > 0, -deg, -1).astype(np.int64)
+    parent[source] = source
+
+    frontier = np.array([source], dtype=np.int64)
+    queue_pos = 1
+    edges_to_check = g.num_edges_directed
+    scout_count = int(deg[source])
+    while len(frontier):
+        if scout_count > edges_to_check / ALPHA:
+            # QueueToBitmap
+            front = np.zeros(n, dtype=bool)
+            front[frontier] = True
+            q = queue_pos - len(frontier) + np.arange(len(frontier))
+            yield np.column_stack((layout.queue(q), layout.bitmap("front", frontier))).ravel()
+            awake = len(frontier)
+            while True:
+                old_awake = awake
+                # next.reset()
+                yield layout.bitmap("next", np.arange(0, n, 64))
+                found_all = []
+                for u0, u1, e0, e1 in g.vertex_chunks(chunk_edges):
+                    u = everyone[u0:u1]
+                    todo = parent[u] < 0
+                    scan = todo & (deg[u] > 0)
+                    # First neighbour of each scanned vertex that is in the frontier
+                    sv = u[scan]
+                    idx = ragged_arange(offsets[sv], deg[sv])
+                    in_front = front[neighbors[idx]]
+                    local = np.arange(len(idx)) - np.repeat(np.cumsum(deg[sv]) - deg[sv], deg[sv])
+                    first = np.full(len(sv), -1, dtype=np.int64)
+                    hits = np.flatnonzero(in_front)
+                    hit_rows = np.repeat(np.arange(len(sv)), deg[sv])[hits]
+                    first_hit, at = np.unique(hit_rows, return_index=True)
+                    first[first_hit] = local[hits[at]]
+                    scanned = np.where(first >= 0, first + 1, deg[sv])
+                    keep = local < np.repeat(scanned, deg[sv])
+                    e_idx = idx[keep]
+                    v = neighbors[e_idx]
+
+                    counts = np.zeros(len(u), dtype=np.int64)
+                    counts[scan] = scanned
+                    p_addr = layout.parent(u)
+                    off = np.where(todo, layout.offsets(u), p_addr)
+                    off1 = np.where(todo, layout.offsets(u + 1), p_addr)
+                    found = np.zeros(len(u), dtype=bool)
+                    found[np.flatnonzero(scan)[first >= 0]] = True
+                    last = np.where(todo, off1, p_addr)
+                    if len(e_idx):
+                        last_edge = layout.bitmap("front", v)[np.cumsum(counts)[counts > 0] - 1]
+                        last[counts > 0] = last_edge
+                    tail = np.column_stack((np.where(found, p_addr, last),
+                                            np.where(found, layout.bitmap("next", u), last)))
+                    edge = np.column_stack((layout.neighbors(e_idx), layout.bitmap("front", v)))
+                    yield interleave(np.column_stack((p_addr, off, off1)), edge, counts, tail)
+
+                    parent[u[found]] = neighbors[offsets[u[found]] + first[first >= 0]]
+                    found_all.append(u[found])
+                awake_vertices = np.concatenate(found_all) if found_all else np.empty(0, dtype=np.int64)
+                awake = len(awake_vertices)
+                front = np.zeros(n, dtype=bool)
+                front[awake_vertices] = True
+                if not (awake >= old_awake or awake > n / BETA):
+                    break
+            # BitmapToQueue: scan the bitmap, push the set vertices
+            yield layout.bitmap("front", np.arange(0, n, 64))
+            frontier = awake_vertices
+            yield layout.queue(queue_pos + np.arange(len(frontier)))
+            queue_pos += len(frontier)
+            scout_count = 1
+        else:
+            edges_to_check -= scout_count
+            scout_count = 0
+            discovered = []
+            start = queue_pos - len(frontier)
+            for part in frontier_chunks(frontier, deg, chunk_edges):
+                q = start + np.arange(len(part))
+                start += len(part)
+                e_idx = ragged_arange(offsets[part], deg[part])
+                v = neighbors[e_idx].astype(np.int64)
+                src = np.repeat(part, deg[part])
+                # The first edge reaching each unvisited v claims it
+                cand = np.flatnonzero(parent[v] < 0)
+                _, at = np.unique(v[cand], return_index=True)
+                claim = np.sort(cand[at])
+                new = v[claim]
+                scout_count += int(-parent[new].sum())
+                parent[new] = src[claim]
+
+                p_addr = layout.parent(v)
+                third = p_addr.copy()
+                third[claim] = layout.queue(queue_pos + np.arange(len(new)))
+                queue_pos += len(new)
+                head = np.column_stack((layout.queue(q), layout.offsets(part), layout.offsets(part + 1)))
+                edge = np.column_stack((layout.neighbors(e_idx), p_addr, third))
+                yield interleave(head, edge, deg[part], np.empty((len(part), 0), dtype=np.int64))
+                discovered.append(new)
+            frontier = np.concatenate(discovered) if discovered else np.empty(0, dtype=np.int64)
+    return parent
+
+
+def simulate_bfs(g, source=None, levels=ZEN_LEVELS, chunk_edges=CHUNK_EDGES):
+    """Predicted accesses and misses per cache level for one BFS from source."""
+    if source is None:
+        source = int(np.argmax(g.out_degrees()))
+    layout = Layout(g)
+    caches = Hierarchy(parse_levels(levels), layout)
+    for addresses in bfs_address_stream(g, source, layout, chunk_edges):
+        if len(addresses):
+            caches.feed(addresses)
+    return caches.report()
+
+
+def print_prediction(label, report):
+    print(label)
+    for name, row in report.items():
+        rate = row["misses"] / row["accesses"] if row["accesses"] else 0.0
+        top = sorted(row["by_array"].items(), key=lambda kv: -kv[1])[:3]
+        print(f"  {name}: {row['accesses']:>13,d} accesses {row['misses']:>12,d} misses ({rate:6.2%})  "
+              + ", ".join(f"{a} {c:,d}" for a, c in top if c))
+
+
+def measured_captures(reports_dir):
+    """(scale, source, measured L2 misses) from reproduce_perf_counters.sh BFS captures."""
+    captures = []
+    for path in sorted(glob.glob(os.path.join(reports_dir, "bfs_g*.txt"))):
+        with open(path) as f:
+            text = f.read()
+        scale = re.search(r"bfs_g(\d+)\.txt$", path)
+        source = re.search(r"^Source:\s+(\d+)", text, re.MULTILINE)
+        misses = re.search(rf"^\s*([\d,]+)\s+(?:cpu/)?{re.escape(L2_MISS_EVENT)}", text, re.MULTILINE)
+        if scale and misses:
+            captures.append((int(scale.group(1)), int(source.group(1)) if source else None,
+                             int(misses.group(1).replace(",", ""))))
+    return captures
+
+
+if __name__ == "__main__":
+    from graph_cache import GraphCache, graph_spec
+
+    parser = argparse.ArgumentParser(description="Trace-driven cache simulation of gapbs BFS")
+    parser.add_argument("--levels", default=ZEN_LEVELS, help="name:size:ways,... (default Zen 3)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    predict = sub.add_parser("predict", help="predict misses for graph files or cached orderings")
+    predict.add_argument("graphs", nargs="*")
+    predict.add_argument("--scale", type=int)
+    predict.add_argument("--orderings", nargs="+", default=["original"],
+                         help="original, converter or a reorder.py ordering")
+    predict.add_argument("--source", type=int, help="BFS root (default: highest-degree vertex)")
+
+    validate = sub.add_parser("validate", help=f"compare predictions with measured {L2_MISS_EVENT}")
+    validate.add_argument("reports_dir", nargs="?", default="perf_reports")
+    args = parser.parse_args()
+
+    if args.command == "predict":
+        graphs = [(p, p) for p in args.graphs]
+        if args.scale is not None:
+            reorders = [{"original": False, "converter": True}.get(o, o) for o in args.orderings]
+            paths = GraphCache().ensure([graph_spec(args.scale, r) for r in reorders])
+            graphs += [(f"scale {args.scale} {o}", p) for o, p in zip(args.orderings, paths)]
+        if not graphs:
+            parser.error("give graph files or --scale")
+        for label, path in graphs:
+            print_prediction(label, simulate_bfs(sg_loader.load(path), args.source, args.levels))
+    else:
+        captures = measured_captures(args.reports_dir)
+        if not captures:
+            raise SystemExit(f"No BFS captures with {L2_MISS_EVENT} in {args.reports_dir}")
+        cache = GraphCache()
+        print(f"{'scale':>5s} {'source':>9s} {'measured L2':>14s} {'predicted L2':>14s} "
+              f"{'+ load':>14s} {'ratio':>6s}")
+        for scale, source, measured in captures:
+            path = cache.get(scale)
+            g = sg_loader.load(path)
+            predicted = simulate_bfs(g, source, args.levels)["L2"]["misses"]
+            # The capture also counts reading the graph: every byte of the file streams through once
+            with_load = predicted + os.path.getsize(path) // LINE_BYTES
+            print(f"{scale:5d} {source if source is not None else '-':>9} {measured:14,d} {predicted:14,d} "
+                  f"{with_load:14,d} {with_load / measured:6.2f}")
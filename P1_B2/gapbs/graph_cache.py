@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of converter-generated graphs.
+
+A graph is identified by everything that determines its bytes: generator
+(-g kron / -u uniform), scale, degree, the generator seed (kRandSeed in
+src/util.h), the weighted and reorder flags, and a hash of the converter
+binary. The sha256 of that description names the file in the cache, so a
+graph is built once and reused by every script that asks for it.
+
+Missing graphs are built in parallel, limited by an estimate of each
+converter's peak memory. When the cache grows past its disk quota the
+least recently used graphs are deleted.
+
+    python3 graph_cache.py build --scales 10-25 --reorder both -j 4
+    python3 graph_cache.py path --scale 22 --weighted
+    python3 graph_cache.py list
+"""
+import argparse
+import fcntl
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+CONVERTER = "./converter"
+CACHE_DIR = os.environ.get("GAPBS_GRAPH_CACHE", "graph_cache")
+DISK_QUOTA_GB = float(os.environ.get("GAPBS_GRAPH_CACHE_QUOTA_GB", 64))
+
+# Seed the generator is compiled with (kRandSeed in src/util.h)
+GENERATOR_SEED = 27491095
+DEFAULT_DEGREE = 16
+
+# Rough peak converter memory per generated edge: edge list plus the CSR built
+# from it, and a second copy of the neighbours when relabelling
+BUILD_BYTES_PER_EDGE = 24
+WEIGHTED_BYTES_PER_EDGE = 16
+REORDER_BYTES_PER_EDGE = 24
+
+_converter_hash = {}
+_index_lock = threading.Lock()
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def converter_hash(converter=CONVERTER):
+    """sha256 of the converter binary, recomputed only when it changes."""
+    st = os.stat(converter)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _converter_hash.get(converter)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, file_hash(converter))
+        _converter_hash[converter] = cached
+    return cached[1]
+
+
+def reorder_code_hash():
+    """sha256 of the Python reordering engine, so its graphs are rebuilt when it changes."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    return hashlib.sha256("".join(file_hash(os.path.join(here, f))
+                                  for f in ("reorder.py", "sg_loader.py")).encode()).hexdigest()
+
+
+def graph_spec(scale, reorder=False, weighted=False, generator="kron", degree=DEFAULT_DEGREE):
+    """
+    reorder is False, True (the converter's -r) or the name of an ordering of
+    reorder.py, applied to the unordered graph.
+    """
+    if generator not in ("kron", "uniform"):
+        raise ValueError(f"unknown generator {generator!r}")
+    if not isinstance(reorder, str):
+        reorder = bool(reorder)
+    return {"generator": generator, "scale": int(scale), "degree": int(degree),
+            "seed": GENERATOR_SEED, "weighted": bool(weighted), "reorder": reorder}
+
+
+def base_spec(spec):
+    """The unordered graph a reorder.py ordering is computed from."""
+    return dict(spec, reorder=False)
+
+
+def cache_key(spec, converter=CONVERTER):
+    desc = dict(spec, converter=converter_hash(converter))
+    if isinstance(spec["reorder"], str):
+        desc["reorder_code"] = reorder_code_hash()
+    return hashlib.sha256(json.dumps(desc, sort_keys=True).encode()).hexdigest()
+
+
+def estimate_build_bytes(spec):
+    edges = spec["degree"] * 2 ** spec["scale"]
+    per_edge = BUILD_BYTES_PER_EDGE
+    if spec["weighted"]:
+        per_edge += WEIGHTED_BYTES_PER_EDGE
+    if spec["reorder"]:
+        per_edge += REORDER_BYTES_PER_EDGE
+    return edges * per_edge
+
+
+def available_memory_bytes():
+    """MemAvailable from /proc/meminfo, or 4 GiB if it cannot be read."""
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 4 * 1024 ** 3
+
+
+def converter_args(spec, path):
+    flag = "-g" if spec["generator"] == "kron" else "-u"
+    cmd = [CONVERTER, flag, str(spec["scale"]), "-k", str(spec["degree"]), "-b", path]
+    if spec["weighted"]:
+        cmd.append("-w")
+    if spec["reorder"]:
+        cmd.append("-r")
+    return cmd
+
+
+class GraphCache:
+    """Graph files under `cache_dir`, indexed by index.json (key -> spec, size, last use)."""
+
+    def __init__(self, cache_dir=CACHE_DIR, quota_bytes=DISK_QUOTA_GB * 1024 ** 3, converter=CONVERTER):
+        self.cache_dir = cache_dir
+        self.quota_bytes = quota_bytes
+        self.converter = converter
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_file = os.path.join(cache_dir, "index.json")
+
+    @contextmanager
+    def _index(self):
+        """Read-modify-write the index, locked against other threads and processes."""
+        with _index_lock, open(os.path.join(self.cache_dir, ".lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.index_file) as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = {}
+            yield index
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+            with os.fdopen(fd, "w") as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmp, self.index_file)
+
+    def path_for(self, spec):
+        ext = ".wsg" if spec["weighted"] else ".sg"
+        return os.path.join(self.cache_dir, cache_key(spec, self.converter) + ext)
+
+    def lookup(self, spec):
+        """Path of a cached graph, marking it as used, or None if it is not cached."""
+        path = self.path_for(spec)
+        key = os.path.basename(path).split(".")[0]
+        with self._index() as index:
+            if key not in index or not os.path.exists(path):
+                index.pop(key, None)
+                return None
+            index[key]["last_used"] = time.time()
+        return path
+
+    def _build(self, spec):
+        path = self.path_for(spec)
+        tmp = path + ".tmp" + os.path.splitext(path)[1]
+        try:
+            if isinstance(spec["reorder"], str):
+                import reorder
+                reorder.reorder_file(self.path_for(base_spec(spec)), tmp, spec["reorder"])
+            else:
+                subprocess.run(converter_args(spec, tmp), check=True, stdout=subprocess.DEVNULL)
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        key = os.path.basename(path).split(".")[0]
+        with self._index() as index:
+            index[key] = {"spec": spec, "size": os.path.getsize(path), "last_used": time.time()}
+        return path
+
+    def ensure(self, specs, jobs=os.cpu_count(), memory_budget=None, evict=True):
+        """
+        Paths of all requested graphs, building the missing ones.
+        Builds run concurrently while their estimated peak memory fits the
+        budget (half of the available memory by default); a build that alone
+        exceeds the budget still runs, but by itself.
+        """
+        if memory_budget is None:
+            memory_budget = available_memory_bytes() // 2
+        # reorder.py orderings start from the unordered graph, so build those first
+        bases = [base_spec(s) for s in specs if isinstance(s["reorder"], str)]
+        base_paths = self.ensure(bases, jobs, memory_budget, evict=False) if bases else []
+        paths = {}
+        missing = []
+        for spec in specs:
+            key = cache_key(spec, self.converter)
+            if key in paths or spec in missing:
+                continue
+            path = self.lookup(spec)
+            if path is None:
+                missing.append(spec)
+            else:
+                paths[key] = path
+
+        # Largest first, so the big builds do not end up running alone at the end
+        pending = sorted(missing, key=estimate_build_bytes, reverse=True)
+        running = {}
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            while pending or running:
+                in_use = sum(running.values())
+                for spec in list(pending):
+                    need = estimate_build_bytes(spec)
+                    if len(running) >= jobs or (running and in_use + need > memory_budget):
+                        continue
+                    order = {True: " reordered", False: ""}.get(spec["reorder"], f" {spec['reorder']}-ordered")
+                    print(f"[graph_cache] building {spec['generator']} scale {spec['scale']}"
+                          f"{' weighted' if spec['weighted'] else ''}{order}",
+                          file=sys.stderr)
+                    running[pool.submit(self._build, spec)] = need
+                    pending.remove(spec)
+                    in_use += need
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    path = future.result()
+                    paths[os.path.basename(path).split(".")[0]] = path
+
+        if evict:
+            self.evict(keep=set(paths.values()) | set(base_paths))
+        return [paths[cache_key(spec, self.converter)] for spec in specs]
+
+    def get(self, scale, reorder=False, weighted=False, generator="kron", degree=DEFAULT_DEGREE):
+        return self.ensure([graph_spec(scale, reorder, weighted, generator, degree)])[0]
+
+    def evict(self, keep=()):
+        """Delete least recently used graphs until the cache fits its quota."""
+        keep = {os.path.basename(p).split(".")[0] for p in keep}
+        with self._index() as index:
+            total = sum(entry["size"] for entry in index.values())
+            for key, entry in sorted(index.items(), key=lambda kv: kv[1]["last_used"]):
+                if total <= self.quota_bytes:
+                    break
+                if key in keep:
+                    continue
+                ext = ".wsg" if entry["spec"]["weighted"] else ".sg"
+                try:
+                    os.remove(os.path.join(self.cache_dir, key + ext))
+                except FileNotFoundError:
+                    pass
+                total -= entry["size"]
+                del index[key]
+                print(f"[graph_cache] evicted scale {entry['spec']['scale']} ({entry['size'] / 1e9:.2f} GB)",
+                      file=sys.stderr)
+
+    def entries(self):
+        with self._index() as index:
+            return dict(index)
+
+
+def parse_scales(text):
+    """'10-25' or '10,12,14' -> list of scales."""
+    scales = []
+    for part in text.split(","):
+        lo, _, hi = part.partition("-")
+        scales.extend(range(int(lo), int(hi or lo) + 1))
+    return scales
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cache of converter-generated graphs")
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--quota-gb", type=float, default=DISK_QUOTA_GB)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="build all missing graphs of a sweep")
+    build.add_argument("--scales", default="1-25")
+    build.add_argument("--reorder", choices=["no", "yes", "both"], default="no")
+    build.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    build.add_argument("--memory-gb", type=float, help="memory budget for concurrent builds")
+
+    path = sub.add_parser("path", help="print the path of one graph, building it if needed")
+    path.add_argument("--scale", type=int, required=True)
+    path.add_argument("--reorder", nargs="?", const=True, default=False,
+                      help="converter -r, or the name of a reorder.py ordering")
+
+    for p in (build, path):
+        p.add_argument("--weighted", action="store_true")
+        p.add_argument("--uniform", action="store_true", help="uniform random instead of Kronecker")
+        p.add_argument("-k", "--degree", type=int, default=DEFAULT_DEGREE)
+
+    sub.add_parser("list", help="show cached graphs, least recently used first")
+    args = parser.parse_args()
+
+    cache = GraphCache(args.cache_dir, args.quota_gb * 1024 ** 3)
+    if args.command == "list":
+        for key, e in sorted(cache.entries().items(), key=lambda kv: kv[1]["last_used"]):
+            s = e["spec"]
+            print(f"{key[:12]} {s['generator']:7s} scale={s['scale']:2d} k={s['degree']} "
+                  f"weighted={s['weighted']!s:5s} reorder={s['reorder']!s:5s} {e['size'] / 1e6:10.1f} MB "
+                  f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(e['last_used']))}")
+    else:
+        generator = "uniform" if args.uniform else "kron"
+        if args.command == "path":
+            print(cache.get(args.scale, args.reorder, args.weighted, generator, args.degree))
+        else:
+            reorders = {"no": [False], "yes": [True], "both": [False, True]}[args.reorder]
+            specs = [graph_spec(s, r, args.weighted, generator, args.degree)
+                     for s in parse_scales(args.scales) for r in reorders]
+            budget = int(args.memory_gb * 1024 ** 3) if args.memory_gb else None
+            for p in cache.ensure(specs, jobs=args.jobs, memory_budget=budget):
+                print(p)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Graph500-style multi-root TEPS for the peak TEPS harness.
+
+Every scale's graph is loaded once by a single `./bfs -n ROOTS -A` process,
+which searches from ROOTS sampled non-isolated roots and prints, per trial,
+its time, root and BFS tree size (-A analyses every trial). Per root the
+traversed edges are the input edges inside the searched component
+(the tree's degree sum, halved for undirected graphs), as Graph500 counts
+them. Per scale we report the harmonic mean of TEPS, the right mean for a
+rate over fixed work, with its standard error and the TEPS quartiles.
+
+    python3 peak_teps.py --start 10 --end 22 --roots 64
+"""
+import argparse
+import re
+
+import numpy as np
+
+from bfs_benchmark import BFS, MIN_TICKS, run_kernel, time_tick
+from graph_cache import GraphCache
+
+GRAPH500_ROOTS = 64
+
+TRIAL_RE = re.compile(
+    r"^Trial Time:\s+([0-9.eE+-]+)\s*\n"
+    r"Root:\s+(-?\d+)\s*\n"
+    r"BFS Tree has (\d+) nodes and (\d+) edges", re.MULTILINE)
+GRAPH_RE = re.compile(r"Graph has (\d+) nodes and (\d+) (un)?directed edges")
+
+
+def run_roots(graph, roots):
+    """Per-root (root, seconds, traversed edges) from one ./bfs process."""
+    output = run_kernel([BFS, "-f", graph, "-n", str(roots), "-A"])
+    undirected = GRAPH_RE.search(output).group(3) is not None
+    trials = []
+    for seconds, root, _, degree_sum in TRIAL_RE.findall(output):
+        edges = int(degree_sum) // 2 if undirected else int(degree_sum)
+        # Trials within a few ticks of the printed resolution cannot give a rate
+        seconds = float(seconds) if float(seconds) >= MIN_TICKS * time_tick(seconds) else float("nan")
+        trials.append((int(root), seconds, edges))
+    if len(trials) != roots:
+        raise RuntimeError(f"expected {roots} trials from {BFS} on {graph}, got {len(trials)}")
+    return trials
+
+
+def teps_statistics(trials):
+    """Graph500 statistics of the per-root TEPS."""
+    teps = np.array([edges / seconds for _, seconds, edges in trials if seconds > 0])
+    n = len(teps)
+    if n == 0:
+        return None
+    hmean = n / np.sum(1.0 / teps)
+    # Standard error of the harmonic mean (Graph500 reference code)
+    hstderr = (np.std(1.0 / teps, ddof=1) / np.sqrt(n - 1)) * hmean ** 2 if n > 1 else float("nan")
+    q = np.percentile(teps, [0, 25, 50, 75, 100])
+    return {"roots": n, "hmean": hmean, "hstderr": hstderr, "min": q[0], "q1": q[1],
+            "median": q[2], "q3": q[3], "max": q[4]}
+
+
+def sweep(scales, roots, cache=None):
+    cache = cache or GraphCache()
+    per_root, summary = [], []
+    for scale in scales:
+        print(f"Running {roots} BFS roots on graph 2^{scale} ...")
+        trials = run_roots(cache.get(scale), roots)
+        per_root += [(scale, root, seconds, edges) for root, seconds, edges in trials]
+        stats = teps_statistics(trials)
+        if stats is None:
+            print(f"  every trial was shorter than {MIN_TICKS} timer ticks, skipping")
+            continue
+        summary.append(dict(stats, scale=scale, num_vertices=2 ** scale))
+        print(f"  harmonic mean {stats['hmean']:.4g} TEPS (+/- {stats['hstderr']:.2g}), "
+              f"quartiles {stats['q1']:.4g} / {stats['median']:.4g} / {stats['q3']:.4g}")
+    return per_root, summary
+
+
+def save(per_root, summary, roots_csv, summary_csv):
+    with open(roots_csv, "w") as f:
+        f.write("g_value,root,time,traversed_edges,teps\n")
+        for scale, root, seconds, edges in per_root:
+            teps = edges / seconds if seconds > 0 else ""
+            seconds = seconds if seconds > 0 else ""
+            f.write(f"{scale},{root},{seconds},{edges},{teps}\n")
+    columns = ["scale", "num_vertices", "roots", "hmean", "hstderr", "min", "q1", "median", "q3", "max"]
+    with open(summary_csv, "w") as f:
+        f.write(",".join(columns) + "\n")
+        for row in summary:
+            f.write(",".join(str(row[c]) for c in columns) + "\n")
+    print(f"Per-root results saved to {roots_csv}, summary to {summary_csv}")
+
+
+def plot(summary, plot_file):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    x = [r["num_vertices"] for r in summary]
+    plt.figure(figsize=(10, 6))
+    plt.fill_between(x, [r["q1"] for r in summary], [r["q3"] for r in summary],
+                     alpha=0.3, label='TEPS interquartile range')
+    plt.plot(x, [r["min"] for r in summary], linestyle=':', color='gray', label='min / max')
+    plt.plot(x, [r["max"] for r in summary], linestyle=':', color='gray')
+    plt.errorbar(x, [r["hmean"] for r in summary], yerr=[r["hstderr"] for r in summary],
+                 marker='o', linestyle='-', capsize=3, label='Harmonic mean TEPS')
+
+    plt.xscale('log', base=10)
+    plt.yscale('log', base=10)
+    plt.title('BFS Performance Scaling (multi-root)', fontsize=16)
+    plt.xlabel('Number of Nodes (Log Scale)', fontsize=12)
+    plt.ylabel('Traversed Edges Per Second (TEPS) (Log Scale)', fontsize=12)
+    plt.grid(True, which="both", linestyle='--', linewidth=0.5)
+    plt.legend()
+    plt.savefig(plot_file)
+    print(f"Successfully generated plot and saved to {plot_file}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Graph500-style multi-root BFS TEPS")
+    parser.add_argument("--start", type=int, default=2)
+    parser.add_argument("--end", type=int, default=25)
+    parser.add_argument("--roots", type=int, default=GRAPH500_ROOTS)
+    parser.add_argument("--roots-csv", default="bfs_teps_roots.csv")
+    parser.add_argument("--summary-csv", default="bfs_teps_summary.csv")
+    parser.add_argument("--plot", default="bfs_performance_graph.png")
+    args = parser.parse_args()
+
+    per_root, summary = sweep(range(args.start, args.end + 1), args.roots)
+    save(per_root, summary, args.roots_csv, args.summary_csv)
+    if summary:
+        plot(summary, args.plot)
+        peak = max(summary, key=lambda r: r["hmean"])
+        print(f"Peak harmonic-mean TEPS: {peak['hmean']:.4g} at scale {peak['scale']} "
+              f"(use as: python viz_roofline.py --teps-roof {peak['hmean']:.4g})")
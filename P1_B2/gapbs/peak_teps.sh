@@ -19,6 +19,14 @@ END_G=25
 DATA_FILE="bfs_performance_data.csv"
 PLOT_FILE="bfs_performance_graph.png"
 
+# Graph500-style mode: ROOTS=64 ./peak_teps.sh searches each graph from 64
+# sampled roots and reports harmonic-mean TEPS with quartiles (peak_teps.py)
+ROOTS=${ROOTS:-1}
+if [ "$ROOTS" -gt 1 ]; then
+    python3 peak_teps.py --start "$START_G" --end "$END_G" --roots "$ROOTS" --plot "$PLOT_FILE"
+    exit $?
+fi
+
 
 # --- Dependency Installation ---
 echo "Checking and installing dependencies (pandas, matplotlib)..."
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Graph reordering engine working directly on the CSR arrays of .sg files.
+
+Orderings (each returns `order`, with order[new_id] = old_id):
+    degree       all vertices by decreasing degree (what gapbs RelabelByDegree does)
+    hub_sort     hubs (degree > average) by decreasing degree, then the rest in original order
+    hub_cluster  hubs then the rest, both in original order
+    rcm          reverse Cuthill-McKee (scipy.sparse.csgraph)
+    bfs          breadth-first order from the highest-degree vertex of every component
+    gorder       Gorder-style greedy: the next vertex is the one sharing most
+                 neighbours/edges with the last `window` placed vertices
+
+The relabelled graph is written back as an .sg (or .wsg) that every gapbs
+kernel can read. `compare` times BFS on the original graph, the converter's
+own -r ordering and every engine ordering, scale by scale:
+
+    python3 reorder.py apply in.sg out.sg --ordering rcm
+    python3 reorder.py compare --scales 16-20 --runs 20 --perf
+"""
+import argparse
+from collections import deque
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, reverse_cuthill_mckee
+
+import sg_loader
+from sg_loader import ragged_arange
+
+GORDER_WINDOW = 5
+# Gorder: common neighbours reached through vertices of higher degree are ignored
+GORDER_HUB_DEGREE = 64
+
+L2_MISS_EVENT = "l2_cache_req_stat.ic_dc_miss_in_l2"
+
+
+def adjacency_matrix(g):
+    data = np.ones(g.num_edges_directed, dtype=np.int8)
+    return csr_matrix((data, np.ascontiguousarray(g.neighbors), np.ascontiguousarray(g.offsets)),
+                      shape=(g.num_nodes, g.num_nodes))
+
+
+def degree_order(g):
+    return np.argsort(-g.out_degrees(), kind="stable")
+
+
+def hub_sort_order(g):
+    deg = g.out_degrees()
+    hubs = np.flatnonzero(deg > deg.mean())
+    hubs = hubs[np.argsort(-deg[hubs], kind="stable")]
+    return np.concatenate((hubs, np.flatnonzero(deg <= deg.mean())))
+
+
+def hub_cluster_order(g):
+    deg = g.out_degrees()
+    return np.concatenate((np.flatnonzero(deg > deg.mean()), np.flatnonzero(deg <= deg.mean())))
+
+
+def rcm_order(g):
+    return reverse_cuthill_mckee(adjacency_matrix(g), symmetric_mode=True).astype(np.int64)
+
+
+def bfs_order(g, chunk_edges=sg_loader.CHUNK_EDGES):
+    """
+    Level-synchronous BFS from the highest-degree vertex of every connected
+    component at once, largest component first. Keeping the first discovery
+    of each vertex in frontier order gives the same order as a queue-based BFS.
+    """
+    n = g.num_nodes
+    deg = g.out_degrees()
+    num_comp, labels = connected_components(adjacency_matrix(g), directed=False)
+    by_comp = np.lexsort((-deg, labels))
+    first = np.ones(n, dtype=bool)
+    first[1:] = labels[by_comp][1:] != labels[by_comp][:-1]
+    roots = by_comp[first]
+    sizes = np.bincount(labels)
+    roots = roots[np.argsort(-sizes[labels[roots]], kind="stable")]
+    comp_rank = np.empty(num_comp, dtype=np.int64)
+    comp_rank[labels[roots]] = np.arange(num_comp)
+
+    visited = np.zeros(n, dtype=bool)
+    level = np.zeros(n, dtype=np.int64)
+    discovered = np.zeros(n, dtype=np.int64)
+    visited[roots] = True
+    discovered[roots] = np.arange(len(roots))
+    seq = len(roots)
+    frontier, depth = roots, 0
+    while len(frontier):
+        depth += 1
+        found = []
+        # Expand the frontier in pieces of about chunk_edges edges, in order
+        cuts = np.searchsorted(np.cumsum(deg[frontier]), np.arange(chunk_edges, deg[frontier].sum(), chunk_edges))
+        for part in np.split(frontier, cuts):
+            nb = g.neighbors[ragged_arange(g.offsets[part], deg[part])]
+            nb = nb[~visited[nb]]
+            uniq, first_pos = np.unique(nb, return_index=True)
+            new = uniq[np.argsort(first_pos)]
+            visited[new] = True
+            found.append(new)
+        frontier = np.concatenate(found) if found else np.empty(0, dtype=np.int64)
+        level[frontier] = depth
+        discovered[frontier] = seq + np.arange(len(frontier))
+        seq += len(frontier)
+    return np.lexsort((discovered, level, comp_rank[labels]))
+
+
+def gorder_order(g, window=GORDER_WINDOW, hub_degree=GORDER_HUB_DEGREE):
+    """
+    Greedy Gorder (Wei et al.): place next the unplaced vertex v maximising
+    sum over the last `window` placed u of (common neighbours of u and v) +
+    (edge between u and v). Every placed vertex contributes its neighbours and
+    its neighbours' neighbours (through non-hub vertices) as candidates; the
+    score of a candidate is how often it appears in the window's lists.
+    Isolated vertices are appended at the end. One Python step per vertex,
+    so this is the slowest ordering.
+    """
+    n = g.num_nodes
+    deg = g.out_degrees()
+    placed = np.zeros(n, dtype=bool)
+    connected = np.flatnonzero(deg > 0)
+    seeds = connected[np.argsort(-deg[connected], kind="stable")]
+    seed_ptr = 0
+    order = np.empty(n, dtype=np.int64)
+    recent = deque(maxlen=window)
+
+    for i in range(len(connected)):
+        v = -1
+        if recent:
+            cand = np.concatenate(recent)
+            cand = cand[~placed[cand]]
+            if len(cand):
+                uniq, counts = np.unique(cand, return_counts=True)
+                v = uniq[np.argmax(counts)]
+        if v < 0:
+            while placed[seeds[seed_ptr]]:
+                seed_ptr += 1
+            v = seeds[seed_ptr]
+        placed[v] = True
+        order[i] = v
+
+        nb = g.out_neigh(v)
+        via = nb[deg[nb] <= hub_degree]
+        siblings = g.neighbors[ragged_arange(g.offsets[via], deg[via])]
+        recent.append(np.concatenate((nb, siblings)))
+
+    order[len(connected):] = np.flatnonzero(deg == 0)
+    return order
+
+
+ORDERINGS = {
+    "degree": degree_order,
+    "hub_sort": hub_sort_order,
+    "hub_cluster": hub_cluster_order,
+    "rcm": rcm_order,
+    "bfs": bfs_order,
+    "gorder": gorder_order,
+}
+
+
+def relabel(g, order, path):
+    """Write g with vertex order[i] renamed to i, neighbour lists sorted, to path."""
+    if g.directed:
+        raise ValueError("Cannot relabel directed graph")
+    n = g.num_nodes
+    if len(order) != n or np.bincount(order, minlength=n).max(initial=0) > 1:
+        raise ValueError("order is not a permutation of the vertices")
+    new_ids = np.empty(n, dtype=np.int64)
+    new_ids[order] = np.arange(n)
+    deg = g.out_degrees()[order]
+
+    out = sg_loader.create(path, n, g.num_edges_directed, g.weighted)
+    out.offsets[0] = 0
+    out.offsets[1:] = np.cumsum(deg)
+    for u0, u1, e0, e1 in out.vertex_chunks():
+        idx = ragged_arange(g.offsets[order[u0:u1]], deg[u0:u1])
+        rows = np.repeat(np.arange(u0, u1, dtype=np.int64), deg[u0:u1])
+        # Sort every neighbour list by sorting (row, new neighbour id) keys
+        keys = rows * n + new_ids[g.neighbors[idx]]
+        if g.weighted:
+            perm = np.argsort(keys, kind="stable")
+            out.neighbors[e0:e1] = keys[perm] - rows * n
+            out.weights[e0:e1] = g.weights[idx][perm]
+        else:
+            keys.sort()
+            out.neighbors[e0:e1] = keys - rows * n
+    out.flush()
+    return out
+
+
+def reorder_file(src, dst, ordering):
+    g = sg_loader.load(src)
+    order = ORDERINGS[ordering](g)
+    relabel(g, order, dst)
+    return dst
+
+
+def perf_counter(graph, runs, event=L2_MISS_EVENT):
+    """Count of `event` over `runs` BFS trials, graph loading excluded, or None
+    when perf is unavailable."""
+    from bfs_benchmark import BFS, kernel_counters, run_kernel_perf
+    cmd = [BFS, "-f", graph, "-n", str(runs)]
+    _, counters = run_kernel_perf(cmd, [event])
+    return kernel_counters(cmd, counters).get(event)
+
+
+def compare(scales, orderings, runs, use_perf=False, cache=None):
+    """Per scale and ordering: mean BFS time, speedup over the original, locality and L2 misses of the trials."""
+    from bfs_benchmark import time_bfs
+    from graph_cache import GraphCache, graph_spec
+
+    cache = cache or GraphCache()
+    variants = ["original", "converter"] + list(orderings)
+    rows = []
+    for scale in scales:
+        specs = [graph_spec(scale, False), graph_spec(scale, True)] + [graph_spec(scale, o) for o in orderings]
+        print(f"Preparing {len(specs)} orderings of graph 2^{scale} ...")
+        paths = cache.ensure(specs)
+        base_time = None
+        for name, path in zip(variants, paths):
+            avg_us = np.nanmean(time_bfs(path, runs)) * 1e6
+            base_time = base_time or avg_us
+            metrics = sg_loader.locality_metrics(sg_loader.load(path))
+            l2 = perf_counter(path, runs) if use_perf else None
+            rows.append({"scale": scale, "ordering": name, "avg_time_us": avg_us,
+                         "speedup": base_time / avg_us, "trial_l2_misses": l2,
+                         "avg_neighbor_gap": metrics["avg_neighbor_gap"],
+                         "bandwidth": metrics["bandwidth"]})
+            print(f"  {name:12s} {avg_us:12.1f} us  x{base_time / avg_us:5.2f}  "
+                  f"gap {metrics['avg_neighbor_gap']:10.1f}" + (f"  trial L2 misses {l2}" if l2 is not None else ""))
+    return rows
+
+
+def save_comparison(rows, csv_file, plot_file):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    columns = ["scale", "ordering", "avg_time_us", "speedup", "trial_l2_misses", "avg_neighbor_gap", "bandwidth"]
+    with open(csv_file, "w") as f:
+        f.write(",".join(columns) + "\n")
+        for r in rows:
+            f.write(",".join("" if r[c] is None else str(r[c]) for c in columns) + "\n")
+    print(f"Comparison saved to {csv_file}")
+
+    plt.figure(figsize=(10, 6))
+    for name in dict.fromkeys(r["ordering"] for r in rows):
+        pts = [(2 ** r["scale"], r["speedup"]) for r in rows if r["ordering"] == name]
+        plt.plot(*zip(*pts), marker="o", label=name)
+    plt.xscale("log", base=2)
+    plt.xlabel("Number of Vertices (log2 scale)")
+    plt.ylabel("BFS speedup over original order")
+    plt.title("BFS speedup per vertex ordering")
+    plt.grid(True, which="both", ls="--", alpha=0.5)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(plot_file, dpi=300)
+    print(f"Plot saved as {plot_file}")
+
+
+if __name__ == "__main__":
+    from graph_cache import parse_scales
+
+    parser = argparse.ArgumentParser(description="Graph reordering engine for gapbs .sg files")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    apply = sub.add_parser("apply", help="reorder one graph file")
+    apply.add_argument("src")
+    apply.add_argument("dst")
+    apply.add_argument("--ordering", choices=sorted(ORDERINGS), required=True)
+
+    cmp = sub.add_parser("compare", help="BFS time of every ordering, per scale")
+    cmp.add_argument("--scales", default="10-20")
+    cmp.add_argument("--orderings", nargs="+", choices=sorted(ORDERINGS), default=list(ORDERINGS))
+    cmp.add_argument("--runs", type=int, default=20)
+    cmp.add_argument("--perf", action="store_true", help=f"also count {L2_MISS_EVENT} of the trials with perf stat")
+    cmp.add_argument("--csv", default="reorder_comparison.csv")
+    cmp.add_argument("--plot", default="reorder_speedup.png")
+    args = parser.parse_args()
+
+    if args.command == "apply":
+        print(f"Wrote {reorder_file(args.src, args.dst, args.ordering)}")
+    else:
+        rows = compare(parse_scales(args.scales), args.orderings, args.runs, use_perf=args.perf)
+        save_comparison(rows, args.csv, args.plot)
@@ -1,17 +1,20 @@
 #!/bin/bash
 set -e
 
-GRAPH_FILE="25.sg"
+# 1. Kernels and graph scales to capture, e.g. SCALES="20 22" ./reproduce_perf_counters.sh
+KERNELS=${KERNELS:-"bfs pr pr_spmv cc cc_sv sssp bc tc"}
+SCALES=${SCALES:-"16 20 25"}
+RESULTS_DIR=${RESULTS_DIR:-./perf_reports}
 
-# 1. Generate graph
-echo "[INFO] Generating graph ${GRAPH_FILE}..."
-./converter -g 25 -b $GRAPH_FILE
+mkdir -p "$RESULTS_DIR"
 
 # 2. Define counters dictionary
 declare -A COUNTERS
 COUNTERS["L1_I_misses"]="L1-icache-load-misses l1-icache-load-misses icache.misses cpu/L1-icache-load-misses/"
+COUNTERS["L1_D_accesses"]="ls_dc_accesses L1-dcache-loads l1-dcache-loads"
 COUNTERS["L1_D_misses"]="l1_data_cache_fills_all cpu/l1_data_cache_fills_all/ ls_dc_accesses"
 COUNTERS["L2_misses"]="l2_cache_req_stat.ic_dc_miss_in_l2 cpu/l2_cache_req_stat.ic_dc_miss_in_l2/ l2_dcache_load_misses l2-dcache-load-misses"
+COUNTERS["L2_hits"]="l2_cache_req_stat.ic_dc_hit_in_l2 cpu/l2_cache_req_stat.ic_dc_hit_in_l2/ l2_dcache_load_hits"
 COUNTERS["L3_misses"]="ls_dmnd_fills_from_sys.mem_io_local ls_dmnd_fills_from_sys.int_cache LLC-load-misses llc-load-misses"
 COUNTERS["D_TLB_misses"]="l1_dtlb_misses cpu/l1_dtlb_misses/ ls_l1_d_tlb_miss.all"
 COUNTERS["Branch_mispred"]="branch-misses branch_misses cpu/branch-misses/"
@@ -32,10 +35,22 @@ done
 # Join events with commas
 EVENTS=$(IFS=, ; echo "${SELECTED_EVENTS[*]}")
 
-# 4. Run perf with selected counters
-echo "[INFO] Running perf stat on BFS..."
-perf stat -e $EVENTS ./bfs -f $GRAPH_FILE -n 1 -l
+# 4. For every scale, generate the graphs once and run perf on every kernel.
+# Kernel output (graph size, Average Time) and perf counters share one report,
+# ${RESULTS_DIR}/<kernel>_g<scale>.txt, read by vizualization_script/viz_roofline.py
+# Graphs come from the graph cache (graph_cache.py) and are kept for later runs.
+for SCALE in $SCALES; do
+    echo "[INFO] Preparing graphs for scale ${SCALE}..."
+    GRAPH_FILE=$(python3 graph_cache.py path --scale $SCALE)
+    WGRAPH_FILE=$(python3 graph_cache.py path --scale $SCALE --weighted)
 
-# 5. Cleanup
-echo "[INFO] Removing generated graph ${GRAPH_FILE}..."
-rm -f $GRAPH_FILE
+    for KERNEL in $KERNELS; do
+        # sssp needs edge weights
+        INPUT=$GRAPH_FILE
+        [ "$KERNEL" == "sssp" ] && INPUT=$WGRAPH_FILE
+        REPORT="${RESULTS_DIR}/${KERNEL}_g${SCALE}.txt"
+        echo "[INFO] Running perf stat on ${KERNEL} (scale ${SCALE})..."
+        perf stat -e $EVENTS ./$KERNEL -f $INPUT -n 1 -l > "$REPORT" 2>&1
+        echo "[INFO] Saved ${REPORT}"
+    done
+done
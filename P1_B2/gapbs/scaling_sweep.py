@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Thread-count and affinity scaling sweep for the OpenMP gapbs kernels.
+
+Every kernel (built with `make omp`) runs on a cached graph for each thread
+count under each binding policy:
+
+    close-cores     OMP_PROC_BIND=close,  OMP_PLACES=cores    (one thread per core, SMT off)
+    spread-cores    OMP_PROC_BIND=spread, OMP_PLACES=cores
+    close-threads   OMP_PROC_BIND=close,  OMP_PLACES=threads  (SMT siblings filled first)
+    spread-threads  OMP_PROC_BIND=spread, OMP_PLACES=threads
+
+Policies placing one thread per core are skipped above the physical core
+count. Per run we keep the median trial time, TEPS (graph edges / time) and,
+with --perf, the DRAM fills of the trials (a second process running no
+trials measures the fills of graph loading, which are subtracted), from
+which the kernel's achieved DRAM bandwidth follows.
+Scaling is flagged as ended at the first thread count whose extra threads
+add less than SATURATION_EFFICIENCY of a thread each; with --perf the
+bandwidth reached there is reported, showing whether memory saturated.
+
+    make omp
+    python3 scaling_sweep.py --kernels bfs pr cc sssp --scale 22 --perf
+"""
+import argparse
+import os
+import re
+import subprocess
+
+import numpy as np
+
+from bfs_benchmark import kernel_counters, run_kernel, run_kernel_perf, trial_times
+from graph_cache import GraphCache
+
+POLICIES = {
+    "close-cores": {"OMP_PROC_BIND": "close", "OMP_PLACES": "cores"},
+    "spread-cores": {"OMP_PROC_BIND": "spread", "OMP_PLACES": "cores"},
+    "close-threads": {"OMP_PROC_BIND": "close", "OMP_PLACES": "threads"},
+    "spread-threads": {"OMP_PROC_BIND": "spread", "OMP_PLACES": "threads"},
+}
+WEIGHTED_KERNELS = {"sssp"}
+
+# DRAM traffic: demand fills from local memory, one cache line each
+DRAM_EVENT = "ls_dmnd_fills_from_sys.mem_io_local"
+CACHE_LINE_BYTES = 64
+
+# Extra threads adding less than this fraction of a thread's worth of speedup end scaling
+SATURATION_EFFICIENCY = 0.25
+
+GRAPH_RE = re.compile(r"Graph has (\d+) nodes and (\d+) (?:un)?directed edges")
+
+
+def physical_cores():
+    try:
+        out = subprocess.run(["lscpu", "-p=CORE,SOCKET"], capture_output=True, text=True, check=True).stdout
+        return len({line for line in out.splitlines() if not line.startswith("#")})
+    except (OSError, subprocess.CalledProcessError):
+        return os.cpu_count()
+
+
+def default_threads():
+    cpus = os.cpu_count()
+    counts = [1 << i for i in range(cpus.bit_length()) if 1 << i <= cpus]
+    return sorted(set(counts + [physical_cores(), cpus]))
+
+
+def run_config(kernel, graph, threads, policy, trials, use_perf=False):
+    env = dict(os.environ, OMP_NUM_THREADS=str(threads), **POLICIES[policy])
+    cmd = [f"./{kernel}_omp", "-f", graph, "-n", str(trials)]
+    if use_perf:
+        output, counters = run_kernel_perf(cmd, [DRAM_EVENT], env=env)
+        counters = kernel_counters(cmd, counters, env=env)
+    else:
+        output, counters = run_kernel(cmd, env=env), {}
+    times = trial_times(output)
+    edges = int(GRAPH_RE.search(output).group(2))
+    t = float(np.nanmedian(times))
+    dram = counters.get(DRAM_EVENT)
+    return {
+        "kernel": kernel, "policy": policy, "threads": threads, "median_time": t,
+        "teps": edges / t if t > 0 else float("nan"),
+        "dram_gbs": dram * CACHE_LINE_BYTES / (t * len(times)) / 1e9 if dram is not None and t > 0 else None,
+    }
+
+
+def add_speedups(rows):
+    """Speedup and parallel efficiency against each (kernel, policy)'s fewest-thread run
+    (scaled as if it were perfectly parallel when the sweep does not start at 1 thread)."""
+    for key in {(r["kernel"], r["policy"]) for r in rows}:
+        series = sorted((r for r in rows if (r["kernel"], r["policy"]) == key), key=lambda r: r["threads"])
+        base = series[0]["median_time"] * series[0]["threads"]
+        for r in series:
+            r["speedup"] = base / r["median_time"] if r["median_time"] > 0 else float("nan")
+            r["efficiency"] = r["speedup"] / r["threads"]
+    return rows
+
+
+def find_saturation(series):
+    """First run (in thread order) whose added threads each add < SATURATION_EFFICIENCY speedup."""
+    for prev, cur in zip(series, series[1:]):
+        gain = (cur["speedup"] - prev["speedup"]) / (cur["threads"] - prev["threads"])
+        if gain < SATURATION_EFFICIENCY:
+            return cur
+    return None
+
+
+def sweep(kernels, scale, threads, policies, trials, use_perf=False, cache=None):
+    cache = cache or GraphCache()
+    cores = physical_cores()
+    rows = []
+    for kernel in kernels:
+        graph = cache.get(scale, weighted=kernel in WEIGHTED_KERNELS)
+        for policy in policies:
+            for t in threads:
+                if POLICIES[policy]["OMP_PLACES"] == "cores" and t > cores:
+                    continue
+                row = run_config(kernel, graph, t, policy, trials, use_perf)
+                print(f"{kernel:5s} {policy:15s} {t:3d} threads: {row['median_time']:.5f} s, "
+                      f"{row['teps']:.4g} TEPS" + (f", {row['dram_gbs']:.2f} GB/s" if row["dram_gbs"] else ""))
+                rows.append(row)
+    return add_speedups(rows)
+
+
+def save(rows, csv_file):
+    columns = ["kernel", "policy", "threads", "median_time", "teps", "speedup", "efficiency", "dram_gbs"]
+    with open(csv_file, "w") as f:
+        f.write(",".join(columns) + "\n")
+        for r in sorted(rows, key=lambda r: (r["kernel"], r["policy"], r["threads"])):
+            f.write(",".join("" if r[c] is None else str(r[c]) for c in columns) + "\n")
+    print(f"Scaling results saved to {csv_file}")
+
+
+def report_saturation(rows):
+    print("\nWhere scaling ends:")
+    for kernel, policy in sorted({(r["kernel"], r["policy"]) for r in rows}):
+        series = sorted((r for r in rows if (r["kernel"], r["policy"]) == (kernel, policy)),
+                        key=lambda r: r["threads"])
+        sat = find_saturation(series)
+        best = max(series, key=lambda r: r["speedup"])
+        if sat is None:
+            print(f"  {kernel:5s} {policy:15s} still scaling at {series[-1]['threads']} threads "
+                  f"(x{series[-1]['speedup']:.2f})")
+            continue
+        bw = f", DRAM {sat['dram_gbs']:.2f} GB/s (peak seen {max(r['dram_gbs'] or 0 for r in series):.2f})" \
+            if sat["dram_gbs"] else ""
+        print(f"  {kernel:5s} {policy:15s} flattens at {sat['threads']} threads "
+              f"(x{sat['speedup']:.2f}, best x{best['speedup']:.2f} at {best['threads']}){bw}")
+
+
+def plot(rows, plot_file):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    kernels = sorted({r["kernel"] for r in rows})
+    fig, axes = plt.subplots(2, len(kernels), figsize=(5 * len(kernels), 9), squeeze=False)
+    for col, kernel in enumerate(kernels):
+        ax_s, ax_e = axes[0, col], axes[1, col]
+        for policy in POLICIES:
+            series = sorted((r for r in rows if r["kernel"] == kernel and r["policy"] == policy),
+                            key=lambda r: r["threads"])
+            if not series:
+                continue
+            t = [r["threads"] for r in series]
+            line, = ax_s.plot(t, [r["speedup"] for r in series], marker="o", label=policy)
+            ax_e.plot(t, [r["efficiency"] for r in series], marker="o", color=line.get_color(), label=policy)
+            sat = find_saturation(series)
+            if sat:
+                ax_s.plot(sat["threads"], sat["speedup"], "x", markersize=12, mew=2, color=line.get_color())
+        max_t = max(r["threads"] for r in rows)
+        ax_s.plot([1, max_t], [1, max_t], "k--", linewidth=1, label="ideal")
+        ax_s.set_title(f"{kernel}: speedup (x = scaling ends)")
+        ax_e.set_title(f"{kernel}: parallel efficiency")
+        ax_e.set_ylim(0, 1.1)
+        for ax in (ax_s, ax_e):
+            ax.set_xlabel("Threads")
+            ax.grid(True, ls="--", alpha=0.5)
+            ax.legend(fontsize=8)
+    fig.tight_layout()
+    fig.savefig(plot_file, dpi=200)
+    print(f"Plot saved as {plot_file}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenMP thread/affinity scaling sweep of gapbs kernels")
+    parser.add_argument("--kernels", nargs="+", default=["bfs", "pr", "cc", "sssp"])
+    parser.add_argument("--scale", type=int, default=20)
+    parser.add_argument("--threads", type=int, nargs="+", default=default_threads())
+    parser.add_argument("--policies", nargs="+", choices=list(POLICIES), default=list(POLICIES))
+    parser.add_argument("--trials", type=int, default=8, help="trials per run (median is kept)")
+    parser.add_argument("--perf", action="store_true", help=f"count {DRAM_EVENT} for DRAM bandwidth")
+    parser.add_argument("--csv", default="scaling_sweep.csv")
+    parser.add_argument("--plot", default="scaling_sweep.png")
+    args = parser.parse_args()
+
+    rows = sweep(args.kernels, args.scale, args.threads, args.policies, args.trials, args.perf)
+    save(rows, args.csv)
+    report_saturation(rows)
+    plot(rows, args.plot)
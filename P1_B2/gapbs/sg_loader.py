@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Zero-copy NumPy access to gapbs serialized graphs (.sg / .wsg).
+
+The layout is the one written by WriterBase::WriteSerializedGraph (src/writer.h):
+
+    bool    directed
+    int64   num_edges            (directed edge count, i.e. neighbour entries)
+    int64   num_nodes
+    int64   offsets[num_nodes + 1]
+    int32   neighs[num_edges]    (.wsg: int32 (vertex, weight) pairs)
+    if directed: in-offsets and in-neighs with the same layout
+
+The file is memory-mapped once and every array is a view into the mapping, so
+opening a 2^25-vertex graph costs no reads until the data is touched. Arrays
+start at unaligned byte offsets (the header is 17 bytes); NumPy handles this
+transparently.
+
+    python3 sg_loader.py graph_cache/<key>.sg
+"""
+import sys
+import time
+
+import numpy as np
+
+HEADER_BYTES = 1 + 8 + 8
+OFFSET_DTYPE = np.dtype("<i8")
+NODE_DTYPE = np.dtype("<i4")
+WNODE_DTYPE = np.dtype([("v", "<i4"), ("w", "<i4")])
+
+# Edges processed per step by the chunked metrics, bounding temporary memory
+CHUNK_EDGES = 1 << 24
+
+
+class SerializedGraph:
+    """CSR arrays of a .sg/.wsg file as views of one memory mapping (writable only with mode="r+")."""
+
+    def __init__(self, path, weighted=None, mode="r"):
+        self.path = path
+        self.weighted = path.endswith(".wsg") if weighted is None else weighted
+        self._map = np.memmap(path, dtype=np.uint8, mode=mode)
+        self.directed = bool(self._map[0])
+        self.num_edges_directed, self.num_nodes = (int(x) for x in
+                                                   np.frombuffer(self._map, OFFSET_DTYPE, 2, offset=1))
+
+        pos = HEADER_BYTES
+        self.offsets, self.neighbors, self.weights, pos = self._csr(pos)
+        if self.directed:
+            self.in_offsets, self.in_neighbors, self.in_weights, pos = self._csr(pos)
+        else:
+            self.in_offsets, self.in_neighbors, self.in_weights = self.offsets, self.neighbors, self.weights
+        if pos != len(self._map):
+            raise ValueError(f"{path}: expected {pos} bytes, file has {len(self._map)}")
+
+    def _csr(self, pos):
+        n, m = self.num_nodes, self.num_edges_directed
+        offsets = np.frombuffer(self._map, OFFSET_DTYPE, n + 1, offset=pos)
+        pos += (n + 1) * OFFSET_DTYPE.itemsize
+        if self.weighted:
+            pairs = np.frombuffer(self._map, WNODE_DTYPE, m, offset=pos)
+            neighbors, weights = pairs["v"], pairs["w"]
+            pos += m * WNODE_DTYPE.itemsize
+        else:
+            neighbors = np.frombuffer(self._map, NODE_DTYPE, m, offset=pos)
+            weights = None
+            pos += m * NODE_DTYPE.itemsize
+        return offsets, neighbors, weights, pos
+
+    @property
+    def num_edges(self):
+        """Edge count as gapbs reports it (undirected edges counted once)."""
+        return self.num_edges_directed if self.directed else self.num_edges_directed // 2
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def in_degrees(self):
+        return np.diff(self.in_offsets)
+
+    def out_neigh(self, u):
+        return self.neighbors[self.offsets[u]:self.offsets[u + 1]]
+
+    def vertex_chunks(self, chunk_edges=CHUNK_EDGES):
+        """(u0, u1, e0, e1) ranges of whole vertices covering about chunk_edges edges each."""
+        targets = np.arange(chunk_edges, self.num_edges_directed, chunk_edges)
+        bounds = np.unique(np.concatenate(([0], np.searchsorted(self.offsets, targets), [self.num_nodes])))
+        for u0, u1 in zip(bounds[:-1], bounds[1:]):
+            yield int(u0), int(u1), int(self.offsets[u0]), int(self.offsets[u1])
+
+    def flush(self):
+        self._map.flush()
+
+    def __repr__(self):
+        kind = "directed" if self.directed else "undirected"
+        return f"<SerializedGraph {self.path}: {self.num_nodes} nodes, {self.num_edges} {kind} edges>"
+
+
+def load(path, weighted=None):
+    return SerializedGraph(path, weighted)
+
+
+def create(path, num_nodes, num_edges_directed, weighted=False):
+    """
+    Allocate an undirected .sg/.wsg file of the given size and return it opened
+    for writing; fill offsets, neighbors (and weights) in place, then flush().
+    """
+    entry = WNODE_DTYPE if weighted else NODE_DTYPE
+    size = HEADER_BYTES + (num_nodes + 1) * OFFSET_DTYPE.itemsize + num_edges_directed * entry.itemsize
+    with open(path, "wb") as f:
+        f.write(np.bool_(False).tobytes())
+        f.write(np.array([num_edges_directed, num_nodes], dtype=OFFSET_DTYPE).tobytes())
+        f.truncate(size)
+    return SerializedGraph(path, weighted, mode="r+")
+
+
+def ragged_arange(starts, lengths):
+    """Concatenation of arange(s, s + l) for every (s, l): the edge indices of a set of rows."""
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    ends = np.cumsum(lengths)
+    return np.repeat(starts - (ends - lengths), lengths) + np.arange(ends[-1] if len(ends) else 0)
+
+
+def degree_distribution(g):
+    """(degree, number of vertices with that degree) for every occurring degree."""
+    counts = np.bincount(g.out_degrees())
+    degrees = np.flatnonzero(counts)
+    return degrees, counts[degrees]
+
+
+def degree_summary(g):
+    deg = g.out_degrees()
+    return {
+        "min": int(deg.min()) if len(deg) else 0,
+        "max": int(deg.max()) if len(deg) else 0,
+        "mean": float(deg.mean()) if len(deg) else 0.0,
+        "median": float(np.median(deg)) if len(deg) else 0.0,
+        "isolated": int(np.count_nonzero(deg == 0)),
+    }
+
+
+def avg_neighbor_gap(g, chunk_edges=CHUNK_EDGES):
+    """
+    Mean ID distance between consecutive entries of each neighbour list.
+    Small gaps mean a vertex's neighbours sit close together in memory.
+    """
+    total, count = 0, 0
+    for u0, u1, e0, e1 in g.vertex_chunks(chunk_edges):
+        if e1 - e0 < 2:
+            continue
+        gaps = np.abs(np.diff(g.neighbors[e0:e1].astype(np.int64)))
+        # Drop the differences that straddle two neighbour lists
+        row_starts = g.offsets[u0 + 1:u1] - e0
+        row_starts = row_starts[(row_starts > 0) & (row_starts < e1 - e0)]
+        keep = np.ones(len(gaps), dtype=bool)
+        keep[row_starts - 1] = False
+        total += int(gaps[keep].sum())
+        count += int(keep.sum())
+    return total / count if count else 0.0
+
+
+def locality_metrics(g, chunk_edges=CHUNK_EDGES):
+    """
+    Matrix-ordering metrics of the adjacency structure:
+      bandwidth      max |u - v| over all edges
+      avg_edge_span  mean |u - v|
+      profile        sum over rows of (u - min neighbour), for neighbours below the diagonal
+      avg_neighbor_gap  see avg_neighbor_gap()
+    """
+    bandwidth, span_total, profile = 0, 0, 0
+    for u0, u1, e0, e1 in g.vertex_chunks(chunk_edges):
+        if e1 == e0:
+            continue
+        deg = np.diff(g.offsets[u0:u1 + 1])
+        src = np.repeat(np.arange(u0, u1, dtype=np.int64), deg)
+        dst = g.neighbors[e0:e1].astype(np.int64)
+        span = np.abs(src - dst)
+        bandwidth = max(bandwidth, int(span.max()))
+        span_total += int(span.sum())
+
+        nonempty = deg > 0
+        row_min = np.minimum.reduceat(dst, (g.offsets[u0:u1][nonempty] - e0))
+        rows = np.arange(u0, u1, dtype=np.int64)[nonempty]
+        profile += int(np.maximum(rows - row_min, 0).sum())
+
+    edges = g.num_edges_directed
+    return {
+        "bandwidth": bandwidth,
+        "avg_edge_span": span_total / edges if edges else 0.0,
+        "profile": profile,
+        "avg_neighbor_gap": avg_neighbor_gap(g, chunk_edges),
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        raise SystemExit(f"usage: {sys.argv[0]} graph.sg|graph.wsg ...")
+    for path in sys.argv[1:]:
+        start = time.perf_counter()
+        g = load(path)
+        print(g)
+        print("  degrees:", ", ".join(f"{k}={v:g}" for k, v in degree_summary(g).items()))
+        for name, value in locality_metrics(g).items():
+            print(f"  {name}: {value:g}")
+        print(f"  analysed in {time.perf_counter() - start:.2f} s")
@@ -50,7 +50,15 @@ class SourcePicker {
       : given_source_(given_source), rng_(kRandSeed),
         udist_(g.num_nodes()-1, rng_), g_(g) {}
 
+  // Cycles through given_sources, one per trial (random if empty)
+  SourcePicker(const GraphT_ &g, const std::vector<int64_t> &given_sources)
+      : SourcePicker(g) {
+    given_sources_.assign(given_sources.begin(), given_sources.end());
+  }
+
   NodeID PickNext() {
+    if (!given_sources_.empty())
+      return given_sources_[next_source_++ % given_sources_.size()];
     if (given_source_ != -1)
       return given_source_;
     NodeID source;
@@ -62,6 +70,8 @@ class SourcePicker {
 
  private:
   NodeID given_source_;
+  std::vector<NodeID> given_sources_;
+  size_t next_source_ = 0;
   std::mt19937_64 rng_;
   UniDist<NodeID, std::mt19937_64> udist_;
   const GraphT_ &g_;
@@ -108,9 +118,11 @@ void BenchmarkKernel(const CLApp &cli, const GraphT_ &g,
     trial_timer.Start();
     auto result = kernel(g);
     trial_timer.Stop();
-    PrintTime("Trial Time", trial_timer.Seconds());
+    // ns precision, so short trials are not quantized to 10 us
+    PrintTime("Trial Time", trial_timer.Seconds(), 9);
     total_seconds += trial_timer.Seconds();
-    if (cli.do_analysis() && (iter == (cli.num_trials()-1)))
+    if (cli.do_analysis_all() ||
+        (cli.do_analysis() && (iter == (cli.num_trials()-1))))
       stats(g, result);
     if (cli.do_verify()) {
       trial_timer.Start();
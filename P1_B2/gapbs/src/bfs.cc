@@ -227,12 +227,16 @@ pvector<NodeID> DOBFS(const Graph &g, NodeID source, bool logging_enabled = fals
 void PrintBFSStats(const Graph &g, const pvector<NodeID> &bfs_tree) {
   int64_t tree_size = 0;
   int64_t n_edges = 0;
+  NodeID root = -1;
   for (NodeID n : g.vertices()) {
     if (bfs_tree[n] >= 0) {
       n_edges += g.out_degree(n);
       tree_size++;
     }
+    if (bfs_tree[n] == n)
+      root = n;
   }
+  PrintStep("Root", static_cast<int64_t>(root));
   cout << "BFS Tree has " << tree_size << " nodes and ";
   cout << n_edges << " edges" << endl;
 }
@@ -298,13 +302,13 @@ int main(int argc, char* argv[]) {
     return -1;
   Builder b(cli);
   Graph g = b.MakeGraph();
-  SourcePicker<Graph> sp(g, cli.start_vertex());
+  SourcePicker<Graph> sp(g, cli.start_vertices());
   cout << "Starting BFS" << endl;
   auto BFSBound = [&sp,&cli] (const Graph &g) {
     return DOBFS(g, sp.PickNext(), cli.logging_en());
   };
 
-  SourcePicker<Graph> vsp(g, cli.start_vertex());
+  SourcePicker<Graph> vsp(g, cli.start_vertices());
   auto VerifierBound = [&vsp] (const Graph &g, const pvector<NodeID> &parent) {
     return BFSVerifier(g, vsp.PickNext(), parent);
   };
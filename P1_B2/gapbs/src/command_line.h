@@ -113,26 +113,41 @@ class CLBase {
 
 class CLApp : public CLBase {
   bool do_analysis_ = false;
+  bool do_analysis_all_ = false;
   int num_trials_ = 16;
   int64_t start_vertex_ = -1;
+  std::vector<int64_t> start_vertices_;
   bool do_verify_ = false;
   bool enable_logging_ = false;
 
  public:
   CLApp(int argc, char** argv, std::string name) : CLBase(argc, argv, name) {
-    get_args_ += "an:r:vl";
+    get_args_ += "aAn:r:vl";
     AddHelpLine('a', "", "output analysis of last run", "false");
+    AddHelpLine('A', "", "output analysis of every run", "false");
     AddHelpLine('n', "n", "perform n trials", std::to_string(num_trials_));
-    AddHelpLine('r', "node", "start from node r", "rand");
+    AddHelpLine('r', "node", "start from node r (r1,r2,... cycles per trial)",
+                "rand");
     AddHelpLine('v', "", "verify the output of each run", "false");
     AddHelpLine('l', "", "log performance within each trial", "false");
   }
 
+  void ParseStartVertices(const char* opt_arg) {
+    start_vertices_.clear();
+    char* end;
+    do {
+      start_vertices_.push_back(strtol(opt_arg, &end, 10));
+      opt_arg = end + 1;
+    } while (*end == ',');
+    start_vertex_ = start_vertices_.front();
+  }
+
   void HandleArg(signed char opt, char* opt_arg) override {
     switch (opt) {
       case 'a': do_analysis_ = true;                    break;
+      case 'A': do_analysis_all_ = true;                break;
       case 'n': num_trials_ = atoi(opt_arg);            break;
-      case 'r': start_vertex_ = atol(opt_arg);          break;
+      case 'r': ParseStartVertices(opt_arg);            break;
       case 'v': do_verify_ = true;                      break;
       case 'l': enable_logging_ = true;                 break;
       default: CLBase::HandleArg(opt, opt_arg);
@@ -140,8 +155,10 @@ class CLApp : public CLBase {
   }
 
   bool do_analysis() const { return do_analysis_; }
+  bool do_analysis_all() const { return do_analysis_all_; }
   int num_trials() const { return num_trials_; }
   int64_t start_vertex() const { return start_vertex_; }
+  const std::vector<int64_t>& start_vertices() const { return start_vertices_; }
   bool do_verify() const { return do_verify_; }
   bool logging_en() const { return enable_logging_; }
 };
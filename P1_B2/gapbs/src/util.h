@@ -26,8 +26,8 @@ void PrintLabel(const std::string &label, const std::string &val) {
   printf("%-21s%7s\n", (label + ":").c_str(), val.c_str());
 }
 
-void PrintTime(const std::string &s, double seconds) {
-  printf("%-21s%3.5lf\n", (s + ":").c_str(), seconds);
+void PrintTime(const std::string &s, double seconds, int precision = 5) {
+  printf("%-21s%3.*lf\n", (s + ":").c_str(), precision, seconds);
 }
 
 void PrintStep(const std::string &s, int64_t count) {
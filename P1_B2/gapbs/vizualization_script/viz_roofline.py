@@ -1,89 +1,169 @@
+import argparse
+import glob
+import os
+import re
+
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
-# --- Input Data from perf output ---
-edges = 523609147
-traversal_time = 1.22865  # seconds
 cache_line_size = 64  # bytes
 
-# Performance counters
-ls_dc_accesses = 2063199297           # L1 data cache accesses
-l2_hits = 63798690                   # L2 hits
-l2_misses = 151495204                # L2 misses
-
-# --- Calculations ---
-
-# 1. Operational Intensity (OI) - Edges per Byte from DRAM
-# Based on the user's direction, DRAM traffic is proxied by L2 misses.
-bytes_from_dram = l2_misses * cache_line_size
-operational_intensity = edges / bytes_from_dram
-
-# 2. Performance (TEPS - Traversed Edges Per Second)
-teps = edges / traversal_time
-
-# 3. Achieved Bandwidths (Bytes/Second) calculated from counters
-# These values determine the slopes of the roofs.
-achieved_l1_bw = (ls_dc_accesses * cache_line_size) / traversal_time
-achieved_l2_bw = ((l2_hits + l2_misses) * cache_line_size) / traversal_time
-# Using L2 misses as a proxy for traffic to L3 and DRAM
-achieved_l3_dram_bw = (l2_misses * cache_line_size) / traversal_time
-
-# 4. Peak TEPS roof (given by user)
-teps_roof = 5.2 * 10**8
-
-# --- Plotting ---
-
-# Create a range for Operational Intensity (x-axis)
-oi_range = np.logspace(-3, 2, 200)
-
-# Calculate the performance ceilings for each roof
-l1_roof_perf = achieved_l1_bw * oi_range
-l2_roof_perf = achieved_l2_bw * oi_range
-dram_roof_perf = achieved_l3_dram_bw * oi_range
-
-# Create the plot
-plt.figure(figsize=(12, 8))
-plt.style.use('seaborn-v0_8-whitegrid')
-
-# Plot the memory bandwidth roofs based on ACHIEVED bandwidth
-plt.plot(oi_range, l1_roof_perf, color='green', linestyle=':', label=f'Achieved L1 BW Roof ({achieved_l1_bw/1e9:.2f} GB/s)')
-plt.plot(oi_range, l2_roof_perf, color='orange', linestyle=':', label=f'Achieved L2 BW Roof ({achieved_l2_bw/1e9:.2f} GB/s)')
-plt.plot(oi_range, dram_roof_perf, color='purple', linestyle='-', label=f'Achieved L3/DRAM BW Roof ({achieved_l3_dram_bw/1e9:.2f} GB/s)', lw=2)
-
-# Plot the horizontal TEPS roof
-plt.axhline(y=teps_roof, color='red', linestyle='--', label=f'Peak TEPS Roof ({teps_roof/1e8:.2f} x 10^8 TEPS)')
-
-# Plot the application's performance point
-plt.plot(operational_intensity, teps, 'o', markersize=12, color='blue', label=f'Application Performance')
-
-# Annotate the performance point
-plt.annotate(f'OI: {operational_intensity:.3f}\nTEPS: {teps/1e8:.2f} x 10^8',
-             xy=(operational_intensity, teps),
-             xytext=(operational_intensity * 0.2, teps * 1.5),
-             arrowprops=dict(facecolor='black', shrink=0.05, width=1, headwidth=8),
-             fontsize=10)
-
-# Formatting
-plt.xscale('log')
-plt.yscale('log')
-plt.title('Roofline Model based on Achieved Bandwidths', fontsize=16)
-plt.xlabel('Operational Intensity (Edges / Byte)', fontsize=12)
-plt.ylabel('Performance (TEPS)', fontsize=12)
-plt.grid(True, which="both", ls="--")
-
-# Set plot limits to focus on the relevant area
-plt.xlim(1e-3, 1e2)
-plt.ylim(1e8, 1e9)
-
-plt.legend()
-plt.tight_layout()
-
-# Save the plot
-plt.savefig('roofline_plot_achieved_bw.png')
-
-print("Corrected roofline plot generated and saved as 'roofline_plot_achieved_bw.png'")
-print(f"\nCalculated Operational Intensity: {operational_intensity:.4f} Edges/Byte")
-print(f"Calculated Performance: {teps/1e8:.4f} x 10^8 TEPS")
-print(f"Achieved L1 Bandwidth: {achieved_l1_bw/1e9:.2f} GB/s")
-print(f"Achieved L2 Bandwidth: {achieved_l2_bw/1e9:.2f} GB/s")
-print(f"Achieved L3/DRAM Bandwidth: {achieved_l3_dram_bw/1e9:.2f} GB/s")
+# Peak TEPS roof (given by user), override with --teps-roof
+TEPS_ROOF = 5.2 * 10**8
+
+# Original single BFS capture (scale 25), used when no reports are found
+REFERENCE_CAPTURE = {
+    "kernel": "bfs",
+    "scale": 25,
+    "edges": 523609147,
+    "time": 1.22865,
+    "ls_dc_accesses": 2063199297,
+    "l2_hits": 63798690,
+    "l2_misses": 151495204,
+}
+
+# Candidate perf event names for each counter, as picked by reproduce_perf_counters.sh
+EVENT_NAMES = {
+    "ls_dc_accesses": ["ls_dc_accesses", "L1-dcache-loads", "l1-dcache-loads"],
+    "l2_hits": ["l2_cache_req_stat.ic_dc_hit_in_l2", "l2_dcache_load_hits"],
+    "l2_misses": ["l2_cache_req_stat.ic_dc_miss_in_l2", "l2_dcache_load_misses", "l2-dcache-load-misses"],
+}
+
+REPORT_NAME_RE = re.compile(r"^(\w+?)_g(\d+)\.txt$")
+EDGES_RE = re.compile(r"Graph has (\d+) nodes and (\d+) (?:un)?directed edges")
+AVG_TIME_RE = re.compile(r"Average Time:\s+([0-9.eE+-]+)")
+COUNTER_RE = re.compile(r"^\s*([\d,]+)\s+(?:cpu/)?([\w.\-]+)/?")
+
+KERNEL_MARKERS = {"bfs": "o", "pr": "s", "pr_spmv": "D", "cc": "^", "cc_sv": "v",
+                  "sssp": "P", "bc": "X", "tc": "*"}
+
+
+def parse_report(path):
+    """Kernel, scale, edge count, average trial time and counters of one capture."""
+    m = REPORT_NAME_RE.match(os.path.basename(path))
+    if not m:
+        return None
+    with open(path) as f:
+        text = f.read()
+    edges = EDGES_RE.search(text)
+    avg_time = AVG_TIME_RE.search(text)
+    if not edges or not avg_time:
+        return None
+
+    raw = {}
+    for line in text.splitlines():
+        c = COUNTER_RE.match(line)
+        if c:
+            raw[c.group(2)] = int(c.group(1).replace(",", ""))
+
+    capture = {"kernel": m.group(1), "scale": int(m.group(2)),
+               "edges": int(edges.group(2)), "time": float(avg_time.group(1))}
+    for counter, names in EVENT_NAMES.items():
+        capture[counter] = next((raw[n] for n in names if n in raw), None)
+    if capture["l2_misses"] is None:
+        return None
+    return capture
+
+
+def load_captures(reports_dir):
+    captures = [parse_report(p) for p in sorted(glob.glob(os.path.join(reports_dir, "*_g*.txt")))]
+    return [c for c in captures if c is not None]
+
+
+def derive(capture):
+    """Operational intensity, TEPS and achieved bandwidths of one capture."""
+    t = capture["time"]
+    l2_misses = capture["l2_misses"]
+    l2_hits = capture["l2_hits"] or 0
+    l1_accesses = capture["ls_dc_accesses"]
+    return {
+        # DRAM traffic is proxied by L2 misses
+        "oi": capture["edges"] / (l2_misses * cache_line_size),
+        "teps": capture["edges"] / t,
+        "l1_bw": l1_accesses * cache_line_size / t if l1_accesses is not None else float("nan"),
+        "l2_bw": (l2_hits + l2_misses) * cache_line_size / t,
+        "dram_bw": l2_misses * cache_line_size / t,
+    }
+
+
+def achieved_roofs(points):
+    """The best bandwidth achieved at each level across all captures."""
+    return {level: np.nanmax([p[level] for p in points]) for level in ("l1_bw", "l2_bw", "dram_bw")}
+
+
+def plot_roofline(captures, points, roofs, teps_roof, plot_file):
+    oi_range = np.logspace(-3, 2, 200)
+
+    plt.figure(figsize=(12, 8))
+    plt.style.use('seaborn-v0_8-whitegrid')
+
+    # Plot the memory bandwidth roofs based on ACHIEVED bandwidth
+    if np.isfinite(roofs["l1_bw"]):
+        plt.plot(oi_range, roofs["l1_bw"] * oi_range, color='green', linestyle=':',
+                 label=f'Achieved L1 BW Roof ({roofs["l1_bw"]/1e9:.2f} GB/s)')
+    plt.plot(oi_range, roofs["l2_bw"] * oi_range, color='orange', linestyle=':',
+             label=f'Achieved L2 BW Roof ({roofs["l2_bw"]/1e9:.2f} GB/s)')
+    plt.plot(oi_range, roofs["dram_bw"] * oi_range, color='purple', linestyle='-', lw=2,
+             label=f'Achieved L3/DRAM BW Roof ({roofs["dram_bw"]/1e9:.2f} GB/s)')
+
+    # Plot the horizontal TEPS roof
+    plt.axhline(y=teps_roof, color='red', linestyle='--', label=f'Peak TEPS Roof ({teps_roof/1e8:.2f} x 10^8 TEPS)')
+
+    # One point per capture: marker by kernel, colour by scale
+    scales = sorted({c["scale"] for c in captures})
+    colors = dict(zip(scales, plt.cm.viridis(np.linspace(0, 0.9, len(scales)))))
+    for c, p in zip(captures, points):
+        plt.plot(p["oi"], p["teps"], KERNEL_MARKERS.get(c["kernel"], 'o'), markersize=10,
+                 color=colors[c["scale"]], markeredgecolor='black', linestyle='none')
+        plt.annotate(f'{c["kernel"]} g{c["scale"]}', xy=(p["oi"], p["teps"]),
+                     xytext=(6, 6), textcoords='offset points', fontsize=8)
+
+    # Formatting
+    plt.xscale('log')
+    plt.yscale('log')
+    plt.title('Roofline Model based on Achieved Bandwidths (all GAP kernels)', fontsize=16)
+    plt.xlabel('Operational Intensity (Edges / Byte)', fontsize=12)
+    plt.ylabel('Performance (TEPS)', fontsize=12)
+    plt.grid(True, which="both", ls="--")
+
+    all_oi = [p["oi"] for p in points]
+    all_teps = [p["teps"] for p in points] + [teps_roof]
+    plt.xlim(min(1e-3, min(all_oi) / 2), max(1e2, max(all_oi) * 2))
+    plt.ylim(min(all_teps) / 2, max(all_teps) * 2)
+
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(plot_file)
+    print(f"Roofline plot generated and saved as '{plot_file}'")
+
+
+def print_table(captures, points, roofs, teps_roof):
+    print(f"\n{'kernel':8s} {'scale':>5s} {'OI (E/B)':>10s} {'TEPS':>12s} {'DRAM GB/s':>10s} {'% of roof':>10s}")
+    for c, p in sorted(zip(captures, points), key=lambda cp: (cp[0]["kernel"], cp[0]["scale"])):
+        bound = min(roofs["dram_bw"] * p["oi"], teps_roof)
+        print(f'{c["kernel"]:8s} {c["scale"]:5d} {p["oi"]:10.4f} {p["teps"]:12.4g} '
+              f'{p["dram_bw"]/1e9:10.2f} {100 * p["teps"] / bound:9.1f}%')
+    print(f"\nAchieved L1 Bandwidth: {roofs['l1_bw']/1e9:.2f} GB/s")
+    print(f"Achieved L2 Bandwidth: {roofs['l2_bw']/1e9:.2f} GB/s")
+    print(f"Achieved L3/DRAM Bandwidth: {roofs['dram_bw']/1e9:.2f} GB/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TEPS roofline from reproduce_perf_counters.sh captures")
+    parser.add_argument("reports_dir", nargs="?", default="../perf_reports",
+                        help="directory of <kernel>_g<scale>.txt captures")
+    parser.add_argument("--teps-roof", type=float, default=TEPS_ROOF, help="peak TEPS roof")
+    parser.add_argument("-o", "--output", default="roofline_plot_achieved_bw.png")
+    args = parser.parse_args()
+
+    captures = load_captures(args.reports_dir)
+    if not captures:
+        print(f"No captures found in {args.reports_dir}, plotting the reference BFS measurement")
+        captures = [REFERENCE_CAPTURE]
+    points = [derive(c) for c in captures]
+    roofs = achieved_roofs(points)
+
+    plot_roofline(captures, points, roofs, args.teps_roof, args.output)
+    print_table(captures, points, roofs, args.teps_roof)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+analyze_allstats.py
+
+Factorial effects of the layout flags on every phase of every .allstats
+sweep, and the configurations ranked per dataset.
+
+For each phase timing and Total, the main effects and two-factor
+interactions of the 7 flags are fitted by least squares (doe.fit_effects),
+with confidence intervals and p-values. Sweeps over the same design (all
+128 configurations, or the same doe.py fraction) are fitted together: one
+least squares solve covers every phase of every dataset.
+
+Configurations are ranked per dataset on the Total predicted from the
+significant effects (which smooths run-to-run noise), and across datasets
+on the geometric mean of that prediction relative to each dataset's best;
+the overall first is the layout to ship.
+
+	python3 analyze_allstats.py                 # every *.allstats here
+	python3 analyze_allstats.py --log lmonocytogenes.cleanref.fna.million_reads.fna.20.allstats
+
+Writes allstats_effects.csv and allstats_ranking.csv.
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+
+import numpy as np
+
+from configs import get_bin_name
+from doe import CONFIDENCE, config_index, effect_terms, fit_effects, read_allstats
+
+# Statistics that are not phase timings
+NOT_TIMINGS = {"Avg qry length", "Average query length", "Minimum substring length"}
+ALPHA = 0.05
+
+
+def dataset_name(path):
+	return os.path.basename(path)[:-len(".allstats")].replace(".fna", "")
+
+def load(paths):
+	"""Sweeps grouped by design: {design key: (X, [(dataset, config names, {response: values})])}."""
+	groups = {}
+	for path in paths:
+		_, X, values = read_allstats(path)
+		order = np.lexsort([X[:, k] for k in range(X.shape[1])][::-1])
+		X = X[order]
+		values = dict((name, v[order]) for name, v in values.items() if name not in NOT_TIMINGS)
+		configs = [get_bin_name(config_index(row)) for row in X]
+		groups.setdefault(X.tobytes(), (X, []))[1].append((dataset_name(path), configs, values))
+	return groups
+
+def analyze(X, sweeps, log=False):
+	"""Effects of every response of every sweep over design X, fitted in one solve."""
+	columns = [(dataset, response) for dataset, _, values in sweeps for response in values]
+	Y = np.stack([values[response] for _, _, values in sweeps for response in values], axis=1)
+	valid = np.all(np.isfinite(Y), axis=0) & (not log or np.all(Y > 0, axis=0))
+	Y = np.log(Y[:, valid]) if log else Y[:, valid]
+	fit = fit_effects(X, Y)
+	fit["columns"] = [c for c, ok in zip(columns, valid) if ok]
+	fit["response_mean"] = Y.mean(axis=0)
+	fit["runs"] = len(X)
+	return fit
+
+def predicted(X, fit, column, alpha=ALPHA):
+	"""Response of every run predicted from the intercept and the significant effects only."""
+	_, M = effect_terms(X)
+	coef = np.concatenate(([fit["mean"][column]], fit["effect"][:, column] / 2))
+	coef[1:][fit["p"][:, column] >= alpha] = 0
+	return M @ coef
+
+def rank_configs(X, sweep, fit, log=False):
+	"""Per configuration (replicates averaged): observed and predicted Total, ranked by prediction."""
+	dataset, configs, values = sweep
+	column = fit["columns"].index((dataset, "Total"))
+	pred = predicted(X, fit, column)
+	pred = np.exp(pred) if log else pred
+	names = list(dict.fromkeys(configs))
+	idx = np.array([names.index(c) for c in configs])
+	counts = np.bincount(idx)
+	total = np.bincount(idx, values["Total"]) / counts
+	pred = np.bincount(idx, pred) / counts
+	order = np.lexsort((total, pred))
+	return [(names[k], total[k], pred[k], rank + 1) for rank, k in enumerate(order)]
+
+def write_effects(fits, path, log=False):
+	with open(path, "w") as f:
+		writer = csv.writer(f)
+		writer.writerow(["dataset", "response", "term", "effect", "ci_low", "ci_high", "relative_effect",
+		                 "p_value", "significant", "error"])
+		for fit in fits:
+			for j, (dataset, response) in enumerate(fit["columns"]):
+				for k, term in enumerate(fit["terms"]):
+					e, h = fit["effect"][k, j], fit["half_width"][k, j]
+					rel = log and np.expm1(e) or (fit["response_mean"][j] and e / fit["response_mean"][j] or 0.0)
+					writer.writerow([dataset, response, term, "%.4f" % e, "%.4f" % (e - h), "%.4f" % (e + h),
+					                 "%.4f" % rel, "%.4g" % fit["p"][k, j], int(fit["p"][k, j] < ALPHA),
+					                 "%s (df %g)" % (fit["method"], fit["df"])])
+
+def write_ranking(rankings, path):
+	with open(path, "w") as f:
+		writer = csv.writer(f)
+		writer.writerow(["dataset", "config", "total", "predicted_total", "rank", "relative_to_best"])
+		for dataset, ranking in rankings.items():
+			best = min(total for _, total, _, _ in ranking)
+			for config, total, pred, rank in ranking:
+				writer.writerow([dataset, config, "%.3f" % total, "%.3f" % pred, rank, "%.4f" % (total / best)])
+
+def overall_ranking(rankings):
+	"""(config, geometric mean of predicted Total / dataset best) over the configurations every dataset ran."""
+	relative = {}
+	for ranking in rankings.values():
+		best = min(pred for _, _, pred, _ in ranking)
+		for config, _, pred, _ in ranking:
+			relative.setdefault(config, []).append(pred / best)
+	common = [c for c, r in relative.items() if len(r) == len(rankings)]
+	return sorted(((c, float(np.exp(np.mean(np.log(relative[c]))))) for c in common), key=lambda item: item[1])
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Factorial effects and configuration ranking of .allstats sweeps")
+	parser.add_argument("allstats", nargs="*", help="sweeps to analyze (default: every *.allstats next to this script)")
+	parser.add_argument("--log", action="store_true", help="fit log times: effects become relative changes")
+	parser.add_argument("--effects", default="allstats_effects.csv")
+	parser.add_argument("--ranking", default="allstats_ranking.csv")
+	parser.add_argument("--top", type=int, default=5, help="effects and configurations printed per dataset")
+	args = parser.parse_args()
+
+	paths = args.allstats or sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.allstats")))
+	if not paths:
+		parser.error("no .allstats files")
+
+	fits, rankings = [], {}
+	for X, sweeps in load(paths).values():
+		fit = analyze(X, sweeps, args.log)
+		fits.append(fit)
+		for sweep in sweeps:
+			rankings[sweep[0]] = rank_configs(X, sweep, fit, args.log)
+	write_effects(fits, args.effects, args.log)
+	write_ranking(rankings, args.ranking)
+
+	for fit in fits:
+		for j, (dataset, response) in enumerate(fit["columns"]):
+			if response != "Total":
+				continue
+			mean = args.log and np.exp(fit["response_mean"][j]) or fit["response_mean"][j]
+			print("%s: %d runs, mean Total %.0f ms, %s error (df %g)"
+			      % (dataset, fit["runs"], mean, fit["method"], fit["df"]))
+			top = np.argsort(-np.abs(fit["effect"][:, j]))[:args.top]
+			for k in top:
+				print("  %-20s %+12.3f +/- %-10.3f p=%.2g" % (fit["terms"][k], fit["effect"][k, j],
+				                                              fit["half_width"][k, j], fit["p"][k, j]))
+			print("  best: " + ", ".join("%s (%.0f ms)" % (c, t) for c, t, _, _ in rankings[dataset][:args.top]))
+	overall = overall_ranking(rankings)
+	if overall:
+		print("Layout to ship: %s (geometric mean %.3fx the per-dataset best); next: %s"
+		      % (overall[0][0], overall[0][1], ", ".join("%s %.3fx" % item for item in overall[1:args.top])))
+	print("Effects (%d%% confidence) in %s, rankings in %s" % (100 * CONFIDENCE, args.effects, args.ranking),
+	      file=sys.stderr)
@@ -1,122 +1,126 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 # encoding: utf-8
 """
-untitled.py
+configs.py
 
 Created by Cole Trapnell on 2008-03-22.
 Copyright (c) 2008 Cole Trapnell. All rights reserved.
+
+Generates the make rules for the 128 layout configurations (rules.mk,
+included by src/Makefile), the test targets that build them all
+(test_rule.mk) and the sc-exp.sh commands that run them (cmds.sh).
+
+Every configuration builds out of tree: objects go to
+obj/<release|debug>/configs/<variant>/, where <variant> names only the
+flags that translation unit reads, so configurations agreeing on those
+flags share the object (suffix-tree.cpp is built 8 times, not 128) and
+`make -j test` builds the matrix in parallel.
 """
 
 import sys
 import os
 
+# (bit, name letter, preprocessor flag)
+FLAGS = [
+	(1 << 0, "Q", "QRYTEX"),
+	(1 << 1, "R", "REFTEX"),
+	(1 << 2, "T", "TREETEX"),
+	(1 << 3, "m", "MERGETEX"),
+	(1 << 4, "r", "REORDER_REF"),
+	(1 << 5, "t", "REORDER_TREE"),
+	(1 << 6, "n", "RENUMBER_TREE"),
+]
+ALL_FLAGS = (1 << len(FLAGS)) - 1
+
+# (source, object suffix, flags it reads directly or through common.cu)
+# REORDER_TREE changes TextureAddress in common.cu, so every user of
+# mummergpu.h depends on it; mummergpu_main.cpp prints all flags.
+SOURCES = [
+	("mummergpu.cu", "cu_o", ALL_FLAGS),
+	("mummergpu_main.cpp", "cpp_o", ALL_FLAGS),
+	("mummergpu_gold.cpp", "cpp_o", (1 << 3) | (1 << 5)),
+	("suffix-tree.cpp", "cpp_o", (1 << 3) | (1 << 5) | (1 << 6)),
+	("PoolMalloc.cpp", "cpp_o", 0),
+]
+HEADERS = "mummergpu.h common.cu PoolMalloc.hh"
+KERNEL = "mummergpu_kernel.cu"
+
 def get_bin_name(i):
 	if (i == 0):
 		return "CONTROL"
-	
-	name = ""
-	if (i & (1 << 0)):
-		name += "Q"
-	if (i & (1 << 1)):
-		name += "R"
-	if (i & (1 << 2)):
-		name += "T"
-	if (i & (1 << 3)):
-		name += "m"
-	if (i & (1 << 4)):
-		name += "r"
-	if (i & (1 << 5)):
-		name += "t"
-	if (i & (1 << 6)):
-		name += "n"
-	
-	return name
-	
+	return "".join(letter for bit, letter, _ in FLAGS if i & bit)
+
 def get_directives(i):
-	directives = ""
-	if (i & (1 << 0)):
-		directives += " -DQRYTEX=1 "
-	else:
-		directives += " -DQRYTEX=0 "
-	
-	if (i & (1 << 1)):
-		directives += " -DREFTEX=1 "
-	else:
-		directives += " -DREFTEX=0  "
-		
-	if (i & (1 << 2)):
-		directives += " -DTREETEX=1  "
-	else:
-		directives +=  "-DTREETEX=0  "
-			
-	if (i & (1 << 3)):
-		directives += " -DMERGETEX=1  "
-	else:
-		directives += " -DMERGETEX=0  "
-		
-	if (i & (1 << 4)):
-		directives += " -DREORDER_REF=1  "
-	else:
-		directives += " -DREORDER_REF=0  "
-		
-	if (i & (1 << 5)):
-		directives += " -DREORDER_TREE=1  "
-	else:
-		directives += " -DREORDER_TREE=0  "
-		
-	if (i & (1 << 6)):
-		directives += " -DRENUMBER_TREE=1  "
-	else:
-		directives += " -DRENUMBER_TREE=0  "
-	
-	return directives + '"\n'
+	return " ".join("-D%s=%d" % (flag, bool(i & bit)) for bit, _, flag in FLAGS)
+
+def object_path(source, suffix, i):
+	return "$(CFGOBJDIR)/%s/%s.%s" % (get_bin_name(i), os.path.splitext(source)[0], suffix)
+
+def print_object_rules(r, f):
+	"""One compile rule per (source, variant) actually used by the first r configurations."""
+	done = set()
+	for i in range(0, r):
+		for source, suffix, mask in SOURCES:
+			variant = i & mask
+			if (source, variant) in done:
+				continue
+			done.add((source, variant))
+			target = object_path(source, suffix, variant)
+			if suffix == "cu_o":
+				print("%s: %s %s %s\n\t@mkdir -p $(@D)\n\t$(NVCC) -o $@ -c $< $(NVCCFLAGS) %s\n"
+				      % (target, source, KERNEL, HEADERS, get_directives(variant)), file=f)
+			else:
+				print("%s: %s %s\n\t@mkdir -p $(@D)\n\t$(CXX) $(CXXFLAGS) %s -o $@ -c $<\n"
+				      % (target, source, HEADERS, get_directives(variant)), file=f)
 
 def print_make_rules(r, file_name):
 	f = open(file_name, "w")
+	print("CFGOBJDIR := $(OBJDIR)/configs\n", file=f)
+	print_object_rules(r, f)
 	for i in range(0, r):
 		bin_name = get_bin_name(i)
-		dirs = get_directives(i)
-		rule = '%s: clean\n\tmake all "BINNAME = %s" "COMMONFLAGS = ${COMMONFLAGS} ' % (bin_name, bin_name)
-		rule += dirs
-		print >> f, rule
-		
-		rule = '%s_cubin: clean\n\tmake %s.cubin "BINNAME = %s" "COMMONFLAGS = ${COMMONFLAGS} ' % (bin_name, bin_name, bin_name)
-		rule += dirs
-		print >> f, rule
-		
+		objects = " ".join(object_path(source, suffix, i & mask) for source, suffix, mask in SOURCES)
+		print("%s: $(BINDIR)/%s\n" % (bin_name, bin_name), file=f)
+		print("$(BINDIR)/%s: %s\n\t@mkdir -p $(@D)\n\t$(LINK) -o $@ $^ $(LIB)\n" % (bin_name, objects), file=f)
+		print("%s_cubin: %s.cubin\n" % (bin_name, bin_name), file=f)
+		print("%s.cubin: mummergpu.cu %s %s\n\t$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) %s\n"
+		      % (bin_name, KERNEL, HEADERS, get_directives(i)), file=f)
+	f.close()
+
 def print_make_test_rule(r, file_name):
 	make_test_rule = "test:"
 	for i in range(0, r):
 		bin = get_bin_name(i)
 		make_test_rule += " " + bin
 	make_test_rule += "\n.SUFFIXES : .cu .cu_dbg_o .c_dbg_o .cpp_dbg_o .cu_rel_o .c_rel_o .cpp_rel_o .cubin\n"
-	
+
 	make_test_cubin_rule = "test_cubin:"
 	for i in range(0, r):
 		bin = get_bin_name(i)
 		make_test_cubin_rule += " " + bin + "_cubin"
-	
+
 	f = open(file_name, "w")
-	print >> f, make_test_rule
-	print >> f, make_test_cubin_rule
-	
+	print(make_test_rule, file=f)
+	print(make_test_cubin_rule, file=f)
+	f.close()
+
 def print_bash_rules(r, file_name):
 	f = open(file_name, "w")
-#	print >> f, "#!/bin/bash"
-#	print >> f, "$include runm-mummergpu.sh"
-	
+#	print("#!/bin/bash", file=f)
+#	print("$include runm-mummergpu.sh", file=f)
+
 	for i in range(0, r):
 		bin = get_bin_name(i)
-		print >> f, "\trun_mummergpu %s $REF $QRY $MINMATCH $ORG" % (bin)
-		
+		print("\trun_mummergpu %s $REF $QRY $MINMATCH $ORG" % (bin), file=f)
+	f.close()
+
 def main():
 	configs = 128
 	print_make_rules(configs, "rules.mk")
 	print_make_test_rule(configs, "test_rule.mk")
 	print_bash_rules(configs, "cmds.sh")
-	
+
 
 
 if __name__ == '__main__':
 	main()
-
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+doe.py
+
+Fractional factorial designs over the 7 layout flags, instead of all 128
+configurations of configs.py.
+
+	design   writes doe_design.csv, doe_rule.mk (`make -j doe` in src/ builds only
+	         the design's configurations) and doe_cmds.sh (run_doe_configs in
+	         sc-exp.sh runs them), for a 64, 32, 16 or 8 run fraction plus
+	         replicated design points
+	analyze  main effects and two-factor interactions of one statistic of an
+	         .allstats file (a design's runs, or any other set of configurations)
+
+Flags are two-level and qualitative, so there are no center points; the
+replicates repeat design points instead and give the pure error the effect
+standard errors are based on. Without replicates (or with a saturated
+model) the significance comes from Lenth's pseudo standard error.
+
+	python3 doe.py design --runs 32 --replicates 2
+	python3 doe.py analyze lmonocytogenes.cleanref.fna.million_reads.fna.20.allstats --response "Match kernel"
+"""
+
+import argparse
+import csv
+import sys
+from itertools import combinations, product
+
+import numpy as np
+from scipy import stats as sps
+
+from configs import FLAGS, get_bin_name
+
+FACTORS = [letter for _, letter, _ in FLAGS]
+
+# Minimum aberration 2^(7-p) fractions: runs -> (resolution, {added flag: generating flags}).
+# The first log2(runs) flags form a full factorial; the rest are products of them:
+#   64: n = QRTmrt   32: t = QRTm, n = QRmr   16: r = QRT, t = RTm, n = QTm   8: m = QR, r = QT, t = RT, n = QRT
+DESIGNS = {
+	64: ("VII", {6: (0, 1, 2, 3, 4, 5)}),
+	32: ("IV", {5: (0, 1, 2, 3), 6: (0, 1, 3, 4)}),
+	16: ("IV", {4: (0, 1, 2), 5: (1, 2, 3), 6: (0, 2, 3)}),
+	8: ("III", {3: (0, 1), 4: (0, 2), 5: (1, 2), 6: (0, 1, 2)}),
+}
+CONFIDENCE = 0.95
+
+
+def fraction(runs):
+	"""Coded (-1/+1) design matrix of the runs-run fraction, one column per flag."""
+	generators = DESIGNS[runs][1]
+	basic = len(FLAGS) - len(generators)
+	X = np.zeros((runs, len(FLAGS)), dtype=np.int64)
+	# Standard order: the first flag alternates fastest
+	X[:, :basic] = np.array(list(product((-1, 1), repeat=basic)))[:, ::-1]
+	for added, factors in generators.items():
+		X[:, added] = np.prod(X[:, factors], axis=1)
+	return X
+
+def config_index(row):
+	return sum(bit for (bit, _, _), level in zip(FLAGS, row) if level > 0)
+
+def design(runs, replicates):
+	"""(config index, replicate number) runs: the fraction, then evenly spaced design points again."""
+	configs = [config_index(row) for row in fraction(runs)]
+	step = replicates and max(len(configs) // replicates, 1)
+	repeats = replicates and configs[::step][:replicates] or []
+	return [(i, 1) for i in configs] + [(i, 2) for i in repeats]
+
+def defining_relation(runs):
+	"""Words of the fraction's defining relation, shortest first (the shortest gives the resolution)."""
+	words = [frozenset(factors + (added,)) for added, factors in DESIGNS[runs][1].items()]
+	relation = set()
+	for k in range(1, len(words) + 1):
+		for subset in combinations(words, k):
+			word = frozenset()
+			for w in subset:
+				word = word ^ w
+			relation.add(word)
+	return sorted(("".join(FACTORS[f] for f in sorted(word)) for word in relation), key=lambda w: (len(w), w))
+
+def write_design(runs, replicates, prefix="doe"):
+	plan = design(runs, replicates)
+	with open(prefix + "_design.csv", "w") as f:
+		writer = csv.writer(f)
+		writer.writerow(["run", "config"] + FACTORS + ["replicate"])
+		for n, (i, rep) in enumerate(plan):
+			writer.writerow([n, get_bin_name(i)] + [int(bool(i & bit)) for bit, _, _ in FLAGS] + [rep])
+
+	bins = list(dict.fromkeys(get_bin_name(i) for i, _ in plan))
+	with open(prefix + "_rule.mk", "w") as f:
+		print("# %d-run resolution %s fraction (I = %s), generated by doe.py"
+		      % (runs, DESIGNS[runs][0], " = ".join(defining_relation(runs))), file=f)
+		print("doe: " + " ".join(bins), file=f)
+
+	with open(prefix + "_cmds.sh", "w") as f:
+		for i, rep in plan:
+			print("\trun_mummergpu %s $REF $QRY $MINMATCH $ORG%s" % (get_bin_name(i), rep > 1 and " %d" % rep or ""),
+			      file=f)
+	return plan
+
+def effect_terms(X):
+	"""
+	Intercept, main effect and two-factor interaction columns of coded design X,
+	merged into alias chains where the design cannot tell terms apart (equal or
+	opposite columns). Returns (labels, model matrix), lowest-order term first in each chain.
+	"""
+	terms = [()] + [(f,) for f in range(X.shape[1])] + list(combinations(range(X.shape[1]), 2))
+	labels, columns = [], []
+	for term in terms:
+		col = np.prod(X[:, list(term)], axis=1) if term else np.ones(len(X), dtype=np.int64)
+		name = "*".join(FACTORS[f] for f in term) or "Intercept"
+		for k, other in enumerate(columns):
+			if np.array_equal(col, other) or np.array_equal(col, -other):
+				labels[k] += " = %s%s" % ("" if np.array_equal(col, other) else "-", name)
+				break
+		else:
+			labels.append(name)
+			columns.append(col)
+	return labels, np.stack(columns, axis=1).astype(float)
+
+def lenth_pse(effects):
+	"""Lenth's pseudo standard error of unreplicated effects, per column."""
+	a = np.abs(effects)
+	s0 = 1.5 * np.median(a, axis=0)
+	trimmed = np.where(a < 2.5 * s0, a, np.nan)
+	return 1.5 * np.nanmedian(trimmed, axis=0)
+
+def fit_effects(X, Y, confidence=CONFIDENCE):
+	"""
+	Least squares effects (high minus low) of every estimable term for each column
+	of Y (runs x responses), with standard errors, confidence half-widths and
+	p-values. The error comes from the residuals when there are degrees of
+	freedom left, otherwise from Lenth's pseudo standard error.
+	"""
+	labels, M = effect_terms(X)
+	Y = np.asarray(Y, dtype=float).reshape(len(M), -1)
+	coef, _, rank, _ = np.linalg.lstsq(M, Y, rcond=None)
+	effects = 2 * coef[1:]
+	df = len(M) - rank
+	if df > 0:
+		sigma2 = ((Y - M @ coef) ** 2).sum(axis=0) / df
+		se = 2 * np.sqrt(np.outer(np.diag(np.linalg.inv(M.T @ M))[1:], sigma2))
+		method = "residual"
+	else:
+		df = max(len(effects) / 3.0, 1.0)
+		se = np.broadcast_to(lenth_pse(effects), effects.shape)
+		method = "lenth"
+	with np.errstate(divide="ignore", invalid="ignore"):
+		t = effects / se
+	half_width = sps.t.ppf(0.5 + confidence / 2, df) * se
+	p = 2 * sps.t.sf(np.abs(t), df)
+	return {"terms": labels[1:], "mean": coef[0], "effect": effects, "se": se, "half_width": half_width,
+	        "p": p, "df": df, "method": method}
+
+def read_allstats(path):
+	"""(config names, coded flag matrix, {statistic: values}) of an .allstats file."""
+	with open(path) as f:
+		records = list(csv.DictReader(f))
+	names = [r["Configuration"] for r in records]
+	X = np.array([[1 if float(r[letter]) else -1 for letter in FACTORS] for r in records], dtype=np.int64)
+	columns = [c for c in records[0] if c not in FACTORS and c != "Configuration"]
+	values = dict((c, np.array([float(r[c] or "nan") for r in records])) for c in columns)
+	return names, X, values
+
+def print_effects(fit, response, out=sys.stdout):
+	writer = csv.writer(out)
+	writer.writerow(["response", "term", "effect", "ci_low", "ci_high", "p_value", "error"])
+	order = np.argsort(-np.abs(fit["effect"][:, 0]))
+	for k in order:
+		e, h = fit["effect"][k, 0], fit["half_width"][k, 0]
+		writer.writerow([response, fit["terms"][k], "%.3f" % e, "%.3f" % (e - h), "%.3f" % (e + h),
+		                 "%.4g" % fit["p"][k, 0], "%s (df %g)" % (fit["method"], fit["df"])])
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Fractional factorial designs over the MUMmerGPU layout flags")
+	sub = parser.add_subparsers(dest="command", required=True)
+
+	des = sub.add_parser("design", help="write the design, its make target and its sc-exp.sh commands")
+	des.add_argument("--runs", type=int, choices=sorted(DESIGNS), default=32)
+	des.add_argument("--replicates", type=int, default=2, help="design points run twice (default 2)")
+	des.add_argument("--prefix", default="doe")
+
+	ana = sub.add_parser("analyze", help="effects of one statistic of an .allstats file")
+	ana.add_argument("allstats")
+	ana.add_argument("--response", default="Total")
+	ana.add_argument("--log", action="store_true", help="analyze log times (effects become ratios)")
+	args = parser.parse_args()
+
+	if args.command == "design":
+		plan = write_design(args.runs, args.replicates, args.prefix)
+		print("%d runs (%d-run resolution %s fraction + %d replicates) instead of %d; I = %s"
+		      % (len(plan), args.runs, DESIGNS[args.runs][0], len(plan) - args.runs, 1 << len(FLAGS),
+		         " = ".join(defining_relation(args.runs))), file=sys.stderr)
+	else:
+		names, X, values = read_allstats(args.allstats)
+		y = values[args.response]
+		fit = fit_effects(X, np.log(y) if args.log else y)
+		if args.log:
+			print("# effects are log ratios: exp(effect) is the high/low time ratio", file=sys.stderr)
+		print_effects(fit, args.response)
@@ -0,0 +1,34 @@
+	run_mummergpu tn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Q $REF $QRY $MINMATCH $ORG
+	run_mummergpu R $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Tn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QTt $REF $QRY $MINMATCH $ORG
+	run_mummergpu RTt $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRTn $REF $QRY $MINMATCH $ORG
+	run_mummergpu m $REF $QRY $MINMATCH $ORG
+	run_mummergpu Qmtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Rmtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRm $REF $QRY $MINMATCH $ORG
+	run_mummergpu Tmt $REF $QRY $MINMATCH $ORG
+	run_mummergpu QTmn $REF $QRY $MINMATCH $ORG
+	run_mummergpu RTmn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRTmt $REF $QRY $MINMATCH $ORG
+	run_mummergpu rt $REF $QRY $MINMATCH $ORG
+	run_mummergpu Qrn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Rrn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRrt $REF $QRY $MINMATCH $ORG
+	run_mummergpu Tr $REF $QRY $MINMATCH $ORG
+	run_mummergpu QTrtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu RTrtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRTr $REF $QRY $MINMATCH $ORG
+	run_mummergpu mrn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Qmrt $REF $QRY $MINMATCH $ORG
+	run_mummergpu Rmrt $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRmrn $REF $QRY $MINMATCH $ORG
+	run_mummergpu Tmrtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu QTmr $REF $QRY $MINMATCH $ORG
+	run_mummergpu RTmr $REF $QRY $MINMATCH $ORG
+	run_mummergpu QRTmrtn $REF $QRY $MINMATCH $ORG
+	run_mummergpu tn $REF $QRY $MINMATCH $ORG 2
+	run_mummergpu rt $REF $QRY $MINMATCH $ORG 2
@@ -0,0 +1,2 @@
+# 32-run resolution IV fraction (I = Trtn = QRTmt = QRmrn), generated by doe.py
+doe: tn Q R QRtn Tn QTt RTt QRTn m Qmtn Rmtn QRm Tmt QTmn RTmn QRTmt rt Qrn Rrn QRrt Tr QTrtn RTrtn QRTr mrn Qmrt Rmrt QRmrn Tmrtn QTmr RTmr QRTmrtn
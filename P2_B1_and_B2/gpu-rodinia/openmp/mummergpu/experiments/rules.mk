@@ -1,768 +1,2486 @@
-CONTROL: clean
-	make all "BINNAME = CONTROL" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+CFGOBJDIR := $(OBJDIR)/configs
 
-CONTROL_cubin: clean
-	make CONTROL.cubin "BINNAME = CONTROL" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/CONTROL/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Q: clean
-	make all "BINNAME = Q" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/CONTROL/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Q_cubin: clean
-	make Q.cubin "BINNAME = Q" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o: mummergpu_gold.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-R: clean
-	make all "BINNAME = R" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-R_cubin: clean
-	make R.cubin "BINNAME = R" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o: PoolMalloc.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QR: clean
-	make all "BINNAME = QR" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Q/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QR_cubin: clean
-	make QR.cubin "BINNAME = QR" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Q/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-T: clean
-	make all "BINNAME = T" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/R/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-T_cubin: clean
-	make T.cubin "BINNAME = T" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/R/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QT: clean
-	make all "BINNAME = QT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QR/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QT_cubin: clean
-	make QT.cubin "BINNAME = QT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QR/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RT: clean
-	make all "BINNAME = RT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/T/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-RT_cubin: clean
-	make RT.cubin "BINNAME = RT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/T/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRT: clean
-	make all "BINNAME = QRT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QT/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRT_cubin: clean
-	make QRT.cubin "BINNAME = QRT" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QT/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-m: clean
-	make all "BINNAME = m" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RT/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-m_cubin: clean
-	make m.cubin "BINNAME = m" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RT/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qm: clean
-	make all "BINNAME = Qm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRT/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Qm_cubin: clean
-	make Qm.cubin "BINNAME = Qm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRT/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rm: clean
-	make all "BINNAME = Rm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/m/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Rm_cubin: clean
-	make Rm.cubin "BINNAME = Rm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/m/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRm: clean
-	make all "BINNAME = QRm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/m/mummergpu_gold.cpp_o: mummergpu_gold.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRm_cubin: clean
-	make QRm.cubin "BINNAME = QRm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/m/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tm: clean
-	make all "BINNAME = Tm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Tm_cubin: clean
-	make Tm.cubin "BINNAME = Tm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTm: clean
-	make all "BINNAME = QTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QTm_cubin: clean
-	make QTm.cubin "BINNAME = QTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTm: clean
-	make all "BINNAME = RTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-RTm_cubin: clean
-	make RTm.cubin "BINNAME = RTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTm: clean
-	make all "BINNAME = QRTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRTm_cubin: clean
-	make QRTm.cubin "BINNAME = QRTm" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-r: clean
-	make all "BINNAME = r" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-r_cubin: clean
-	make r.cubin "BINNAME = r" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qr: clean
-	make all "BINNAME = Qr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Qr_cubin: clean
-	make Qr.cubin "BINNAME = Qr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rr: clean
-	make all "BINNAME = Rr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTm/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Rr_cubin: clean
-	make Rr.cubin "BINNAME = Rr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTm/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRr: clean
-	make all "BINNAME = QRr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/r/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRr_cubin: clean
-	make QRr.cubin "BINNAME = QRr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/r/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tr: clean
-	make all "BINNAME = Tr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Tr_cubin: clean
-	make Tr.cubin "BINNAME = Tr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTr: clean
-	make all "BINNAME = QTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QTr_cubin: clean
-	make QTr.cubin "BINNAME = QTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTr: clean
-	make all "BINNAME = RTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-RTr_cubin: clean
-	make RTr.cubin "BINNAME = RTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTr: clean
-	make all "BINNAME = QRTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRTr_cubin: clean
-	make QRTr.cubin "BINNAME = QRTr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-mr: clean
-	make all "BINNAME = mr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-mr_cubin: clean
-	make mr.cubin "BINNAME = mr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qmr: clean
-	make all "BINNAME = Qmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Qmr_cubin: clean
-	make Qmr.cubin "BINNAME = Qmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rmr: clean
-	make all "BINNAME = Rmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Rmr_cubin: clean
-	make Rmr.cubin "BINNAME = Rmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRmr: clean
-	make all "BINNAME = QRmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRmr_cubin: clean
-	make QRmr.cubin "BINNAME = QRmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tmr: clean
-	make all "BINNAME = Tmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Tmr_cubin: clean
-	make Tmr.cubin "BINNAME = Tmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTmr: clean
-	make all "BINNAME = QTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QTmr_cubin: clean
-	make QTmr.cubin "BINNAME = QTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTmr: clean
-	make all "BINNAME = RTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-RTmr_cubin: clean
-	make RTmr.cubin "BINNAME = RTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTmr: clean
-	make all "BINNAME = QRTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-QRTmr_cubin: clean
-	make QRTmr.cubin "BINNAME = QRTmr" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-t: clean
-	make all "BINNAME = t" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-t_cubin: clean
-	make t.cubin "BINNAME = t" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qt: clean
-	make all "BINNAME = Qt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Qt_cubin: clean
-	make Qt.cubin "BINNAME = Qt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rt: clean
-	make all "BINNAME = Rt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTmr/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
 
-Rt_cubin: clean
-	make Rt.cubin "BINNAME = Rt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTmr/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRt: clean
-	make all "BINNAME = QRt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/t/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRt_cubin: clean
-	make QRt.cubin "BINNAME = QRt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/t/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tt: clean
-	make all "BINNAME = Tt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/t/mummergpu_gold.cpp_o: mummergpu_gold.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tt_cubin: clean
-	make Tt.cubin "BINNAME = Tt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/t/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTt: clean
-	make all "BINNAME = QTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QTt_cubin: clean
-	make QTt.cubin "BINNAME = QTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTt: clean
-	make all "BINNAME = RTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-RTt_cubin: clean
-	make RTt.cubin "BINNAME = RTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTt: clean
-	make all "BINNAME = QRTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRTt_cubin: clean
-	make QRTt.cubin "BINNAME = QRTt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-mt: clean
-	make all "BINNAME = mt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-mt_cubin: clean
-	make mt.cubin "BINNAME = mt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qmt: clean
-	make all "BINNAME = Qmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Qmt_cubin: clean
-	make Qmt.cubin "BINNAME = Qmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rmt: clean
-	make all "BINNAME = Rmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Rmt_cubin: clean
-	make Rmt.cubin "BINNAME = Rmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRmt: clean
-	make all "BINNAME = QRmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRmt_cubin: clean
-	make QRmt.cubin "BINNAME = QRmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tmt: clean
-	make all "BINNAME = Tmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Tmt_cubin: clean
-	make Tmt.cubin "BINNAME = Tmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTmt: clean
-	make all "BINNAME = QTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mt/mummergpu_gold.cpp_o: mummergpu_gold.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTmt_cubin: clean
-	make QTmt.cubin "BINNAME = QTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mt/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTmt: clean
-	make all "BINNAME = RTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-RTmt_cubin: clean
-	make RTmt.cubin "BINNAME = RTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTmt: clean
-	make all "BINNAME = QRTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRTmt_cubin: clean
-	make QRTmt.cubin "BINNAME = QRTmt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-rt: clean
-	make all "BINNAME = rt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-rt_cubin: clean
-	make rt.cubin "BINNAME = rt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qrt: clean
-	make all "BINNAME = Qrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Qrt_cubin: clean
-	make Qrt.cubin "BINNAME = Qrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Tmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rrt: clean
-	make all "BINNAME = Rrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Rrt_cubin: clean
-	make Rrt.cubin "BINNAME = Rrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRrt: clean
-	make all "BINNAME = QRrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRrt_cubin: clean
-	make QRrt.cubin "BINNAME = QRrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Trt: clean
-	make all "BINNAME = Trt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTmt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Trt_cubin: clean
-	make Trt.cubin "BINNAME = Trt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTmt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTrt: clean
-	make all "BINNAME = QTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/rt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QTrt_cubin: clean
-	make QTrt.cubin "BINNAME = QTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/rt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTrt: clean
-	make all "BINNAME = RTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-RTrt_cubin: clean
-	make RTrt.cubin "BINNAME = RTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTrt: clean
-	make all "BINNAME = QRTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRTrt_cubin: clean
-	make QRTrt.cubin "BINNAME = QRTrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-mrt: clean
-	make all "BINNAME = mrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-mrt_cubin: clean
-	make mrt.cubin "BINNAME = mrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qmrt: clean
-	make all "BINNAME = Qmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Trt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Qmrt_cubin: clean
-	make Qmrt.cubin "BINNAME = Qmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Trt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rmrt: clean
-	make all "BINNAME = Rmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Rmrt_cubin: clean
-	make Rmrt.cubin "BINNAME = Rmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QTrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRmrt: clean
-	make all "BINNAME = QRmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRmrt_cubin: clean
-	make QRmrt.cubin "BINNAME = QRmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/RTrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tmrt: clean
-	make all "BINNAME = Tmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Tmrt_cubin: clean
-	make Tmrt.cubin "BINNAME = Tmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/QRTrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTmrt: clean
-	make all "BINNAME = QTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QTmrt_cubin: clean
-	make QTmrt.cubin "BINNAME = QTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/mrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-RTmrt: clean
-	make all "BINNAME = RTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-RTmrt_cubin: clean
-	make RTmrt.cubin "BINNAME = RTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Qmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRTmrt: clean
-	make all "BINNAME = QRTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRTmrt_cubin: clean
-	make QRTmrt.cubin "BINNAME = QRTmrt" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=0  "
+$(CFGOBJDIR)/Rmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-n: clean
-	make all "BINNAME = n" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-n_cubin: clean
-	make n.cubin "BINNAME = n" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Qn: clean
-	make all "BINNAME = Qn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Qn_cubin: clean
-	make Qn.cubin "BINNAME = Qn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Rn: clean
-	make all "BINNAME = Rn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Rn_cubin: clean
-	make Rn.cubin "BINNAME = Rn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QRn: clean
-	make all "BINNAME = QRn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-QRn_cubin: clean
-	make QRn.cubin "BINNAME = QRn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-Tn: clean
-	make all "BINNAME = Tn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmrt/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
 
-Tn_cubin: clean
-	make Tn.cubin "BINNAME = Tn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmrt/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0 -o $@ -c $<
 
-QTn: clean
-	make all "BINNAME = QTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/n/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QTn_cubin: clean
-	make QTn.cubin "BINNAME = QTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/n/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTn: clean
-	make all "BINNAME = RTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/n/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTn_cubin: clean
-	make RTn.cubin "BINNAME = RTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRTn: clean
-	make all "BINNAME = QRTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTn_cubin: clean
-	make QRTn.cubin "BINNAME = QRTn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-mn: clean
-	make all "BINNAME = mn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-mn_cubin: clean
-	make mn.cubin "BINNAME = mn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Qmn: clean
-	make all "BINNAME = Qmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qmn_cubin: clean
-	make Qmn.cubin "BINNAME = Qmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Rmn: clean
-	make all "BINNAME = Rmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rmn_cubin: clean
-	make Rmn.cubin "BINNAME = Rmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRmn: clean
-	make all "BINNAME = QRmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRmn_cubin: clean
-	make QRmn.cubin "BINNAME = QRmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Tmn: clean
-	make all "BINNAME = Tmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Tmn_cubin: clean
-	make Tmn.cubin "BINNAME = Tmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QTmn: clean
-	make all "BINNAME = QTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTmn_cubin: clean
-	make QTmn.cubin "BINNAME = QTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-RTmn: clean
-	make all "BINNAME = RTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTmn_cubin: clean
-	make RTmn.cubin "BINNAME = RTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mn/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTmn: clean
-	make all "BINNAME = QRTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRTmn_cubin: clean
-	make QRTmn.cubin "BINNAME = QRTmn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-rn: clean
-	make all "BINNAME = rn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-rn_cubin: clean
-	make rn.cubin "BINNAME = rn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qrn: clean
-	make all "BINNAME = Qrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Qrn_cubin: clean
-	make Qrn.cubin "BINNAME = Qrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rrn: clean
-	make all "BINNAME = Rrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Rrn_cubin: clean
-	make Rrn.cubin "BINNAME = Rrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRrn: clean
-	make all "BINNAME = QRrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRrn_cubin: clean
-	make QRrn.cubin "BINNAME = QRrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Trn: clean
-	make all "BINNAME = Trn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Trn_cubin: clean
-	make Trn.cubin "BINNAME = Trn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTrn: clean
-	make all "BINNAME = QTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QTrn_cubin: clean
-	make QTrn.cubin "BINNAME = QTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTrn: clean
-	make all "BINNAME = RTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/rn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-RTrn_cubin: clean
-	make RTrn.cubin "BINNAME = RTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/rn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTrn: clean
-	make all "BINNAME = QRTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRTrn_cubin: clean
-	make QRTrn.cubin "BINNAME = QRTrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-mrn: clean
-	make all "BINNAME = mrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-mrn_cubin: clean
-	make mrn.cubin "BINNAME = mrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qmrn: clean
-	make all "BINNAME = Qmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Qmrn_cubin: clean
-	make Qmrn.cubin "BINNAME = Qmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rmrn: clean
-	make all "BINNAME = Rmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Trn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Rmrn_cubin: clean
-	make Rmrn.cubin "BINNAME = Rmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Trn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRmrn: clean
-	make all "BINNAME = QRmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRmrn_cubin: clean
-	make QRmrn.cubin "BINNAME = QRmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Tmrn: clean
-	make all "BINNAME = Tmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Tmrn_cubin: clean
-	make Tmrn.cubin "BINNAME = Tmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTmrn: clean
-	make all "BINNAME = QTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QTmrn_cubin: clean
-	make QTmrn.cubin "BINNAME = QTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTmrn: clean
-	make all "BINNAME = RTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-RTmrn_cubin: clean
-	make RTmrn.cubin "BINNAME = RTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTmrn: clean
-	make all "BINNAME = QRTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRTmrn_cubin: clean
-	make QRTmrn.cubin "BINNAME = QRTmrn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=0   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-tn: clean
-	make all "BINNAME = tn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-tn_cubin: clean
-	make tn.cubin "BINNAME = tn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qtn: clean
-	make all "BINNAME = Qtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Qtn_cubin: clean
-	make Qtn.cubin "BINNAME = Qtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rtn: clean
-	make all "BINNAME = Rtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Rtn_cubin: clean
-	make Rtn.cubin "BINNAME = Rtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRtn: clean
-	make all "BINNAME = QRtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QRtn_cubin: clean
-	make QRtn.cubin "BINNAME = QRtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Ttn: clean
-	make all "BINNAME = Ttn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-Ttn_cubin: clean
-	make Ttn.cubin "BINNAME = Ttn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTtn: clean
-	make all "BINNAME = QTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmrn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
 
-QTtn_cubin: clean
-	make QTtn.cubin "BINNAME = QTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmrn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTtn: clean
-	make all "BINNAME = RTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/tn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-RTtn_cubin: clean
-	make RTtn.cubin "BINNAME = RTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/tn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTtn: clean
-	make all "BINNAME = QRTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/tn/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTtn_cubin: clean
-	make QRTtn.cubin "BINNAME = QRTtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-mtn: clean
-	make all "BINNAME = mtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-mtn_cubin: clean
-	make mtn.cubin "BINNAME = mtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Qmtn: clean
-	make all "BINNAME = Qmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qmtn_cubin: clean
-	make Qmtn.cubin "BINNAME = Qmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Rmtn: clean
-	make all "BINNAME = Rmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rmtn_cubin: clean
-	make Rmtn.cubin "BINNAME = Rmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Ttn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRmtn: clean
-	make all "BINNAME = QRmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Ttn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRmtn_cubin: clean
-	make QRmtn.cubin "BINNAME = QRmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Tmtn: clean
-	make all "BINNAME = Tmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Tmtn_cubin: clean
-	make Tmtn.cubin "BINNAME = Tmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QTmtn: clean
-	make all "BINNAME = QTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTmtn_cubin: clean
-	make QTmtn.cubin "BINNAME = QTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-RTmtn: clean
-	make all "BINNAME = RTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTmtn_cubin: clean
-	make RTmtn.cubin "BINNAME = RTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRTmtn: clean
-	make all "BINNAME = QRTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTmtn_cubin: clean
-	make QRTmtn.cubin "BINNAME = QRTmtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=0   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mtn/suffix-tree.cpp_o: suffix-tree.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-rtn: clean
-	make all "BINNAME = rtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-rtn_cubin: clean
-	make rtn.cubin "BINNAME = rtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qrtn: clean
-	make all "BINNAME = Qrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Qrtn_cubin: clean
-	make Qrtn.cubin "BINNAME = Qrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rrtn: clean
-	make all "BINNAME = Rrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Rrtn_cubin: clean
-	make Rrtn.cubin "BINNAME = Rrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRrtn: clean
-	make all "BINNAME = QRrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRrtn_cubin: clean
-	make QRrtn.cubin "BINNAME = QRrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Tmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Trtn: clean
-	make all "BINNAME = Trtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Trtn_cubin: clean
-	make Trtn.cubin "BINNAME = Trtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTrtn: clean
-	make all "BINNAME = QTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QTrtn_cubin: clean
-	make QTrtn.cubin "BINNAME = QTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTrtn: clean
-	make all "BINNAME = RTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-RTrtn_cubin: clean
-	make RTrtn.cubin "BINNAME = RTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTmtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTrtn: clean
-	make all "BINNAME = QRTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/rtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRTrtn_cubin: clean
-	make QRTrtn.cubin "BINNAME = QRTrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=0   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/rtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-mrtn: clean
-	make all "BINNAME = mrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-mrtn_cubin: clean
-	make mrtn.cubin "BINNAME = mrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Qrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Qmrtn: clean
-	make all "BINNAME = Qmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Qmrtn_cubin: clean
-	make Qmrtn.cubin "BINNAME = Qmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0  -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Rrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Rmrtn: clean
-	make all "BINNAME = Rmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Rmrtn_cubin: clean
-	make Rmrtn.cubin "BINNAME = Rmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRmrtn: clean
-	make all "BINNAME = QRmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Trtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRmrtn_cubin: clean
-	make QRmrtn.cubin "BINNAME = QRmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1 -DTREETEX=0   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/Trtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-Tmrtn: clean
-	make all "BINNAME = Tmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-Tmrtn_cubin: clean
-	make Tmrtn.cubin "BINNAME = Tmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QTrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QTmrtn: clean
-	make all "BINNAME = QTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QTmrtn_cubin: clean
-	make QTmrtn.cubin "BINNAME = QTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=0   -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/RTrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-RTmrtn: clean
-	make all "BINNAME = RTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-RTmrtn_cubin: clean
-	make RTmrtn.cubin "BINNAME = RTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=0  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/QRTrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
 
-QRTmrtn: clean
-	make all "BINNAME = QRTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
-QRTmrtn_cubin: clean
-	make QRTmrtn.cubin "BINNAME = QRTmrtn" "COMMONFLAGS = ${COMMONFLAGS}  -DQRYTEX=1  -DREFTEX=1  -DTREETEX=1   -DMERGETEX=1   -DREORDER_REF=1   -DREORDER_TREE=1   -DRENUMBER_TREE=1  "
+$(CFGOBJDIR)/mrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/Qmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/Qmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/Rmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/Rmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/QRmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/QRmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/Tmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/Tmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/QTmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/QTmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/RTmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/RTmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+$(CFGOBJDIR)/QRTmrtn/mummergpu.cu_o: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(NVCC) -o $@ -c $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+$(CFGOBJDIR)/QRTmrtn/mummergpu_main.cpp_o: mummergpu_main.cpp mummergpu.h common.cu PoolMalloc.hh
+	@mkdir -p $(@D)
+	$(CXX) $(CXXFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1 -o $@ -c $<
+
+CONTROL: $(BINDIR)/CONTROL
+
+$(BINDIR)/CONTROL: $(CFGOBJDIR)/CONTROL/mummergpu.cu_o $(CFGOBJDIR)/CONTROL/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+CONTROL_cubin: CONTROL.cubin
+
+CONTROL.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Q: $(BINDIR)/Q
+
+$(BINDIR)/Q: $(CFGOBJDIR)/Q/mummergpu.cu_o $(CFGOBJDIR)/Q/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Q_cubin: Q.cubin
+
+Q.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+R: $(BINDIR)/R
+
+$(BINDIR)/R: $(CFGOBJDIR)/R/mummergpu.cu_o $(CFGOBJDIR)/R/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+R_cubin: R.cubin
+
+R.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QR: $(BINDIR)/QR
+
+$(BINDIR)/QR: $(CFGOBJDIR)/QR/mummergpu.cu_o $(CFGOBJDIR)/QR/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QR_cubin: QR.cubin
+
+QR.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+T: $(BINDIR)/T
+
+$(BINDIR)/T: $(CFGOBJDIR)/T/mummergpu.cu_o $(CFGOBJDIR)/T/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+T_cubin: T.cubin
+
+T.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QT: $(BINDIR)/QT
+
+$(BINDIR)/QT: $(CFGOBJDIR)/QT/mummergpu.cu_o $(CFGOBJDIR)/QT/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QT_cubin: QT.cubin
+
+QT.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+RT: $(BINDIR)/RT
+
+$(BINDIR)/RT: $(CFGOBJDIR)/RT/mummergpu.cu_o $(CFGOBJDIR)/RT/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RT_cubin: RT.cubin
+
+RT.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRT: $(BINDIR)/QRT
+
+$(BINDIR)/QRT: $(CFGOBJDIR)/QRT/mummergpu.cu_o $(CFGOBJDIR)/QRT/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRT_cubin: QRT.cubin
+
+QRT.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+m: $(BINDIR)/m
+
+$(BINDIR)/m: $(CFGOBJDIR)/m/mummergpu.cu_o $(CFGOBJDIR)/m/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+m_cubin: m.cubin
+
+m.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Qm: $(BINDIR)/Qm
+
+$(BINDIR)/Qm: $(CFGOBJDIR)/Qm/mummergpu.cu_o $(CFGOBJDIR)/Qm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qm_cubin: Qm.cubin
+
+Qm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Rm: $(BINDIR)/Rm
+
+$(BINDIR)/Rm: $(CFGOBJDIR)/Rm/mummergpu.cu_o $(CFGOBJDIR)/Rm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rm_cubin: Rm.cubin
+
+Rm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRm: $(BINDIR)/QRm
+
+$(BINDIR)/QRm: $(CFGOBJDIR)/QRm/mummergpu.cu_o $(CFGOBJDIR)/QRm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRm_cubin: QRm.cubin
+
+QRm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Tm: $(BINDIR)/Tm
+
+$(BINDIR)/Tm: $(CFGOBJDIR)/Tm/mummergpu.cu_o $(CFGOBJDIR)/Tm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tm_cubin: Tm.cubin
+
+Tm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QTm: $(BINDIR)/QTm
+
+$(BINDIR)/QTm: $(CFGOBJDIR)/QTm/mummergpu.cu_o $(CFGOBJDIR)/QTm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTm_cubin: QTm.cubin
+
+QTm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+RTm: $(BINDIR)/RTm
+
+$(BINDIR)/RTm: $(CFGOBJDIR)/RTm/mummergpu.cu_o $(CFGOBJDIR)/RTm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTm_cubin: RTm.cubin
+
+RTm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRTm: $(BINDIR)/QRTm
+
+$(BINDIR)/QRTm: $(CFGOBJDIR)/QRTm/mummergpu.cu_o $(CFGOBJDIR)/QRTm/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTm_cubin: QRTm.cubin
+
+QRTm.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+r: $(BINDIR)/r
+
+$(BINDIR)/r: $(CFGOBJDIR)/r/mummergpu.cu_o $(CFGOBJDIR)/r/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+r_cubin: r.cubin
+
+r.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Qr: $(BINDIR)/Qr
+
+$(BINDIR)/Qr: $(CFGOBJDIR)/Qr/mummergpu.cu_o $(CFGOBJDIR)/Qr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qr_cubin: Qr.cubin
+
+Qr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Rr: $(BINDIR)/Rr
+
+$(BINDIR)/Rr: $(CFGOBJDIR)/Rr/mummergpu.cu_o $(CFGOBJDIR)/Rr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rr_cubin: Rr.cubin
+
+Rr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRr: $(BINDIR)/QRr
+
+$(BINDIR)/QRr: $(CFGOBJDIR)/QRr/mummergpu.cu_o $(CFGOBJDIR)/QRr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRr_cubin: QRr.cubin
+
+QRr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Tr: $(BINDIR)/Tr
+
+$(BINDIR)/Tr: $(CFGOBJDIR)/Tr/mummergpu.cu_o $(CFGOBJDIR)/Tr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tr_cubin: Tr.cubin
+
+Tr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QTr: $(BINDIR)/QTr
+
+$(BINDIR)/QTr: $(CFGOBJDIR)/QTr/mummergpu.cu_o $(CFGOBJDIR)/QTr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTr_cubin: QTr.cubin
+
+QTr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+RTr: $(BINDIR)/RTr
+
+$(BINDIR)/RTr: $(CFGOBJDIR)/RTr/mummergpu.cu_o $(CFGOBJDIR)/RTr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTr_cubin: RTr.cubin
+
+RTr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRTr: $(BINDIR)/QRTr
+
+$(BINDIR)/QRTr: $(CFGOBJDIR)/QRTr/mummergpu.cu_o $(CFGOBJDIR)/QRTr/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/CONTROL/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTr_cubin: QRTr.cubin
+
+QRTr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+mr: $(BINDIR)/mr
+
+$(BINDIR)/mr: $(CFGOBJDIR)/mr/mummergpu.cu_o $(CFGOBJDIR)/mr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mr_cubin: mr.cubin
+
+mr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Qmr: $(BINDIR)/Qmr
+
+$(BINDIR)/Qmr: $(CFGOBJDIR)/Qmr/mummergpu.cu_o $(CFGOBJDIR)/Qmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmr_cubin: Qmr.cubin
+
+Qmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Rmr: $(BINDIR)/Rmr
+
+$(BINDIR)/Rmr: $(CFGOBJDIR)/Rmr/mummergpu.cu_o $(CFGOBJDIR)/Rmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmr_cubin: Rmr.cubin
+
+Rmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRmr: $(BINDIR)/QRmr
+
+$(BINDIR)/QRmr: $(CFGOBJDIR)/QRmr/mummergpu.cu_o $(CFGOBJDIR)/QRmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmr_cubin: QRmr.cubin
+
+QRmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+Tmr: $(BINDIR)/Tmr
+
+$(BINDIR)/Tmr: $(CFGOBJDIR)/Tmr/mummergpu.cu_o $(CFGOBJDIR)/Tmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmr_cubin: Tmr.cubin
+
+Tmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QTmr: $(BINDIR)/QTmr
+
+$(BINDIR)/QTmr: $(CFGOBJDIR)/QTmr/mummergpu.cu_o $(CFGOBJDIR)/QTmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmr_cubin: QTmr.cubin
+
+QTmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+RTmr: $(BINDIR)/RTmr
+
+$(BINDIR)/RTmr: $(CFGOBJDIR)/RTmr/mummergpu.cu_o $(CFGOBJDIR)/RTmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmr_cubin: RTmr.cubin
+
+RTmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+QRTmr: $(BINDIR)/QRTmr
+
+$(BINDIR)/QRTmr: $(CFGOBJDIR)/QRTmr/mummergpu.cu_o $(CFGOBJDIR)/QRTmr/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/m/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmr_cubin: QRTmr.cubin
+
+QRTmr.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=0
+
+t: $(BINDIR)/t
+
+$(BINDIR)/t: $(CFGOBJDIR)/t/mummergpu.cu_o $(CFGOBJDIR)/t/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+t_cubin: t.cubin
+
+t.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Qt: $(BINDIR)/Qt
+
+$(BINDIR)/Qt: $(CFGOBJDIR)/Qt/mummergpu.cu_o $(CFGOBJDIR)/Qt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qt_cubin: Qt.cubin
+
+Qt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Rt: $(BINDIR)/Rt
+
+$(BINDIR)/Rt: $(CFGOBJDIR)/Rt/mummergpu.cu_o $(CFGOBJDIR)/Rt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rt_cubin: Rt.cubin
+
+Rt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRt: $(BINDIR)/QRt
+
+$(BINDIR)/QRt: $(CFGOBJDIR)/QRt/mummergpu.cu_o $(CFGOBJDIR)/QRt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRt_cubin: QRt.cubin
+
+QRt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Tt: $(BINDIR)/Tt
+
+$(BINDIR)/Tt: $(CFGOBJDIR)/Tt/mummergpu.cu_o $(CFGOBJDIR)/Tt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tt_cubin: Tt.cubin
+
+Tt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QTt: $(BINDIR)/QTt
+
+$(BINDIR)/QTt: $(CFGOBJDIR)/QTt/mummergpu.cu_o $(CFGOBJDIR)/QTt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTt_cubin: QTt.cubin
+
+QTt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+RTt: $(BINDIR)/RTt
+
+$(BINDIR)/RTt: $(CFGOBJDIR)/RTt/mummergpu.cu_o $(CFGOBJDIR)/RTt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTt_cubin: RTt.cubin
+
+RTt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRTt: $(BINDIR)/QRTt
+
+$(BINDIR)/QRTt: $(CFGOBJDIR)/QRTt/mummergpu.cu_o $(CFGOBJDIR)/QRTt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTt_cubin: QRTt.cubin
+
+QRTt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+mt: $(BINDIR)/mt
+
+$(BINDIR)/mt: $(CFGOBJDIR)/mt/mummergpu.cu_o $(CFGOBJDIR)/mt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mt_cubin: mt.cubin
+
+mt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Qmt: $(BINDIR)/Qmt
+
+$(BINDIR)/Qmt: $(CFGOBJDIR)/Qmt/mummergpu.cu_o $(CFGOBJDIR)/Qmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmt_cubin: Qmt.cubin
+
+Qmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Rmt: $(BINDIR)/Rmt
+
+$(BINDIR)/Rmt: $(CFGOBJDIR)/Rmt/mummergpu.cu_o $(CFGOBJDIR)/Rmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmt_cubin: Rmt.cubin
+
+Rmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRmt: $(BINDIR)/QRmt
+
+$(BINDIR)/QRmt: $(CFGOBJDIR)/QRmt/mummergpu.cu_o $(CFGOBJDIR)/QRmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmt_cubin: QRmt.cubin
+
+QRmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Tmt: $(BINDIR)/Tmt
+
+$(BINDIR)/Tmt: $(CFGOBJDIR)/Tmt/mummergpu.cu_o $(CFGOBJDIR)/Tmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmt_cubin: Tmt.cubin
+
+Tmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QTmt: $(BINDIR)/QTmt
+
+$(BINDIR)/QTmt: $(CFGOBJDIR)/QTmt/mummergpu.cu_o $(CFGOBJDIR)/QTmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmt_cubin: QTmt.cubin
+
+QTmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+RTmt: $(BINDIR)/RTmt
+
+$(BINDIR)/RTmt: $(CFGOBJDIR)/RTmt/mummergpu.cu_o $(CFGOBJDIR)/RTmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmt_cubin: RTmt.cubin
+
+RTmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRTmt: $(BINDIR)/QRTmt
+
+$(BINDIR)/QRTmt: $(CFGOBJDIR)/QRTmt/mummergpu.cu_o $(CFGOBJDIR)/QRTmt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmt_cubin: QRTmt.cubin
+
+QRTmt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+rt: $(BINDIR)/rt
+
+$(BINDIR)/rt: $(CFGOBJDIR)/rt/mummergpu.cu_o $(CFGOBJDIR)/rt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+rt_cubin: rt.cubin
+
+rt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Qrt: $(BINDIR)/Qrt
+
+$(BINDIR)/Qrt: $(CFGOBJDIR)/Qrt/mummergpu.cu_o $(CFGOBJDIR)/Qrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qrt_cubin: Qrt.cubin
+
+Qrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Rrt: $(BINDIR)/Rrt
+
+$(BINDIR)/Rrt: $(CFGOBJDIR)/Rrt/mummergpu.cu_o $(CFGOBJDIR)/Rrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rrt_cubin: Rrt.cubin
+
+Rrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRrt: $(BINDIR)/QRrt
+
+$(BINDIR)/QRrt: $(CFGOBJDIR)/QRrt/mummergpu.cu_o $(CFGOBJDIR)/QRrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRrt_cubin: QRrt.cubin
+
+QRrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Trt: $(BINDIR)/Trt
+
+$(BINDIR)/Trt: $(CFGOBJDIR)/Trt/mummergpu.cu_o $(CFGOBJDIR)/Trt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Trt_cubin: Trt.cubin
+
+Trt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QTrt: $(BINDIR)/QTrt
+
+$(BINDIR)/QTrt: $(CFGOBJDIR)/QTrt/mummergpu.cu_o $(CFGOBJDIR)/QTrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTrt_cubin: QTrt.cubin
+
+QTrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+RTrt: $(BINDIR)/RTrt
+
+$(BINDIR)/RTrt: $(CFGOBJDIR)/RTrt/mummergpu.cu_o $(CFGOBJDIR)/RTrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTrt_cubin: RTrt.cubin
+
+RTrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRTrt: $(BINDIR)/QRTrt
+
+$(BINDIR)/QRTrt: $(CFGOBJDIR)/QRTrt/mummergpu.cu_o $(CFGOBJDIR)/QRTrt/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/t/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTrt_cubin: QRTrt.cubin
+
+QRTrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+mrt: $(BINDIR)/mrt
+
+$(BINDIR)/mrt: $(CFGOBJDIR)/mrt/mummergpu.cu_o $(CFGOBJDIR)/mrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mrt_cubin: mrt.cubin
+
+mrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Qmrt: $(BINDIR)/Qmrt
+
+$(BINDIR)/Qmrt: $(CFGOBJDIR)/Qmrt/mummergpu.cu_o $(CFGOBJDIR)/Qmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmrt_cubin: Qmrt.cubin
+
+Qmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Rmrt: $(BINDIR)/Rmrt
+
+$(BINDIR)/Rmrt: $(CFGOBJDIR)/Rmrt/mummergpu.cu_o $(CFGOBJDIR)/Rmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmrt_cubin: Rmrt.cubin
+
+Rmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRmrt: $(BINDIR)/QRmrt
+
+$(BINDIR)/QRmrt: $(CFGOBJDIR)/QRmrt/mummergpu.cu_o $(CFGOBJDIR)/QRmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmrt_cubin: QRmrt.cubin
+
+QRmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+Tmrt: $(BINDIR)/Tmrt
+
+$(BINDIR)/Tmrt: $(CFGOBJDIR)/Tmrt/mummergpu.cu_o $(CFGOBJDIR)/Tmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmrt_cubin: Tmrt.cubin
+
+Tmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QTmrt: $(BINDIR)/QTmrt
+
+$(BINDIR)/QTmrt: $(CFGOBJDIR)/QTmrt/mummergpu.cu_o $(CFGOBJDIR)/QTmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmrt_cubin: QTmrt.cubin
+
+QTmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+RTmrt: $(BINDIR)/RTmrt
+
+$(BINDIR)/RTmrt: $(CFGOBJDIR)/RTmrt/mummergpu.cu_o $(CFGOBJDIR)/RTmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmrt_cubin: RTmrt.cubin
+
+RTmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+QRTmrt: $(BINDIR)/QRTmrt
+
+$(BINDIR)/QRTmrt: $(CFGOBJDIR)/QRTmrt/mummergpu.cu_o $(CFGOBJDIR)/QRTmrt/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mt/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmrt_cubin: QRTmrt.cubin
+
+QRTmrt.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=0
+
+n: $(BINDIR)/n
+
+$(BINDIR)/n: $(CFGOBJDIR)/n/mummergpu.cu_o $(CFGOBJDIR)/n/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+n_cubin: n.cubin
+
+n.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Qn: $(BINDIR)/Qn
+
+$(BINDIR)/Qn: $(CFGOBJDIR)/Qn/mummergpu.cu_o $(CFGOBJDIR)/Qn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qn_cubin: Qn.cubin
+
+Qn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Rn: $(BINDIR)/Rn
+
+$(BINDIR)/Rn: $(CFGOBJDIR)/Rn/mummergpu.cu_o $(CFGOBJDIR)/Rn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rn_cubin: Rn.cubin
+
+Rn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRn: $(BINDIR)/QRn
+
+$(BINDIR)/QRn: $(CFGOBJDIR)/QRn/mummergpu.cu_o $(CFGOBJDIR)/QRn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRn_cubin: QRn.cubin
+
+QRn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Tn: $(BINDIR)/Tn
+
+$(BINDIR)/Tn: $(CFGOBJDIR)/Tn/mummergpu.cu_o $(CFGOBJDIR)/Tn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tn_cubin: Tn.cubin
+
+Tn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QTn: $(BINDIR)/QTn
+
+$(BINDIR)/QTn: $(CFGOBJDIR)/QTn/mummergpu.cu_o $(CFGOBJDIR)/QTn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTn_cubin: QTn.cubin
+
+QTn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+RTn: $(BINDIR)/RTn
+
+$(BINDIR)/RTn: $(CFGOBJDIR)/RTn/mummergpu.cu_o $(CFGOBJDIR)/RTn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTn_cubin: RTn.cubin
+
+RTn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRTn: $(BINDIR)/QRTn
+
+$(BINDIR)/QRTn: $(CFGOBJDIR)/QRTn/mummergpu.cu_o $(CFGOBJDIR)/QRTn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTn_cubin: QRTn.cubin
+
+QRTn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+mn: $(BINDIR)/mn
+
+$(BINDIR)/mn: $(CFGOBJDIR)/mn/mummergpu.cu_o $(CFGOBJDIR)/mn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mn_cubin: mn.cubin
+
+mn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Qmn: $(BINDIR)/Qmn
+
+$(BINDIR)/Qmn: $(CFGOBJDIR)/Qmn/mummergpu.cu_o $(CFGOBJDIR)/Qmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmn_cubin: Qmn.cubin
+
+Qmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Rmn: $(BINDIR)/Rmn
+
+$(BINDIR)/Rmn: $(CFGOBJDIR)/Rmn/mummergpu.cu_o $(CFGOBJDIR)/Rmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmn_cubin: Rmn.cubin
+
+Rmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRmn: $(BINDIR)/QRmn
+
+$(BINDIR)/QRmn: $(CFGOBJDIR)/QRmn/mummergpu.cu_o $(CFGOBJDIR)/QRmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmn_cubin: QRmn.cubin
+
+QRmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Tmn: $(BINDIR)/Tmn
+
+$(BINDIR)/Tmn: $(CFGOBJDIR)/Tmn/mummergpu.cu_o $(CFGOBJDIR)/Tmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmn_cubin: Tmn.cubin
+
+Tmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QTmn: $(BINDIR)/QTmn
+
+$(BINDIR)/QTmn: $(CFGOBJDIR)/QTmn/mummergpu.cu_o $(CFGOBJDIR)/QTmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmn_cubin: QTmn.cubin
+
+QTmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+RTmn: $(BINDIR)/RTmn
+
+$(BINDIR)/RTmn: $(CFGOBJDIR)/RTmn/mummergpu.cu_o $(CFGOBJDIR)/RTmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmn_cubin: RTmn.cubin
+
+RTmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRTmn: $(BINDIR)/QRTmn
+
+$(BINDIR)/QRTmn: $(CFGOBJDIR)/QRTmn/mummergpu.cu_o $(CFGOBJDIR)/QRTmn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmn_cubin: QRTmn.cubin
+
+QRTmn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+rn: $(BINDIR)/rn
+
+$(BINDIR)/rn: $(CFGOBJDIR)/rn/mummergpu.cu_o $(CFGOBJDIR)/rn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+rn_cubin: rn.cubin
+
+rn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Qrn: $(BINDIR)/Qrn
+
+$(BINDIR)/Qrn: $(CFGOBJDIR)/Qrn/mummergpu.cu_o $(CFGOBJDIR)/Qrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qrn_cubin: Qrn.cubin
+
+Qrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Rrn: $(BINDIR)/Rrn
+
+$(BINDIR)/Rrn: $(CFGOBJDIR)/Rrn/mummergpu.cu_o $(CFGOBJDIR)/Rrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rrn_cubin: Rrn.cubin
+
+Rrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRrn: $(BINDIR)/QRrn
+
+$(BINDIR)/QRrn: $(CFGOBJDIR)/QRrn/mummergpu.cu_o $(CFGOBJDIR)/QRrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRrn_cubin: QRrn.cubin
+
+QRrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Trn: $(BINDIR)/Trn
+
+$(BINDIR)/Trn: $(CFGOBJDIR)/Trn/mummergpu.cu_o $(CFGOBJDIR)/Trn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Trn_cubin: Trn.cubin
+
+Trn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QTrn: $(BINDIR)/QTrn
+
+$(BINDIR)/QTrn: $(CFGOBJDIR)/QTrn/mummergpu.cu_o $(CFGOBJDIR)/QTrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTrn_cubin: QTrn.cubin
+
+QTrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+RTrn: $(BINDIR)/RTrn
+
+$(BINDIR)/RTrn: $(CFGOBJDIR)/RTrn/mummergpu.cu_o $(CFGOBJDIR)/RTrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTrn_cubin: RTrn.cubin
+
+RTrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRTrn: $(BINDIR)/QRTrn
+
+$(BINDIR)/QRTrn: $(CFGOBJDIR)/QRTrn/mummergpu.cu_o $(CFGOBJDIR)/QRTrn/mummergpu_main.cpp_o $(CFGOBJDIR)/CONTROL/mummergpu_gold.cpp_o $(CFGOBJDIR)/n/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTrn_cubin: QRTrn.cubin
+
+QRTrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+mrn: $(BINDIR)/mrn
+
+$(BINDIR)/mrn: $(CFGOBJDIR)/mrn/mummergpu.cu_o $(CFGOBJDIR)/mrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mrn_cubin: mrn.cubin
+
+mrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Qmrn: $(BINDIR)/Qmrn
+
+$(BINDIR)/Qmrn: $(CFGOBJDIR)/Qmrn/mummergpu.cu_o $(CFGOBJDIR)/Qmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmrn_cubin: Qmrn.cubin
+
+Qmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Rmrn: $(BINDIR)/Rmrn
+
+$(BINDIR)/Rmrn: $(CFGOBJDIR)/Rmrn/mummergpu.cu_o $(CFGOBJDIR)/Rmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmrn_cubin: Rmrn.cubin
+
+Rmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRmrn: $(BINDIR)/QRmrn
+
+$(BINDIR)/QRmrn: $(CFGOBJDIR)/QRmrn/mummergpu.cu_o $(CFGOBJDIR)/QRmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmrn_cubin: QRmrn.cubin
+
+QRmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+Tmrn: $(BINDIR)/Tmrn
+
+$(BINDIR)/Tmrn: $(CFGOBJDIR)/Tmrn/mummergpu.cu_o $(CFGOBJDIR)/Tmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmrn_cubin: Tmrn.cubin
+
+Tmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QTmrn: $(BINDIR)/QTmrn
+
+$(BINDIR)/QTmrn: $(CFGOBJDIR)/QTmrn/mummergpu.cu_o $(CFGOBJDIR)/QTmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmrn_cubin: QTmrn.cubin
+
+QTmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+RTmrn: $(BINDIR)/RTmrn
+
+$(BINDIR)/RTmrn: $(CFGOBJDIR)/RTmrn/mummergpu.cu_o $(CFGOBJDIR)/RTmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmrn_cubin: RTmrn.cubin
+
+RTmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+QRTmrn: $(BINDIR)/QRTmrn
+
+$(BINDIR)/QRTmrn: $(CFGOBJDIR)/QRTmrn/mummergpu.cu_o $(CFGOBJDIR)/QRTmrn/mummergpu_main.cpp_o $(CFGOBJDIR)/m/mummergpu_gold.cpp_o $(CFGOBJDIR)/mn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmrn_cubin: QRTmrn.cubin
+
+QRTmrn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=0 -DRENUMBER_TREE=1
+
+tn: $(BINDIR)/tn
+
+$(BINDIR)/tn: $(CFGOBJDIR)/tn/mummergpu.cu_o $(CFGOBJDIR)/tn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+tn_cubin: tn.cubin
+
+tn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Qtn: $(BINDIR)/Qtn
+
+$(BINDIR)/Qtn: $(CFGOBJDIR)/Qtn/mummergpu.cu_o $(CFGOBJDIR)/Qtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qtn_cubin: Qtn.cubin
+
+Qtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Rtn: $(BINDIR)/Rtn
+
+$(BINDIR)/Rtn: $(CFGOBJDIR)/Rtn/mummergpu.cu_o $(CFGOBJDIR)/Rtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rtn_cubin: Rtn.cubin
+
+Rtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRtn: $(BINDIR)/QRtn
+
+$(BINDIR)/QRtn: $(CFGOBJDIR)/QRtn/mummergpu.cu_o $(CFGOBJDIR)/QRtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRtn_cubin: QRtn.cubin
+
+QRtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Ttn: $(BINDIR)/Ttn
+
+$(BINDIR)/Ttn: $(CFGOBJDIR)/Ttn/mummergpu.cu_o $(CFGOBJDIR)/Ttn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Ttn_cubin: Ttn.cubin
+
+Ttn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QTtn: $(BINDIR)/QTtn
+
+$(BINDIR)/QTtn: $(CFGOBJDIR)/QTtn/mummergpu.cu_o $(CFGOBJDIR)/QTtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTtn_cubin: QTtn.cubin
+
+QTtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+RTtn: $(BINDIR)/RTtn
+
+$(BINDIR)/RTtn: $(CFGOBJDIR)/RTtn/mummergpu.cu_o $(CFGOBJDIR)/RTtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTtn_cubin: RTtn.cubin
+
+RTtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRTtn: $(BINDIR)/QRTtn
+
+$(BINDIR)/QRTtn: $(CFGOBJDIR)/QRTtn/mummergpu.cu_o $(CFGOBJDIR)/QRTtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTtn_cubin: QRTtn.cubin
+
+QRTtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+mtn: $(BINDIR)/mtn
+
+$(BINDIR)/mtn: $(CFGOBJDIR)/mtn/mummergpu.cu_o $(CFGOBJDIR)/mtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mtn_cubin: mtn.cubin
+
+mtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Qmtn: $(BINDIR)/Qmtn
+
+$(BINDIR)/Qmtn: $(CFGOBJDIR)/Qmtn/mummergpu.cu_o $(CFGOBJDIR)/Qmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmtn_cubin: Qmtn.cubin
+
+Qmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Rmtn: $(BINDIR)/Rmtn
+
+$(BINDIR)/Rmtn: $(CFGOBJDIR)/Rmtn/mummergpu.cu_o $(CFGOBJDIR)/Rmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmtn_cubin: Rmtn.cubin
+
+Rmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRmtn: $(BINDIR)/QRmtn
+
+$(BINDIR)/QRmtn: $(CFGOBJDIR)/QRmtn/mummergpu.cu_o $(CFGOBJDIR)/QRmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmtn_cubin: QRmtn.cubin
+
+QRmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Tmtn: $(BINDIR)/Tmtn
+
+$(BINDIR)/Tmtn: $(CFGOBJDIR)/Tmtn/mummergpu.cu_o $(CFGOBJDIR)/Tmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmtn_cubin: Tmtn.cubin
+
+Tmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QTmtn: $(BINDIR)/QTmtn
+
+$(BINDIR)/QTmtn: $(CFGOBJDIR)/QTmtn/mummergpu.cu_o $(CFGOBJDIR)/QTmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmtn_cubin: QTmtn.cubin
+
+QTmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+RTmtn: $(BINDIR)/RTmtn
+
+$(BINDIR)/RTmtn: $(CFGOBJDIR)/RTmtn/mummergpu.cu_o $(CFGOBJDIR)/RTmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmtn_cubin: RTmtn.cubin
+
+RTmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRTmtn: $(BINDIR)/QRTmtn
+
+$(BINDIR)/QRTmtn: $(CFGOBJDIR)/QRTmtn/mummergpu.cu_o $(CFGOBJDIR)/QRTmtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmtn_cubin: QRTmtn.cubin
+
+QRTmtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=0 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+rtn: $(BINDIR)/rtn
+
+$(BINDIR)/rtn: $(CFGOBJDIR)/rtn/mummergpu.cu_o $(CFGOBJDIR)/rtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+rtn_cubin: rtn.cubin
+
+rtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Qrtn: $(BINDIR)/Qrtn
+
+$(BINDIR)/Qrtn: $(CFGOBJDIR)/Qrtn/mummergpu.cu_o $(CFGOBJDIR)/Qrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qrtn_cubin: Qrtn.cubin
+
+Qrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Rrtn: $(BINDIR)/Rrtn
+
+$(BINDIR)/Rrtn: $(CFGOBJDIR)/Rrtn/mummergpu.cu_o $(CFGOBJDIR)/Rrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rrtn_cubin: Rrtn.cubin
+
+Rrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRrtn: $(BINDIR)/QRrtn
+
+$(BINDIR)/QRrtn: $(CFGOBJDIR)/QRrtn/mummergpu.cu_o $(CFGOBJDIR)/QRrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRrtn_cubin: QRrtn.cubin
+
+QRrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Trtn: $(BINDIR)/Trtn
+
+$(BINDIR)/Trtn: $(CFGOBJDIR)/Trtn/mummergpu.cu_o $(CFGOBJDIR)/Trtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Trtn_cubin: Trtn.cubin
+
+Trtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QTrtn: $(BINDIR)/QTrtn
+
+$(BINDIR)/QTrtn: $(CFGOBJDIR)/QTrtn/mummergpu.cu_o $(CFGOBJDIR)/QTrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTrtn_cubin: QTrtn.cubin
+
+QTrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+RTrtn: $(BINDIR)/RTrtn
+
+$(BINDIR)/RTrtn: $(CFGOBJDIR)/RTrtn/mummergpu.cu_o $(CFGOBJDIR)/RTrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTrtn_cubin: RTrtn.cubin
+
+RTrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRTrtn: $(BINDIR)/QRTrtn
+
+$(BINDIR)/QRTrtn: $(CFGOBJDIR)/QRTrtn/mummergpu.cu_o $(CFGOBJDIR)/QRTrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/t/mummergpu_gold.cpp_o $(CFGOBJDIR)/tn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTrtn_cubin: QRTrtn.cubin
+
+QRTrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=0 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+mrtn: $(BINDIR)/mrtn
+
+$(BINDIR)/mrtn: $(CFGOBJDIR)/mrtn/mummergpu.cu_o $(CFGOBJDIR)/mrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+mrtn_cubin: mrtn.cubin
+
+mrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Qmrtn: $(BINDIR)/Qmrtn
+
+$(BINDIR)/Qmrtn: $(CFGOBJDIR)/Qmrtn/mummergpu.cu_o $(CFGOBJDIR)/Qmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Qmrtn_cubin: Qmrtn.cubin
+
+Qmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Rmrtn: $(BINDIR)/Rmrtn
+
+$(BINDIR)/Rmrtn: $(CFGOBJDIR)/Rmrtn/mummergpu.cu_o $(CFGOBJDIR)/Rmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Rmrtn_cubin: Rmrtn.cubin
+
+Rmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRmrtn: $(BINDIR)/QRmrtn
+
+$(BINDIR)/QRmrtn: $(CFGOBJDIR)/QRmrtn/mummergpu.cu_o $(CFGOBJDIR)/QRmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRmrtn_cubin: QRmrtn.cubin
+
+QRmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=0 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+Tmrtn: $(BINDIR)/Tmrtn
+
+$(BINDIR)/Tmrtn: $(CFGOBJDIR)/Tmrtn/mummergpu.cu_o $(CFGOBJDIR)/Tmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+Tmrtn_cubin: Tmrtn.cubin
+
+Tmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QTmrtn: $(BINDIR)/QTmrtn
+
+$(BINDIR)/QTmrtn: $(CFGOBJDIR)/QTmrtn/mummergpu.cu_o $(CFGOBJDIR)/QTmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QTmrtn_cubin: QTmrtn.cubin
+
+QTmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=0 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+RTmrtn: $(BINDIR)/RTmrtn
+
+$(BINDIR)/RTmrtn: $(CFGOBJDIR)/RTmrtn/mummergpu.cu_o $(CFGOBJDIR)/RTmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+RTmrtn_cubin: RTmrtn.cubin
+
+RTmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=0 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
+
+QRTmrtn: $(BINDIR)/QRTmrtn
+
+$(BINDIR)/QRTmrtn: $(CFGOBJDIR)/QRTmrtn/mummergpu.cu_o $(CFGOBJDIR)/QRTmrtn/mummergpu_main.cpp_o $(CFGOBJDIR)/mt/mummergpu_gold.cpp_o $(CFGOBJDIR)/mtn/suffix-tree.cpp_o $(CFGOBJDIR)/CONTROL/PoolMalloc.cpp_o
+	@mkdir -p $(@D)
+	$(LINK) -o $@ $^ $(LIB)
+
+QRTmrtn_cubin: QRTmrtn.cubin
+
+QRTmrtn.cubin: mummergpu.cu mummergpu_kernel.cu mummergpu.h common.cu PoolMalloc.hh
+	$(NVCC) -o $@ -cubin $< $(NVCCFLAGS) -DQRYTEX=1 -DREFTEX=1 -DTREETEX=1 -DMERGETEX=1 -DREORDER_REF=1 -DREORDER_TREE=1 -DRENUMBER_TREE=1
 
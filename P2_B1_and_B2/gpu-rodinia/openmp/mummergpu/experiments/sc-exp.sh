@@ -3,21 +3,28 @@
 BINDIR=/fs/szdevel/cole/mummergpu/trunk/mummergpu/bin/linux32/release
 DATADIR=/tmp/cole
 OUTDIR=/tmp/cole/exp_out
+EXPDIR=$(cd $(dirname $0) && pwd)
+# Match output is hashed as it streams out of mummergpu instead of being written to $OUTDIR
+VERIFY="python3 $EXPDIR/../src/verify_stream.py"
 
-# Run a single configuration of MUMmerGPU
+# Run a single configuration of MUMmerGPU; an optional 6th argument tags
+# a replicate run (CONTROL-2) so it does not overwrite the first one
 run_mummergpu () {
 	BIN=$1
 	REF=$2
 	QRY=$3
 	MINMATCH=$4
 	ORG=$5
-	cmd="$BINDIR/$BIN -s $ORG.$BIN.$REF.$MINMATCH.$QRY.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY > $OUTDIR/$ORG/$BIN.out 2>/dev/null"
+	RUN=$BIN${6:+-$6}
+	cmd="$BINDIR/$BIN -s $ORG.$RUN.$REF.$MINMATCH.$QRY.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY 2>/dev/null | $VERIFY ..."
 	echo $cmd
-	$BINDIR/$BIN -s $ORG.$BIN.$REF.$MINMATCH.$QRY.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY > $OUTDIR/$ORG/$BIN.out 2>/dev/null
 	
-	# Checksum the output and then remove it so we don't fill the disk
-	md5sum $OUTDIR/$ORG/$BIN.out > $OUTDIR/$ORG/$BIN.md5sum
-	rm $OUTDIR/$ORG/$BIN.out
+	# Checksum the output as it streams (it never touches the disk), check it
+	# against the digests of the previous run and keep the match histograms
+	mkdir -p $OUTDIR/$ORG
+	$BINDIR/$BIN -s $ORG.$RUN.$REF.$MINMATCH.$QRY.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY 2>/dev/null \
+		| $VERIFY --name $OUTDIR/$ORG/$BIN.out --check $ORG.$REF.$QRY.$MINMATCH.md5 \
+		          --stats $OUTDIR/$ORG/$RUN.matches > $OUTDIR/$ORG/$RUN.md5sum
 }
 
 # Run all configs on a given data set, and then check that the output
@@ -158,6 +165,16 @@ run_all_configs () {
 	run_mummergpu RTmrtn $REF $QRY $MINMATCH $ORG
 	run_mummergpu QRTmrtn $REF $QRY $MINMATCH $ORG
 
+	collect_allstats $ORG $REF $QRY $MINMATCH
+}
+
+# Merge the md5sums and the per-run stats files of run_mummergpu into
+# $ORG.$REF.$QRY.$MINMATCH.md5 and .allstats
+collect_allstats () {
+	ORG=$1
+	REF=$2
+	QRY=$3
+	MINMATCH=$4
 	
 	# # Collect the individual md5sums in one place
 	cat $OUTDIR/$ORG/*.md5sum > $ORG.$REF.$QRY.$MINMATCH.md5
@@ -179,6 +196,20 @@ run_all_configs () {
 	
 }
 
+# Run only the configurations of the fractional factorial design written by
+# doe.py (doe_cmds.sh; build them with make doe), then analyze the
+# .allstats with doe.py analyze
+run_doe_configs () {
+	ORG=$1
+	REF=$2
+	QRY=$3
+	MINMATCH=$4
+	
+	. $EXPDIR/doe_cmds.sh
+	
+	collect_allstats $ORG $REF $QRY $MINMATCH
+}
+
 run_increasing_length_config()
 {
 	ORG=anthrax
@@ -200,13 +231,14 @@ run_mummergpu_C () {
 	QRY=$3
 	MINMATCH=$4
 	ORG=$5
-	cmd="$BINDIR/$BIN -C -s $ORG.$BIN.$QRY.C.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY > $OUTDIR/$ORG/$BIN.out 2>/dev/null"
+	cmd="$BINDIR/$BIN -C -s $ORG.$BIN.$QRY.C.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY 2>/dev/null | $VERIFY ..."
 	echo $cmd
-	$BINDIR/$BIN -C -s $ORG.$BIN.$QRY.C.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY > $OUTDIR/$ORG/$BIN.out 2>/dev/null
 	
-	# Checksum the output and then remove it so we don't fill the disk
-	md5sum $OUTDIR/$ORG/$BIN.out > $OUTDIR/$ORG/$BIN.md5sum
-	rm $OUTDIR/$ORG/$BIN.out
+	# Checksum the output as it streams, as in run_mummergpu
+	mkdir -p $OUTDIR/$ORG
+	$BINDIR/$BIN -C -s $ORG.$BIN.$QRY.C.stats -l $MINMATCH $DATADIR/$ORG/$REF $DATADIR/$ORG/$QRY 2>/dev/null \
+		| $VERIFY --name $OUTDIR/$ORG/$BIN.out --check $ORG.$REF.$QRY.$MINMATCH.md5 \
+		          --stats $OUTDIR/$ORG/$BIN.C.matches > $OUTDIR/$ORG/$BIN.md5sum
 }
 
 
@@ -358,6 +390,8 @@ run_end_to_end
 
 #run_all_configs cbriggsae cleanref.fna half_million_reads.fna 100
 
+#run_doe_configs lmonocytogenes cleanref.fna million_reads.fna 20
+
 #run_increasing_length
 
 #run_cpu_configs h_sapiens two_pages.fna million_reads.fna 15
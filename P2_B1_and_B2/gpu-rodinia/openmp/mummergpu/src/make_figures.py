@@ -1,171 +1,175 @@
-#!/fs/sz-user-supported/Linux-i686/bin/python2.5
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+make_figures.py
+
+Report figures from every collected statistics file: a stacked bar chart of
+time per phase category for each dataset (one bar per configuration, CPU
+runs marked), and the kernel speedup against query length from
+mummergpu_exp.py's speedup.out files.
+
+Statistics files are found and parsed by results_db.py (.allstats, -s
+.stats files and runs.csv, backup/ directories skipped); phases are summed
+into categories with one pandas groupby, and figures are drawn in parallel
+on a process pool with the non-interactive Agg backend.
+
+	python3 make_figures.py                        # ../experiments and the trial directories here
+	python3 make_figures.py -o figures --format png ../experiments/e2e
+"""
+
+import argparse
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib
-matplotlib.use('PS')
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import results_db  # noqa: E402
 
-import pylab
-import csv
+EXPERIMENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "experiments")
 
-def get_stats(filename):
-	stats = {}
-	statfile = open(filename)
-	stats = dict([(key, float(value)) for (key, value) in csv.reader(statfile)])
-	return stats
+# results_db phase columns by category, bottom of the stack first
+CATEGORIES = [(label, cols) for _, label, cols in results_db.PHASE_CATEGORIES]
+COLORS = ["#D2B48C", "#90EE90", "#1E90FF", "#FF4500", "#FFD700"]
 
-from pylab import arange,pi,sin,cos,sqrt
+DATASET_LABELS = {
+	"cbriggsae": "C. briggsae",
+	"lmonocytogenes": "L. monocytogenes",
+	"s_suis": "S. suis",
+	"h_sapiens": "H. sapiens",
+	"anthrax": "B. anthracis",
+}
 
-def set_figure_props():
+def set_figure_props(bars=3, usetex=False):
 	fig_width_pt = 225.0  # Get this from LaTeX using \showthe\columnwidth
 	inches_per_pt = 1.0/72.27               # Convert pt to inch
-	golden_mean = (sqrt(5)-1.0)/2.0         # Aesthetic ratio
-	fig_width = fig_width_pt*inches_per_pt  # width in inches
-	fig_height = 1.5*fig_width*golden_mean      # height in inches
-	fig_size =  [fig_width,fig_height]
-	params = {'backend': 'ps',
-			  'axes.labelsize': 8,
-			  'axes.linewidth': 0.5,
-			  'text.fontsize': 8,
-			  'xtick.labelsize': 7,
-			  'ytick.labelsize': 7,
-			  'legend.fontsize': 7,
-			  'legend.linewidth':0.5,
-			  'title.fontsize' : 8,
-			  'text.usetex': True,
-			  'figure.figsize': fig_size}
-	pylab.rcParams.update(params)
-
-def draw_speedup_figures(outfile, fig_title):
-	query_lens = []
-	app_speedups = []
-	kernel_speedups = []
-	f = open(outfile)
-	headers = f.next()
-	headers = headers.strip()
-	headers = headers.split(',')
-	
-	query_col = headers.index("QUERY")
-	kernel_col = headers.index("KERNEL_SPEEDUP")
-	mummer_speed_col = headers.index("MUMMER_SPEEDUP")
-	
-	for vals in csv.reader(f, 'excel', delimiter=' '):
-		query_lens.append(int(vals[query_col]))
-		app_speedups.append(float(vals[mummer_speed_col]))
-		kernel_speedups.append(float(vals[kernel_col]))
-		
-	draw_speedup_fig(query_lens,
-					 kernel_speedups,
-					 fig_title,
-					 outfile + ".kernel_speedup.eps")
-
-def draw_speedup_fig(x, y, fig_title, filename):
-	set_figure_props()
-	ax = pylab.subplot(111)
-	
-	pylab.semilogx(x, y, linestyle=':', marker='v', basex=2)
-
-	pylab.xticks(x)
-	frm = pylab.FormatStrFormatter("%d")
-	ax.xaxis.set_major_formatter(frm)
-
+	golden_mean = (np.sqrt(5)-1.0)/2.0      # Aesthetic ratio
+	fig_width = max(fig_width_pt*inches_per_pt, 0.12*bars)  # width in inches, wider for many bars
+	fig_height = 1.5*fig_width_pt*inches_per_pt*golden_mean      # height in inches
+	plt.rcParams.update({
+		"axes.labelsize": 8,
+		"axes.linewidth": 0.5,
+		"font.size": 8,
+		"xtick.labelsize": 7,
+		"ytick.labelsize": 7,
+		"legend.fontsize": 7,
+		"axes.titlesize": 8,
+		"text.usetex": usetex,
+		"figure.figsize": [fig_width, fig_height],
+	})
+
+def load_runs(paths):
+	"""Every run found below paths, as a DataFrame of results_db's runs table."""
+	db = results_db.connect(":memory:")
+	for path in paths:
+		results_db.import_path(db, path)
+	return pd.read_sql_query("SELECT * FROM runs", db)
+
+def category_times(runs):
+	"""
+	Seconds per phase category, one row per (dataset, query, min match,
+	configuration, CPU or GPU), repetitions averaged.
+	"""
+	mapping = dict((col, category) for category, cols in CATEGORIES for col in cols)
+	keys = ["dataset", "query", "min_match", "config", "on_cpu"]
+	phases = runs[keys + list(mapping)].groupby(keys, dropna=False).mean()
+	times = phases.T.groupby(pd.Series(mapping)).sum(min_count=1).T / 1000.0
+	times = times[[category for category, _ in CATEGORIES if category in times]]
+	times["total"] = runs.groupby(keys, dropna=False)["total"].mean() / 1000.0
+	return times.dropna(how="all", subset=[category for category, _ in CATEGORIES if category in times])
+
+def figure_jobs(times, outdir, fmt):
+	"""(title, per-configuration times, file name) for every dataset, query and min match length."""
+	jobs = []
+	for (dataset, query, min_match), group in times.groupby(level=["dataset", "query", "min_match"], dropna=False):
+		group = group.droplevel(["dataset", "query", "min_match"]).sort_values("total")
+		group.index = ["%s%s" % (config, on_cpu and " (CPU)" or "") for config, on_cpu in group.index]
+		query = pd.notna(query) and query or None
+		min_match = pd.notna(min_match) and "%d" % min_match or None
+		details = ", ".join(x for x in (query, min_match and "l=" + min_match) if x)
+		title = DATASET_LABELS.get(dataset, dataset) + (details and " (%s)" % details or "")
+		name = ".".join(x for x in ("time_breakout", dataset, query, min_match, fmt) if x)
+		jobs.append((title, group, os.path.join(outdir, name)))
+	return jobs
+
+def draw_time_breakout(title, group, filename, usetex=False):
+	set_figure_props(len(group), usetex)
+	fig, ax = plt.subplots()
+	ind = np.arange(len(group))
+	bottom = np.zeros(len(group))
+	categories = [c for c in group.columns if c != "total"]
+	for category, color in zip(categories, COLORS):
+		series = group[category].fillna(0).to_numpy()
+		ax.bar(ind, series, 0.7, bottom=bottom, color=color, label=category, linewidth=0)
+		bottom += series
+	ax.set_xticks(ind)
+	ax.set_xticklabels(group.index, rotation=90)
+	ax.set_xlim(-0.5, len(group) - 0.5)
+	ax.set_ylabel("time (s)")
+	ax.set_title("Time spent by phase in MUMmerGPU\n%s" % title, fontsize=9)
+	handles, labels = ax.get_legend_handles_labels()
+	ax.legend(handles[::-1], labels[::-1])
+	fig.tight_layout()
+	fig.savefig(filename)
+	plt.close(fig)
+	return filename
+
+def draw_speedup_figures(outfile, fig_title, filename, usetex=False):
+	"""Kernel speedup against query length from a speedup.out (comma header, space separated rows)."""
+	with open(outfile) as f:
+		headers = f.readline().strip().split(",")
+		data = pd.read_csv(f, sep=" ", names=headers, index_col=False)
+	data = data[pd.to_numeric(data["QUERY"], errors="coerce").notna()]
+	if data.empty:
+		return None
+	x = data["QUERY"].astype(int)
+	set_figure_props(usetex=usetex)
+	fig, ax = plt.subplots()
+	ax.plot(x, data["KERNEL_SPEEDUP"], linestyle=":", marker="v")
+	ax.set_xscale("log", base=2)
+	ax.set_xticks(x)
+	ax.xaxis.set_major_formatter(matplotlib.ticker.FormatStrFormatter("%d"))
 	ax.xaxis.grid(True, which="minor")
-	pylab.xlabel("Query length (bp - log scale)")
-	pylab.ylabel("Speedup")
-	pylab.title(fig_title, fontsize=9)
-
-	pylab.savefig(filename)
-	pylab.close()
-	
-def make_time_breakout():
-	statfiles = ["cbriggsae/cleanreads.fna-100.gpustats",
-				 "lmonocytogenes/cleanreads.fna-20.gpustats",
-				 "s_suis/cleanreads.fna-20.gpustats"
-				 ]
-	
-	labels = [ "\emph{C. briggsae}",
-			   "\emph{L. monocytogenes}",
-			  "\emph{S. suis} "
-			  ]
-	
-	stats = {}
-	convert_to_seconds = ["Total",
-						  "Kernel",
-						  "Print matches",
-						  "Copy queries to GPU",
-						  "Copy output from GPU",
-						  "Copy suffix tree to GPU",
-						  "Read queries from disk",
-						  "Suffix tree constructions"]
-	
-	for f in statfiles:
-		f_stats = get_stats(f)
-		for (key, value) in f_stats.iteritems():
-			
-			if key in convert_to_seconds:
-				val = value / 1000.0 #float( value/f_stats["TOTAL"]
-			else:
-				val = int(value)
-			if key in stats:
-				stats[key].append(val)
-			else:
-				stats[key] = [val]			
-	
-	ind = arange(0,3.6,1.2 )    # the x locations for the groups
-
-	width = 0.35       # the width of the bars: can also be len(x) sequence
-	
-	i = 0	
-## colors = [ "#e31a1c",
-## 		   "#377db8",
-## 		   "#4daf4a",
-## 		   "#984ea3",
-## 		   "#ffff33",
-## 		   "#ff7f00"]
-	
-	colors = [ "#FF4500",
-			   "#1E90FF",
-			   "#90EE90",
-			   "#FFD700",
-			   "#DA70D6",
-			   "#D2B48C"]
-
-	set_figure_props()
-	pylab.subplot(111)
-	transfer = []
-	for j in range(0, len(statfiles)):
-		transfer.append( stats["Copy suffix tree to GPU"][j] + stats["Copy output from GPU"][j] + stats["Copy queries to GPU"][j])
-
-	stats["Data transfer to GPU"] = transfer
-	
-	del stats["Copy suffix tree to GPU"]
-	del stats["Copy output from GPU"]
-	del stats["Copy queries to GPU"]
-
-	del stats["Total"]
-	
-	lengths = stats["Minimum substring length"]
-	
-	del stats["Minimum substring length"]
-	del stats["Average query length"]
-
-
-	plots = []
-	running_totals = [0 for j in range(0,len(statfiles))]
-	for (category, series) in stats.iteritems():
-		plots.append(pylab.bar(ind, series, width, color=colors[i], bottom=running_totals))
-		running_totals = [running_totals[j] + series[j] for j in range(0, len(series))]
-		i += 1
-	
-	#pylab.xticks(ind+width/2., labels )
-	pylab.xticks(ind +width/2., labels )
-	
-
-	pylab.title("Time spent by phase in MUMmerGPU", fontsize=9)
-	pylab.ylabel("time (s)")
-	pylab.xlim(-width,len(ind))
-	pylab.ylim(0, 600)
-	pylab.legend( [p[0] for p in reversed(plots)], [key for key in reversed(stats.keys())] )
-	
-	pylab.savefig('time_breakout.eps')
-	pylab.close()
-
-make_time_breakout()
-draw_speedup_figures("anthrax/speedup.out", "Kernel speedup, GPU vs. CPU")
+	ax.set_xlabel("Query length (bp - log scale)")
+	ax.set_ylabel("Speedup")
+	ax.set_title(fig_title, fontsize=9)
+	fig.tight_layout()
+	fig.savefig(filename)
+	plt.close(fig)
+	return filename
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="MUMmerGPU report figures from every collected statistics file")
+	parser.add_argument("paths", nargs="*", help="files or directories to search (default: ../experiments and .)")
+	parser.add_argument("-o", "--outdir", default=".")
+	parser.add_argument("--format", default="eps", help="figure format (default eps)")
+	parser.add_argument("-j", "--jobs", type=int, default=None, help="rendering processes (default: all CPUs)")
+	parser.add_argument("--usetex", action="store_true", help="typeset text with LaTeX")
+	args = parser.parse_args()
+
+	paths = args.paths or [EXPERIMENTS, "."]
+	os.makedirs(args.outdir, exist_ok=True)
+	times = category_times(load_runs(paths))
+	jobs = figure_jobs(times, args.outdir, args.format)
+	speedups = [path for base in paths if os.path.isdir(base)
+	            for path in glob.glob(os.path.join(base, "*", "speedup.out"))]
+
+	with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+		futures = [pool.submit(draw_time_breakout, title, group, filename, args.usetex)
+		           for title, group, filename in jobs]
+		futures += [pool.submit(draw_speedup_figures, path, "Kernel speedup, GPU vs. CPU",
+		                        os.path.join(args.outdir, "%s.kernel_speedup.%s"
+		                                     % (os.path.basename(os.path.dirname(os.path.abspath(path))), args.format)),
+		                        args.usetex)
+		            for path in speedups]
+		for future in futures:
+			filename = future.result()
+			if filename:
+				print(filename, file=sys.stderr)
+	print("%d figures from %d runs" % (len(futures), len(times)), file=sys.stderr)
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+mem_baseline.py
+
+Pure NumPy maximal exact match (MEM) finder, a stand-in for `mummer -maxmatch`
+where neither MUMmer nor a GPU is available.
+
+The reference gets a suffix array built by vectorized prefix doubling; the
+rank arrays of every doubling step then give the LCP of neighbouring
+suffixes by binary lifting. For every query position with at least -l bases
+left, a vectorized binary search over the suffix array (comparing 8 bases
+per 64-bit word) finds the first suffix starting with the next -l bases, and
+the LCP array the end of that run of suffixes. Candidates that extend to
+the left are dropped; the rest are extended to the right and reported.
+Queries are processed in chunks by a pool of worker processes.
+
+Output is MUMmer's: "> query" (and "> query Reverse" with -b / -r) followed
+by "ref_pos  qry_pos  length" rows, 1-based, ordered by query then
+reference position; reverse matches are relative to the reverse complement.
+
+	python3 mem_baseline.py -maxmatch -l 2 ../data/shortref.fa ../data/shortqry.fa
+	python3 mem_baseline.py -l 20 -b ref.fna reads.fna --check reads.fna-gpu.out
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+
+# Query bases per work unit
+CHUNK_BASES = 1 << 20
+COMPLEMENT = bytes.maketrans(b"ACGTUNacgtun", b"TGCAANtgcaan")
+
+# Set in the parent before the worker pool forks, so workers share it
+INDEX = None
+
+
+def read_fasta(path):
+	"""(name, sequence) records; names are the first word of the header, sequences upper-case bytes."""
+	with open(path, "rb") as f:
+		data = f.read()
+	records = []
+	for block in data.split(b"\n>"):
+		header, _, seq = block.lstrip(b">").partition(b"\n")
+		if not header and not seq:
+			continue
+		name = header.split()
+		records.append((name and name[0].decode() or "", seq.replace(b"\n", b"").replace(b"\r", b"").upper()))
+	return records
+
+def ragged_arange(starts, lengths):
+	"""Concatenation of arange(s, s + l) for every (s, l)."""
+	ends = np.cumsum(lengths)
+	return np.repeat(starts - (ends - lengths), lengths) + np.arange(ends[-1] if len(ends) else 0)
+
+def packed_words(text, pad):
+	"""words[i] = text[i:i+8] as a big-endian uint64 (zero padded), for i in 0..len(text)."""
+	padded = np.concatenate((text, np.zeros(pad + 8, dtype=np.uint8))).astype(np.uint64)
+	words = np.zeros(len(text) + pad + 1, dtype=np.uint64)
+	for b in range(8):
+		words |= padded[b:b + len(words)] << np.uint64(56 - 8 * b)
+	return words
+
+def equal_prefix_bytes(a, b):
+	"""Number of leading equal bytes (0-8) of two uint64 word arrays."""
+	x = a ^ b
+	return sum(((x >> np.uint64(64 - 8 * k)) == 0).astype(np.int64) for k in range(1, 8)) + (x == 0)
+
+def suffix_array(text):
+	"""
+	Suffix array by prefix doubling, plus levels[k]: the rank of text[i:i+2^k]
+	among all such substrings (equal substrings share a rank).
+	"""
+	n = len(text)
+	rank = np.unique(text, return_inverse=True)[1].astype(np.int64).ravel()
+	levels = [rank.astype(np.int32)]
+	sa = np.argsort(rank, kind="stable")
+	k = 1
+	while n and rank.max() < n - 1:
+		second = np.full(n, -1, dtype=np.int64)
+		second[:n - k] = rank[k:]
+		key = rank * (n + 1) + second + 1
+		sa = np.argsort(key, kind="stable")
+		sorted_key = key[sa]
+		rank = np.empty(n, dtype=np.int64)
+		rank[sa] = np.concatenate(([0], np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+		levels.append(rank.astype(np.int32))
+		k *= 2
+	return sa, levels
+
+def lcp_array(sa, levels):
+	"""lcp[j] = longest common prefix of suffixes sa[j-1] and sa[j] (lcp[0] = 0), by binary lifting."""
+	n = len(sa)
+	a, b = sa[:-1].astype(np.int64), sa[1:].astype(np.int64)
+	lcp = np.zeros(max(n - 1, 0), dtype=np.int64)
+	for k in range(len(levels) - 1, -1, -1):
+		i, j = a + lcp, b + lcp
+		ok = (i < n) & (j < n)
+		same = ok & (levels[k][np.minimum(i, n - 1)] == levels[k][np.minimum(j, n - 1)])
+		lcp += same.astype(np.int64) << k
+	return np.concatenate(([0], lcp))
+
+class ReferenceIndex:
+	"""Suffix array, LCP array and packed words of a reference, for one minimum match length."""
+
+	def __init__(self, seq, min_match):
+		self.text = np.frombuffer(seq, dtype=np.uint8)
+		self.n = len(self.text)
+		self.min_match = min_match
+		self.nwords = -(-min_match // 8)
+		self.sa, levels = suffix_array(self.text)
+		self.lcp = lcp_array(self.sa, levels)
+		# Suffix runs sharing min_match bases end where the LCP drops below it
+		self.run_breaks = np.flatnonzero(self.lcp < min_match)
+		self.words = packed_words(self.text, 8 * self.nwords)
+
+	def compare(self, pattern_words, suffixes):
+		"""Sign of pattern - suffix over the first min_match bases, per row."""
+		result = np.zeros(len(suffixes), dtype=np.int64)
+		open_ = np.ones(len(suffixes), dtype=bool)
+		last_bytes = self.min_match - 8 * (self.nwords - 1)
+		last_mask = np.uint64(((1 << (8 * last_bytes)) - 1) << (64 - 8 * last_bytes))
+		for t in range(self.nwords):
+			p = pattern_words[:, t]
+			s = self.words[suffixes + 8 * t]
+			if t == self.nwords - 1:
+				s = s & last_mask
+			diff = (p > s).astype(np.int64) - (p < s)
+			result[open_] = diff[open_]
+			open_ &= diff == 0
+		return result
+
+	def find(self, qry, qry_words, positions):
+		"""Suffix array run [lo, hi) of suffixes starting with qry[p:p+min_match], per position (hi = lo if none)."""
+		pattern = np.stack([qry_words[positions + 8 * t] for t in range(self.nwords)], axis=1)
+		last_bytes = self.min_match - 8 * (self.nwords - 1)
+		pattern[:, -1] &= np.uint64(((1 << (8 * last_bytes)) - 1) << (64 - 8 * last_bytes))
+		lo = np.zeros(len(positions), dtype=np.int64)
+		hi = np.full(len(positions), self.n, dtype=np.int64)
+		while True:
+			active = np.flatnonzero(lo < hi)
+			if not len(active):
+				break
+			mid = (lo[active] + hi[active]) // 2
+			above = self.compare(pattern[active], self.sa[mid]) > 0
+			lo[active[above]] = mid[above] + 1
+			hi[active[~above]] = mid[~above]
+		found = lo < self.n
+		found[found] = self.compare(pattern[found], self.sa[lo[found]]) == 0
+		end = np.full(len(positions), self.n, dtype=np.int64)
+		nxt = np.searchsorted(self.run_breaks, lo, side="right")
+		has_next = nxt < len(self.run_breaks)
+		end[has_next] = self.run_breaks[nxt[has_next]]
+		return lo, np.where(found, end, lo)
+
+	def mems(self, seqs):
+		"""(query index, ref pos, query pos, length) arrays of all MEMs >= min_match, 0-based."""
+		l = self.min_match
+		lengths = np.array([len(s) for s in seqs], dtype=np.int64)
+		starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+		qry = np.frombuffer(b"".join(seqs), dtype=np.uint8)
+		qry_words = packed_words(qry, 8 * self.nwords)
+		searchable = np.maximum(lengths - l + 1, 0)
+		positions = ragged_arange(starts, searchable)
+		owner = np.repeat(np.arange(len(seqs)), searchable)
+
+		lo, hi = self.find(qry, qry_words, positions)
+		counts = hi - lo
+		idx = ragged_arange(lo, counts)
+		q = np.repeat(positions, counts)
+		owner = np.repeat(owner, counts)
+		r = self.sa[idx].astype(np.int64)
+
+		# Left maximal: at the start of the query or the reference, or a mismatch before
+		qpos = q - starts[owner]
+		keep = (qpos == 0) | (r == 0)
+		keep[~keep] = qry[q[~keep] - 1] != self.text[r[~keep] - 1]
+		q, r, owner, qpos = q[keep], r[keep], owner[keep], qpos[keep]
+
+		# Right maximal: extend past min_match word by word
+		cap = np.minimum(lengths[owner] - qpos, self.n - r) - l
+		ext = np.zeros(len(q), dtype=np.int64)
+		open_ = np.flatnonzero(cap > 0)
+		while len(open_):
+			same = equal_prefix_bytes(qry_words[q[open_] + l + ext[open_]], self.words[r[open_] + l + ext[open_]])
+			ext[open_] += same
+			open_ = open_[(same == 8) & (ext[open_] < cap[open_])]
+		length = l + np.minimum(ext, cap)
+
+		order = np.lexsort((r, qpos, owner))
+		return owner[order], r[order], qpos[order], length[order]
+
+def reverse_complement(seq):
+	return seq.translate(COMPLEMENT)[::-1]
+
+def format_block(header, rows):
+	return "> %s\n" % header + "".join("%8d  %8d  %8d\n" % row for row in rows)
+
+def chunk_output(records, forward=True, reverse=False):
+	"""MUMmer-format output for a list of (name, sequence) queries."""
+	strands = []
+	for is_reverse in [False] * forward + [True] * reverse:
+		seqs = [is_reverse and reverse_complement(seq) or seq for _, seq in records]
+		owner, r, q, length = INDEX.mems(seqs)
+		bounds = np.searchsorted(owner, np.arange(len(records) + 1))
+		rows = list(zip((r + 1).tolist(), (q + 1).tolist(), length.tolist()))
+		strands.append((is_reverse, rows, bounds))
+	out = []
+	for i, (name, _) in enumerate(records):
+		for is_reverse, rows, bounds in strands:
+			out.append(format_block(is_reverse and name + " Reverse" or name, rows[bounds[i]:bounds[i + 1]]))
+	return "".join(out)
+
+def chunks(records, chunk_bases=CHUNK_BASES):
+	chunk, size = [], 0
+	for record in records:
+		chunk.append(record)
+		size += len(record[1])
+		if size >= chunk_bases:
+			yield chunk
+			chunk, size = [], 0
+	if chunk:
+		yield chunk
+
+def run(ref_path, qry_path, min_match, forward=True, reverse=False, jobs=None, out=sys.stdout):
+	global INDEX
+	start = time.perf_counter()
+	ref = read_fasta(ref_path)
+	INDEX = ReferenceIndex(ref and ref[0][1] or b"", min_match)
+	built = time.perf_counter()
+	print("suffix array and LCP of %d bases: %.3f s" % (INDEX.n, built - start), file=sys.stderr)
+
+	queries = read_fasta(qry_path)
+	work = list(chunks(queries))
+	jobs = jobs or len(os.sched_getaffinity(0))
+	if jobs > 1 and len(work) > 1:
+		with ProcessPoolExecutor(max_workers=jobs, mp_context=get_context("fork")) as pool:
+			for text in pool.map(chunk_output, work, [forward] * len(work), [reverse] * len(work)):
+				out.write(text)
+	else:
+		for chunk in work:
+			out.write(chunk_output(chunk, forward, reverse))
+	print("matched %d queries: %.3f s" % (len(queries), time.perf_counter() - built), file=sys.stderr)
+
+def parse_output(path):
+	"""Set of (query, strand, ref pos, qry pos, length) in a MUMmer/MUMmerGPU output file."""
+	matches = set()
+	query = None
+	with open(path) as f:
+		for line in f:
+			if line.startswith(">"):
+				fields = line[1:].split()
+				query = (fields and fields[0] or "", fields[-1:] == ["Reverse"])
+			elif line.strip():
+				matches.add(query + tuple(int(x) for x in line.split()[-3:]))
+	return matches
+
+def check(expected_text, other_path):
+	"""Compare our output with another tool's, ignoring order. Returns True when they agree."""
+	ours = set()
+	query = None
+	for line in expected_text.splitlines():
+		if line.startswith(">"):
+			fields = line[1:].split()
+			query = (fields and fields[0] or "", fields[-1:] == ["Reverse"])
+		elif line.strip():
+			ours.add(query + tuple(int(x) for x in line.split()))
+	theirs = parse_output(other_path)
+	missing, extra = ours - theirs, theirs - ours
+	print("%d matches here, %d in %s: %d missing there, %d extra there"
+	      % (len(ours), len(theirs), other_path, len(missing), len(extra)), file=sys.stderr)
+	for label, diff in (("missing", missing), ("extra", extra)):
+		for match in sorted(diff)[:10]:
+			print("  %s: %s" % (label, match), file=sys.stderr)
+	return not missing and not extra
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="NumPy suffix-array MEM finder with MUMmer-format output")
+	parser.add_argument("reference")
+	parser.add_argument("query")
+	parser.add_argument("-l", type=int, default=20, dest="min_match", help="minimum match length (default 20)")
+	parser.add_argument("-maxmatch", action="store_true", help="accepted for MUMmer compatibility (always on)")
+	strand = parser.add_mutually_exclusive_group()
+	strand.add_argument("-b", action="store_true", dest="both", help="forward and reverse complement matches")
+	strand.add_argument("-r", action="store_true", dest="reverse_only", help="reverse complement matches only")
+	parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all usable CPUs)")
+	parser.add_argument("--check", metavar="OUTPUT", help="compare with a mummer/mummergpu output file")
+	args = parser.parse_args()
+	if args.min_match < 1:
+		parser.error("-l must be at least 1")
+
+	forward, reverse = not args.reverse_only, args.both or args.reverse_only
+	if args.check:
+		import io
+		buf = io.StringIO()
+		run(args.reference, args.query, args.min_match, forward, reverse, args.jobs, buf)
+		sys.exit(0 if check(buf.getvalue(), args.check) else 1)
+	run(args.reference, args.query, args.min_match, forward, reverse, args.jobs)
@@ -1,4 +1,4 @@
-#!/usr/bin/env python
+#!/usr/bin/env python3
 # encoding: utf-8
 """
 untitled.py
@@ -11,13 +11,48 @@ import sys
 import getopt
 import os
 import time
-import timeit
 import csv
+import statistics
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from verify_stream import run_streamed
 
 help_message = '''
 This script runs the full cmatch experimental suite.
+
+Every configuration (GPU, CPU -C and MUMmer run of each trial) is repeated
+-n times. GPU runs go one at a time; the CPU-side runs of all datasets then
+run concurrently, each pinned with taskset to its own cores. Per dataset,
+runs.csv records the wall time, statistics file and co-runners (other
+jobs running at the same time) of every repetition and speedup.out the
+medians. Concurrent CPU-side runs compete for L3, DRAM and disk while the
+GPU runs alone, which biases CPU_SPEEDUP and MUMMER_SPEEDUP upwards; with -S
+the CPU-side runs go one at a time as well, for unbiased timing columns.
+
+With -V the match output is not written to disk: it is hashed and
+summarised as it streams out (verify_stream.py), runs.csv records each
+repetition's MD5 and match count, and differing outputs are reported.
+
+With -B the MUMmer column comes from mem_baseline.py (NumPy suffix array
+maximal exact matches) instead of a mummer binary.
+
+Options:
+	-n N        repetitions of each configuration (default %d)
+	-c CPUS     cores to pin CPU-side runs to, e.g. 0-15 or 0,2,4 (default: all usable)
+	-t THREADS  cores given to each mummergpu -C run (default %d, N_THREADS in mummergpu_gold.cpp)
+	-V          verify output as it streams instead of writing .out files
+	-B          use mem_baseline.py as the CPU baseline instead of mummer
+	-S          run the CPU-side jobs one at a time too (uncontended timings)
 '''
 
+MUMMERGPU = "mummergpu"
+MUMMER = "mummer"
+MEM_BASELINE = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "mem_baseline.py")]
+REPS = 5
+CPU_THREADS = 8
+
 
 class Usage(Exception):
 	def __init__(self, msg):
@@ -30,10 +65,22 @@ refs = ["NC_003997"]
 qry_lengths = [25]
 
 def get_stats(filename):
-	stats = {}
-	statfile = open(filename)
-	stats = dict([(key, float(value)) for (key, value) in csv.reader(statfile)])
-	return stats
+	"""
+	Statistics written by mummergpu -s: either one "name,value" row per
+	statistic, or a header row of names followed by one row of values.
+	"""
+	with open(filename) as statfile:
+		rows = [row for row in csv.reader(statfile) if row]
+	if len(rows) == 2 and len(rows[0]) > 2:
+		rows = zip(rows[0], rows[1])
+	return dict([(key, float(value)) for (key, value) in rows])
+
+def stat(stats, *names):
+	"""The first of the given statistics present in stats (names differ between versions)."""
+	for name in names:
+		if name in stats:
+			return stats[name]
+	raise KeyError(names[0])
 
 def cmatch_query_string(ref, length):
 	return ref + "_q" + str(length) + "bp.fna"
@@ -41,160 +88,238 @@ def cmatch_query_string(ref, length):
 def mummer_query_string(ref, length):
 	return ref + "_q" + str(length) + "bp.fna"
 
-def runCmatch(ref, query, matchlen, onCPU, outfile):
-
-	if onCPU:
-		cpuFlag = "-C"
-		statfile = "%s-%ld.cpustats" % ( query, matchlen )
-	else:
-		cpuFlag = ""
-		statfile = "%s-%ld.gpustats" % ( query, matchlen )
-
-	
-	match_flags = " -l %d " % (matchlen)
-	
-	cmd = "mummergpu %s -s %s -M -b %s  %s %s > %s" % (cpuFlag,
-													statfile,
-													match_flags,
-													ref,
-													query,
-													outfile)
- 	print >> sys.stderr, cmd
- 	t = timeit.Timer("os.system('" + cmd + "')", "import os")
- 	app_times = t.repeat(1, 1)
- 	app_time_avg = sum(app_times)/len(app_times)
- 	stats = get_stats(statfile)
-	return (app_time_avg, stats)
-
-def runMUMmer(ref, query, matchlen, outfile):
-	query_file = query
-	#for i in range(0,5):
-	#	query_files += query + " "
-		
-	cmd = "mummer -maxmatch -b -l %d %s %s 2>/dev/null  > %s" % (matchlen,
-															  ref,
-															  query_file,
-															  outfile)
-														
- 	print >> sys.stderr , cmd
- 	t = timeit.Timer("os.system('" + cmd + "')", "import os")
- 	app_times = t.repeat(1, 1)
- 	app_time_avg = sum(app_times)/len(app_times)
- 
-	return app_time_avg
+def parse_cpus(spec):
+	cpus = []
+	for part in spec.split(","):
+		if "-" in part:
+			lo, hi = part.split("-")
+			cpus += range(int(lo), int(hi) + 1)
+		else:
+			cpus.append(int(part))
+	return cpus
+
+class CorePool:
+	"""Hands out disjoint sets of cores to concurrently running jobs."""
+
+	def __init__(self, cpus):
+		self.free = list(cpus)
+		self.size = len(self.free)
+		self.cond = threading.Condition()
+
+	def acquire(self, n):
+		n = min(n, self.size)
+		with self.cond:
+			self.cond.wait_for(lambda: len(self.free) >= n)
+			cores, self.free = self.free[:n], self.free[n:]
+		return cores
+
+	def release(self, cores):
+		with self.cond:
+			self.free += cores
+			self.cond.notify_all()
+
+class CoRunners:
+	"""Records in every job the most other jobs that ran at the same time."""
+
+	def __init__(self):
+		self.running = []
+		self.lock = threading.Lock()
+
+	def start(self, job):
+		with self.lock:
+			self.running.append(job)
+			for other in self.running:
+				other["co_runners"] = max(other.get("co_runners", 0), len(self.running) - 1)
+
+	def stop(self, job):
+		with self.lock:
+			self.running.remove(job)
+
+def run_timed(cmd, outfile, cores=None):
+	"""Wall time of cmd with stdout sent to outfile, pinned to cores if given."""
+	if cores:
+		cmd = ["taskset", "-c", ",".join(str(c) for c in cores)] + cmd
+	print(" ".join(cmd), file=sys.stderr)
+	with open(outfile, "w") as out:
+		start = time.perf_counter()
+		subprocess.run(cmd, stdout=out, stderr=subprocess.DEVNULL, check=True)
+		return time.perf_counter() - start
+
+def cmatch_job(trial, onCPU, rep):
+	mode = onCPU and "cpu" or "gpu"
+	statfile = "%s-%ld.%sstats.%d" % (trial["query"], trial["matchlen"], mode, rep)
+	cmd = [MUMMERGPU] + (onCPU and ["-C"] or []) + ["-s", statfile, "-M", "-b",
+	                                                 "-l", str(trial["matchlen"]),
+	                                                 trial["ref"], trial["query"]]
+	return {"trial": trial, "mode": mode, "rep": rep, "cmd": cmd, "statfile": statfile,
+	        "outfile": "%s-%s.out.%d" % (trial["query"], mode, rep)}
+
+def mummer_job(trial, rep, mummer=[MUMMER]):
+	cmd = mummer + ["-maxmatch", "-b", "-l", str(trial["mummer_matchlen"]), trial["ref"], trial["query"]]
+	return {"trial": trial, "mode": "mummer", "rep": rep, "cmd": cmd, "statfile": None,
+	        "outfile": "%s-mummer.out.%d" % (trial["query"], rep)}
+
+def run_job(job, pool=None, cores_needed=1, verify=False, co_runners=None):
+	cores = pool and pool.acquire(cores_needed) or None
+	co_runners = co_runners or CoRunners()
+	co_runners.start(job)
+	try:
+		if verify:
+			job["wall_time"], digest = run_streamed(job["cmd"], cores)
+			job["md5"], job["matches"] = digest.hexdigest(), digest.matches
+		else:
+			job["wall_time"] = run_timed(job["cmd"], job["outfile"], cores)
+	finally:
+		co_runners.stop(job)
+		if cores:
+			pool.release(cores)
+	job["cores"] = cores and ",".join(str(c) for c in cores) or ""
+	job["stats"] = job["statfile"] and get_stats(job["statfile"]) or {}
+	# Keep the first repetition's alignments only; the rest just cost disk
+	if job["rep"] > 0 and not verify:
+		os.remove(job["outfile"])
+	return job
+
+def run_jobs(jobs, cpus, cpu_threads, verify=False, serial=False):
+	"""
+	GPU jobs one after another, then all CPU-side jobs on pinned cores:
+	concurrently, or one at a time if serial.
+	"""
+	for job in jobs:
+		if job["mode"] == "gpu":
+			run_job(job, verify=verify)
+	pool = CorePool(cpus)
+	co_runners = CoRunners()
+	cpu_jobs = [job for job in jobs if job["mode"] != "gpu"]
+	with ThreadPoolExecutor(max_workers=serial and 1 or len(cpus)) as executor:
+		futures = [executor.submit(run_job, job, pool, job["mode"] == "cpu" and cpu_threads or 1, verify, co_runners)
+		           for job in cpu_jobs]
+		for future in futures:
+			future.result()
 
 def get_gpu_time(stats):
-	return stats["Kernel"] + stats["Copy queries to GPU"] + stats["Copy output from GPU"] + stats["Copy suffix tree to GPU"]
-
-def execute_synth_trial(fout, directory, ref, querylen, matchlen):
-	#cmatch_query_file = directory + "/" + ref + query
+	return (stat(stats, "Kernel", "Match kernel") + stat(stats, "Copy queries to GPU", "Queries to board")
+	        + stat(stats, "Copy output from GPU", "Match coords from board")
+	        + stat(stats, "Copy suffix tree to GPU", "Tree to board"))
 
+def synth_trial(directory, ref, querylen, matchlen):
 	query_file = "%s/%s_q%dbp.fna" % (directory, ref, querylen)
 	ref_file = "%s/%s.fna" % (directory, ref)
-	cpu_outfile = query_file + "-cpu.out"
-	gpu_outfile = query_file + "-gpu.out"
-	mummer_outfile = query_file + "-mummer.out"
-	
-	(gpu_app_time_avg, gpu_stats) = runCmatch(ref_file,
-											  query_file,
-											  matchlen,
-											  False,
-											  gpu_outfile)
-	
-	(cpu_app_time_avg, cpu_stats) = runCmatch(ref_file,
-											  query_file,
-											  matchlen,
-											  True,
-											  cpu_outfile)
-
-	mummer_app_time_avg = runMUMmer(ref_file, query_file, matchlen == 0 and querylen or matchlen, mummer_outfile)
-	
-
- 	kernel_speedup = cpu_stats["Kernel"] / get_gpu_time(gpu_stats)
-
-	print >>fout, querylen, matchlen, cpu_app_time_avg,gpu_app_time_avg, mummer_app_time_avg, cpu_app_time_avg / gpu_app_time_avg, mummer_app_time_avg / gpu_app_time_avg, kernel_speedup
-	#print cmd
-
-
-
-def execute_real_trial(fout, directory, ref, query, matchlen):
-	
+	return {"directory": directory, "label": querylen, "ref": ref_file, "query": query_file,
+	        "matchlen": matchlen, "mummer_matchlen": matchlen == 0 and querylen or matchlen}
+
+def real_trial(directory, ref, query, matchlen):
 	ref_file = "%s/%s.fna" % (directory, ref)
 	query_file = "%s/%s.fna" % (directory, query)
-	cpu_outfile = query_file + "-cpu.out"
-	gpu_outfile = query_file + "-gpu.out"
-	mummer_outfile = query_file + "-mummer.out"
-	
-	(gpu_app_time_avg, gpu_stats) = runCmatch(ref_file,
-											  query_file,
-											  matchlen,
-											  False,
-											  gpu_outfile)
-	
- 	(cpu_app_time_avg, cpu_stats) = runCmatch(ref_file,
- 											  query_file,
- 											  matchlen,
- 											  True,
-											  cpu_outfile)
-
-	mummer_app_time_avg = runMUMmer(ref_file, query_file, matchlen, mummer_outfile)
-	
-
-
- 	kernel_speedup = cpu_stats["Kernel"] /  get_gpu_time(gpu_stats)
-
-   	print >> fout, "-", matchlen,cpu_app_time_avg,gpu_app_time_avg, mummer_app_time_avg, cpu_app_time_avg / gpu_app_time_avg, mummer_app_time_avg / gpu_app_time_avg, kernel_speedup
-
-
-def run_different_query_lengths():
-	f = open("anthrax/speedup.out", "w")
- 	print >> f, "QUERY,MATCH_LENGTH,CPU,GPU,MUMMER,CPU_SPEEDUP,MUMMER_SPEEDUP,KERNEL_SPEEDUP"	
- 	execute_synth_trial(f,"anthrax", "NC_003997", 25, 25)
- 	execute_synth_trial(f,"anthrax", "NC_003997", 50, 50)
- 	execute_synth_trial(f,"anthrax", "NC_003997", 100,100)
- 	execute_synth_trial(f,"anthrax", "NC_003997", 200,200) 
- 	execute_synth_trial(f,"anthrax", "NC_003997", 400,400)
- 	execute_synth_trial(f,"anthrax", "NC_003997", 800,800)
-	
-def run_ssuis_solexa():
-	f = open("s_suis/speedup.out", "w")
- 	print >> f, "QUERY,MATCH_LENGTH,CPU,GPU,MUMMER,CPU_SPEEDUP,MUMMER_SPEEDUP,KERNEL_SPEEDUP"	
-	execute_real_trial(f,"s_suis", "cleanref", "cleanreads", 20)
-	
-def run_cereus_454():
-	f = open("cereus/speedup.out", "w")
- 	print >> f, "QUERY,MATCH_LENGTH,CPU,GPU,MUMMER,CPU_SPEEDUP,MUMMER_SPEEDUP,KERNEL_SPEEDUP"	
-	execute_real_trial(f,"cereus", "cleanref", "cleanreads", 20)
-
-def run_briggsae_sanger():
-	f = open("cbriggsae/speedup.out", "w")
- 	print >> f, "QUERY,MATCH_LENGTH,CPU,GPU,MUMMER,CPU_SPEEDUP,MUMMER_SPEEDUP,KERNEL_SPEEDUP"	
-	execute_real_trial(f,"cbriggsae", "cleanref", "cleanreads", 100)
+	return {"directory": directory, "label": "-", "ref": ref_file, "query": query_file,
+	        "matchlen": matchlen, "mummer_matchlen": matchlen}
+
+def different_query_lengths():
+	return [synth_trial("anthrax", "NC_003997", length, length) for length in (25, 50, 100, 200, 400, 800)]
+
+def ssuis_solexa():
+	return [real_trial("s_suis", "cleanref", "cleanreads", 20)]
+
+def cereus_454():
+	return [real_trial("cereus", "cleanref", "cleanreads", 20)]
+
+def briggsae_sanger():
+	return [real_trial("cbriggsae", "cleanref", "cleanreads", 100)]
+
+def write_results(trials, jobs):
+	"""Per dataset: every repetition in runs.csv, medians and spreads in speedup.out."""
+	for directory in dict.fromkeys(trial["directory"] for trial in trials):
+		with open("%s/runs.csv" % directory, "w") as f:
+			writer = csv.writer(f)
+			writer.writerow(["QUERY", "MATCH_LENGTH", "MODE", "REP", "CORES", "CO_RUNNERS", "WALL_TIME",
+			                 "STATS_FILE", "MD5", "MATCHES"])
+			for job in jobs:
+				if job["trial"]["directory"] == directory:
+					writer.writerow([job["trial"]["label"], job["trial"]["matchlen"], job["mode"], job["rep"],
+					                 job["cores"], job["co_runners"], "%f" % job["wall_time"], job["statfile"] or "",
+					                 job.get("md5", ""), job.get("matches", "")])
+
+		with open("%s/speedup.out" % directory, "w") as f:
+			# CPU_CORUNNERS and MUMMER_CORUNNERS: median co-runners; above 0 the speedups are biased upwards
+			print("QUERY,MATCH_LENGTH,CPU,GPU,MUMMER,CPU_SPEEDUP,MUMMER_SPEEDUP,KERNEL_SPEEDUP,"
+			      "CPU_STDEV,GPU_STDEV,MUMMER_STDEV,CPU_CORUNNERS,MUMMER_CORUNNERS", file=f)
+			for trial in trials:
+				if trial["directory"] != directory:
+					continue
+				runs = dict((mode, [job for job in jobs if job["trial"] is trial and job["mode"] == mode])
+				            for mode in ("cpu", "gpu", "mummer"))
+				wall = dict((mode, [job["wall_time"] for job in runs[mode]]) for mode in runs)
+				med = dict((mode, statistics.median(wall[mode])) for mode in wall)
+				dev = dict((mode, len(wall[mode]) > 1 and statistics.stdev(wall[mode]) or 0.0) for mode in wall)
+				shared = dict((mode, statistics.median(job["co_runners"] for job in runs[mode])) for mode in runs)
+				cpu_kernel = statistics.median(stat(job["stats"], "Kernel", "Match kernel") for job in runs["cpu"])
+				gpu_time = statistics.median(get_gpu_time(job["stats"]) for job in runs["gpu"])
+				print(trial["label"], trial["matchlen"], med["cpu"], med["gpu"], med["mummer"],
+				      med["cpu"] / med["gpu"], med["mummer"] / med["gpu"], cpu_kernel / gpu_time,
+				      dev["cpu"], dev["gpu"], dev["mummer"], shared["cpu"], shared["mummer"], file=f)
+				if shared["cpu"] or shared["mummer"]:
+					print("WARNING: %s: CPU-side runs shared the machine with a median %g (CPU) and %g (MUMmer) "
+					      "other jobs, the GPU runs with none; CPU_SPEEDUP and MUMMER_SPEEDUP are biased "
+					      "(rerun with -S)" % (trial["query"], shared["cpu"], shared["mummer"]), file=sys.stderr)
+
+def check_outputs(trials, jobs):
+	"""Report trials whose repetitions or CPU/GPU runs produced different output."""
+	for trial in trials:
+		digests = dict(((job["mode"], job["rep"]), job["md5"]) for job in jobs
+		               if job["trial"] is trial and job["mode"] != "mummer")
+		if len(set(digests.values())) > 1:
+			print("WARNING: %s output differs between runs: %s" % (trial["query"], digests), file=sys.stderr)
 
 def main(argv=None):
 	if argv is None:
 		argv = sys.argv
+	reps = REPS
+	cpus = sorted(os.sched_getaffinity(0))
+	cpu_threads = CPU_THREADS
+	verify = False
+	mummer = [MUMMER]
+	serial = False
 	try:
 		try:
-			opts, args = getopt.getopt(argv[1:], "hv", ["help"])
-		except getopt.error, msg:
+			opts, args = getopt.getopt(argv[1:], "hvVBSn:c:t:", ["help"])
+		except getopt.error as msg:
 			raise Usage(msg)
-	
+
 		for option, value in opts:
 			if option == "-v":
 				verbose = True
 			if option in ("-h", "--help"):
-				raise Usage(help_message)
-
-		run_ssuis_solexa()
-		run_cereus_454()
-		run_briggsae_sanger()
-
-		run_different_query_lengths()
-		
-	except Usage, err:
-		print >> sys.stderr, sys.argv[0].split("/")[-1] + ": " + str(err.msg)
-		print >> sys.stderr, "\t for help use --help"
+				raise Usage(help_message % (REPS, CPU_THREADS))
+			if option == "-n":
+				reps = int(value)
+			if option == "-c":
+				cpus = parse_cpus(value)
+			if option == "-t":
+				cpu_threads = int(value)
+			if option == "-V":
+				verify = True
+			if option == "-B":
+				mummer = MEM_BASELINE
+			if option == "-S":
+				serial = True
+
+		trials = ssuis_solexa() + cereus_454() + briggsae_sanger() + different_query_lengths()
+		for trial in [t for t in trials if not os.path.isdir(t["directory"])]:
+			print("WARNING: no %s directory, skipping its trials" % trial["directory"], file=sys.stderr)
+			trials.remove(trial)
+
+		jobs = []
+		for rep in range(reps):
+			for trial in trials:
+				jobs += [cmatch_job(trial, False, rep), cmatch_job(trial, True, rep), mummer_job(trial, rep, mummer)]
+		run_jobs(jobs, cpus, cpu_threads, verify, serial)
+		write_results(trials, jobs)
+		if verify:
+			check_outputs(trials, jobs)
+
+	except Usage as err:
+		print(sys.argv[0].split("/")[-1] + ": " + str(err.msg), file=sys.stderr)
+		print("\t for help use --help", file=sys.stderr)
 		return 2
 
 
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+results_db.py
+
+SQLite store for MUMmerGPU results. Every run (one statistics row) becomes a
+row of the runs table with its dataset, configuration flags, min match
+length, query length and per-phase timings as typed columns, so tables and
+figures come from queries instead of hand-listed files.
+
+Importers understand every format the experiments produce:
+	*.allstats      experiments/sc-exp.sh: one row per configuration
+	*.stats         -s statistics files (e2e/): header+values or legacy name,value rows
+	runs.csv        mummergpu_exp.py repetitions, with their statistics files
+
+	python3 results_db.py import ../experiments
+	python3 results_db.py query --dataset cbriggsae --cpu 0 --columns config,total,match_kernel
+	python3 results_db.py speedup
+"""
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import sys
+
+from mummergpu_exp import get_stats
+
+DB_FILE = "results.db"
+
+# Compile-time flags: (column, statistics name); typed INTEGER
+FLAG_COLUMNS = [
+	("qrytex", "Q"), ("reftex", "R"), ("treetex", "T"), ("mergetex", "m"),
+	("reorder_ref", "r"), ("reorder_tree", "t"), ("renumber_tree", "n"),
+]
+# Phase timings in ms: (column, statistics names, current header name first); typed REAL
+PHASE_COLUMNS = [
+	("total", ["Total"]),
+	("match_kernel", ["Match kernel", "Kernel"]),
+	("print_kernel", ["Print Kernel", "Print matches"]),
+	("queries_to_board", ["Queries to board", "Copy queries to GPU"]),
+	("match_coords_to_board", ["Match coords to board"]),
+	("match_coords_from_board", ["Match coords from board", "Copy output from GPU"]),
+	("tree_to_board", ["Tree to board", "Copy suffix tree to GPU"]),
+	("ref_str_to_board", ["Ref str to board"]),
+	("queries_from_disk", ["Queries from disk", "Read queries from disk"]),
+	("ref_from_disk", ["Ref from disk"]),
+	("output_to_disk", ["Output to disk"]),
+	("tree_construction", ["Tree construction", "Suffix tree constructions"]),
+	("tree_reorder", ["Tree reorder"]),
+	("tree_flatten", ["Tree flatten"]),
+	("ref_reorder", ["Ref reorder"]),
+	("build_coord_table", ["Build coord table"]),
+	("coords_to_buffers", ["Coords to buffers"]),
+]
+
+# Phase columns by category: (key, label, columns), in pipeline order
+PHASE_CATEGORIES = [
+	("io", "I/O", ["queries_from_disk", "ref_from_disk"]),
+	("tree", "Tree construction", ["tree_construction", "tree_reorder", "tree_flatten", "ref_reorder",
+	                               "build_coord_table"]),
+	("transfer", "Transfer", ["queries_to_board", "match_coords_to_board", "match_coords_from_board",
+	                          "tree_to_board", "ref_str_to_board"]),
+	("kernel", "Kernel", ["match_kernel", "print_kernel"]),
+	("output", "Output", ["coords_to_buffers", "output_to_disk"]),
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+	id INTEGER PRIMARY KEY,
+	source TEXT NOT NULL,
+	source_row INTEGER NOT NULL,
+	dataset TEXT,
+	reference TEXT,
+	query TEXT,
+	config TEXT,
+	on_cpu INTEGER NOT NULL,
+	%s,
+	min_match INTEGER,
+	query_length REAL,
+	rep INTEGER,
+	wall_time REAL,
+	%s,
+	UNIQUE (source, source_row)
+);
+CREATE INDEX IF NOT EXISTS runs_dataset ON runs (dataset, min_match, config);
+CREATE INDEX IF NOT EXISTS runs_config ON runs (config, on_cpu);
+""" % (",\n\t".join("%s INTEGER" % col for col, _ in FLAG_COLUMNS),
+       ",\n\t".join("%s REAL" % col for col, _ in PHASE_COLUMNS))
+
+COLUMNS = (["source", "source_row", "dataset", "reference", "query", "config", "on_cpu"]
+           + [col for col, _ in FLAG_COLUMNS] + ["min_match", "query_length", "rep", "wall_time"]
+           + [col for col, _ in PHASE_COLUMNS])
+
+# <org>.<ref>.<qry>.<minmatch>[.C].allstats, as written by sc-exp.sh
+ALLSTATS_RE = re.compile(r"^(?P<dataset>[^.]+)\.(?P<reference>.+?\.fna)\.(?P<query>.+?\.fna)"
+                         r"\.(?P<min_match>\d+)(?P<cpu>\.C)?\.allstats$")
+# Configuration cells that kept the stats file name: <bin>.<ref>.<minmatch>.<qry>
+CONFIG_RE = re.compile(r"^(?P<config>[^.]+)\.(?P<reference>.+?\.fna)\.(?P<min_match>\d+)\.(?P<query>.+?\.fna)$")
+# <org>.<config>.<qry>[.C].stats (e2e/)
+STATS_RE = re.compile(r"^(?P<dataset>[^.]+)\.(?P<config>.+?)\.(?P<query>[^.]+\.fna)(?P<cpu>\.C)?\.stats$")
+
+
+def connect(path=DB_FILE):
+	db = sqlite3.connect(path)
+	db.row_factory = sqlite3.Row
+	db.executescript(SCHEMA)
+	return db
+
+def stats_row(stats):
+	"""Typed columns of one statistics dict (flags, phase timings, lengths)."""
+	row = {}
+	for col, name in FLAG_COLUMNS:
+		if name in stats:
+			row[col] = int(stats[name])
+	for col, names in PHASE_COLUMNS:
+		for name in names:
+			if name in stats:
+				row[col] = stats[name]
+				break
+	if "Minimum substring length" in stats:
+		row["min_match"] = int(stats["Minimum substring length"])
+	for name in ("Avg qry length", "Average query length"):
+		if name in stats:
+			row["query_length"] = stats[name]
+	return row
+
+def insert(db, rows):
+	"""Insert or replace rows (dicts), keyed by (source, source_row) so re-imports are idempotent."""
+	sql = "INSERT OR REPLACE INTO runs (%s) VALUES (%s)" % (", ".join(COLUMNS), ", ".join("?" * len(COLUMNS)))
+	db.executemany(sql, [[row.get(col) for col in COLUMNS] for row in rows])
+	db.commit()
+	return len(rows)
+
+def allstats_rows(path):
+	meta = ALLSTATS_RE.match(os.path.basename(path))
+	meta = meta and meta.groupdict() or {"dataset": os.path.basename(path).split(".")[0].split("_")[0]}
+	rows = []
+	with open(path) as f:
+		for i, record in enumerate(csv.DictReader(f)):
+			config = record.pop("Configuration")
+			row = {"source": path, "source_row": i, "dataset": meta["dataset"],
+			       "reference": meta.get("reference"), "query": meta.get("query"),
+			       "on_cpu": int(bool(meta.get("cpu"))), "config": config,
+			       "min_match": meta.get("min_match") and int(meta["min_match"])}
+			named = CONFIG_RE.match(config)
+			if named:
+				row.update(named.groupdict())
+				row["min_match"] = int(row["min_match"])
+			elif meta.get("query") and config.endswith("." + meta["query"]):
+				row["config"] = config[:-len(meta["query"]) - 1]
+			row.update(stats_row(dict((k, float(v)) for k, v in record.items() if v not in (None, ""))))
+			rows.append(row)
+	return rows
+
+def stats_file_rows(path):
+	meta = STATS_RE.match(os.path.basename(path))
+	if not meta:
+		return []
+	row = {"source": path, "source_row": 0, "dataset": meta.group("dataset"), "config": meta.group("config"),
+	       "query": meta.group("query"), "on_cpu": int(bool(meta.group("cpu")))}
+	row.update(stats_row(get_stats(path)))
+	return [row]
+
+def runs_csv_rows(path):
+	"""Repetitions recorded by mummergpu_exp.py; paths in runs.csv are relative to its parent."""
+	base = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+	dataset = os.path.basename(os.path.dirname(os.path.abspath(path)))
+	rows = []
+	with open(path) as f:
+		for i, record in enumerate(csv.DictReader(f)):
+			row = {"source": path, "source_row": i, "dataset": dataset,
+			       "config": record["MODE"] == "mummer" and "mummer" or "mummergpu",
+			       "on_cpu": int(record["MODE"] != "gpu"), "min_match": int(record["MATCH_LENGTH"]),
+			       "rep": int(record["REP"]), "wall_time": float(record["WALL_TIME"])}
+			if record["QUERY"] != "-":
+				row["query_length"] = float(record["QUERY"])
+			statfile = record["STATS_FILE"] and os.path.join(base, record["STATS_FILE"])
+			if statfile and os.path.exists(statfile):
+				row.update(stats_row(get_stats(statfile)))
+			rows.append(row)
+	return rows
+
+def fill_from_allstats(db):
+	"""
+	Runs whose file names carry no min match length (e2e/ .stats) take it, and
+	the reference, from the other runs of the same dataset and query (the
+	.allstats sweep, or statistics that record it), when they agree on one.
+	"""
+	for col in ("min_match", "reference"):
+		db.execute("""
+		UPDATE runs SET %(col)s = (SELECT a.%(col)s FROM runs a
+		                          WHERE a.dataset = runs.dataset AND a.query = runs.query
+		                            AND a.%(col)s IS NOT NULL)
+		WHERE %(col)s IS NULL AND source LIKE '%%.stats'
+		  AND (SELECT COUNT(DISTINCT a.%(col)s) FROM runs a
+		       WHERE a.dataset = runs.dataset AND a.query = runs.query) = 1
+		""" % {"col": col})
+	db.commit()
+
+def import_path(db, path):
+	"""
+	Import one results file, or every results file below a directory
+	(backup/ directories of superseded results are skipped). Returns the row count.
+	Sources are stored as real paths, so re-importing through another path replaces rows.
+	"""
+	path = os.path.realpath(path)
+	if os.path.isdir(path):
+		count = 0
+		for root, dirs, files in os.walk(path):
+			dirs[:] = sorted(d for d in dirs if d != "backup")
+			for name in sorted(files):
+				count += import_path(db, os.path.join(root, name))
+		fill_from_allstats(db)
+		return count
+	name = os.path.basename(path)
+	if name.endswith(".allstats"):
+		rows = allstats_rows(path)
+	elif name.endswith(".stats"):
+		rows = stats_file_rows(path)
+	elif name == "runs.csv":
+		rows = runs_csv_rows(path)
+	else:
+		return 0
+	count = insert(db, rows)
+	fill_from_allstats(db)
+	return count
+
+def query(db, columns=None, order_by=None, **filters):
+	"""Rows matching every column=value filter (None values are ignored)."""
+	for col in list(filters) + list(columns or []) + (order_by and [order_by] or []):
+		if col not in COLUMNS and col != "id":
+			raise ValueError("unknown column %s" % col)
+	filters = dict((k, v) for k, v in filters.items() if v is not None)
+	sql = "SELECT %s FROM runs" % (columns and ", ".join(columns) or "*")
+	if filters:
+		sql += " WHERE " + " AND ".join("%s = ?" % col for col in filters)
+	if order_by:
+		sql += " ORDER BY " + order_by
+	return db.execute(sql, list(filters.values())).fetchall()
+
+def speedup_table(db, dataset=None):
+	"""
+	Per dataset, query, min match length and configuration: mean GPU and CPU (-C)
+	totals and the application and kernel speedups, from rows of both kinds.
+	"""
+	sql = """
+	SELECT g.dataset, g.query, g.min_match, g.config,
+	       AVG(g.total) AS gpu_total, c.cpu_total,
+	       c.cpu_total / AVG(g.total) AS app_speedup,
+	       c.cpu_kernel / AVG(g.match_kernel + g.queries_to_board + g.match_coords_from_board + g.tree_to_board)
+	           AS kernel_speedup
+	FROM runs g
+	JOIN (SELECT dataset, query, min_match, config, AVG(total) AS cpu_total, AVG(match_kernel) AS cpu_kernel
+	      FROM runs WHERE on_cpu = 1 GROUP BY dataset, query, min_match, config) c
+	  ON c.dataset = g.dataset AND c.query IS g.query AND c.min_match IS g.min_match AND c.config = g.config
+	WHERE g.on_cpu = 0 %s
+	GROUP BY g.dataset, g.query, g.min_match, g.config
+	ORDER BY g.dataset, g.query, g.min_match, g.config
+	""" % (dataset and "AND g.dataset = ?" or "")
+	return db.execute(sql, dataset and [dataset] or []).fetchall()
+
+def print_rows(rows, out=sys.stdout):
+	writer = csv.writer(out)
+	if rows:
+		writer.writerow(rows[0].keys())
+	for row in rows:
+		writer.writerow(list(row))
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="SQLite store of MUMmerGPU results")
+	parser.add_argument("-d", "--db", default=DB_FILE)
+	sub = parser.add_subparsers(dest="command", required=True)
+
+	imp = sub.add_parser("import", help="import .allstats, .stats and runs.csv files (directories are walked)")
+	imp.add_argument("paths", nargs="+")
+
+	qry = sub.add_parser("query", help="print matching runs as CSV")
+	qry.add_argument("--dataset")
+	qry.add_argument("--config")
+	qry.add_argument("--cpu", type=int, choices=[0, 1], dest="on_cpu")
+	qry.add_argument("--min-match", type=int, dest="min_match")
+	qry.add_argument("--columns", help="comma separated columns (default: all)")
+	qry.add_argument("--order-by")
+
+	spd = sub.add_parser("speedup", help="CPU vs GPU speedup per dataset, query, min match and configuration")
+	spd.add_argument("--dataset")
+	args = parser.parse_args()
+
+	db = connect(args.db)
+	if args.command == "import":
+		for path in args.paths:
+			print("%s: %d runs" % (path, import_path(db, path)), file=sys.stderr)
+	elif args.command == "query":
+		print_rows(query(db, args.columns and args.columns.split(","), args.order_by, dataset=args.dataset,
+		                 config=args.config, on_cpu=args.on_cpu, min_match=args.min_match))
+	else:
+		print_rows(speedup_table(db, args.dataset))
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+sh_tuner.py
+
+Finds a near-optimal layout configuration for a reference and read set by
+successive halving instead of running all 128 binaries on every read.
+
+Every candidate runs on a random sample of the reads; the best 1/eta of
+them (by a statistic of their -s stats file, Total by default) move on to
+a sample eta times larger, until the survivors run on the whole query
+file. Samples are nested (each is a prefix of one random permutation of
+the reads), so later rungs see every read the earlier ones did.
+
+GPU candidates run one at a time; with -C they run concurrently on the
+CPU, each pinned to its own cores, and only one configuration of each
+distinct CPU build (MERGETEX, REORDER_REF, REORDER_TREE, RENUMBER_TREE)
+takes part. Every run is recorded in the output CSV, with the cost in
+full-input run equivalents against the exhaustive sweep.
+
+	python3 sh_tuner.py --bindir ../bin -l 20 ref.fna reads.fna
+	python3 sh_tuner.py -C --configs CONTROL,m,t,n,mt,mn,tn,mtn --eta 2 -l 20 ref.fna reads.fna
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from mummergpu_exp import CPU_THREADS, CorePool, get_stats, parse_cpus, run_timed, stat
+
+# configs.py (the configuration names) lives with the experiments
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "experiments"))
+from configs import FLAGS, SOURCES, get_bin_name  # noqa: E402
+
+BINDIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "bin")
+ETA = 3
+# Smallest sample worth timing: below this, start-up costs swamp the matching
+MIN_READS = 1000
+CONFIGS = 128
+# Flags the CPU (-C) code path is compiled with: the rest only change GPU code.
+# Of mummergpu.cu's host code -C runs REORDER_REF too (buildReferenceTexture
+# reorders the reference, the "Ref reorder" phase)
+CPU_FLAGS = 0
+for source, _, mask in SOURCES:
+	if source in ("mummergpu_gold.cpp", "suffix-tree.cpp"):
+		CPU_FLAGS |= mask
+	elif source == "mummergpu.cu":
+		CPU_FLAGS |= mask & sum(bit for bit, _, flag in FLAGS if flag == "REORDER_REF")
+CPU_FLAG_NAMES = [flag for bit, _, flag in FLAGS if bit & CPU_FLAGS]
+
+
+def read_records(path):
+	"""FASTA records as they appear in the file (header line included)."""
+	with open(path) as f:
+		data = f.read().lstrip()
+	if data.startswith(">"):
+		data = data[1:]
+	return [">" + record for record in data.split("\n>") if record.strip()]
+
+def distinct_on_cpu(configs):
+	"""
+	One configuration per distinct CPU build: -C runs of configurations that
+	differ only in GPU flags run the same code, and ranking them is ranking noise.
+	"""
+	index = dict((get_bin_name(i), i) for i in range(CONFIGS))
+	seen, kept = set(), []
+	for config in configs:
+		variant = config in index and index[config] & CPU_FLAGS
+		if variant is False or variant not in seen:
+			seen.add(variant)
+			kept.append(config)
+	return kept
+
+def rung_sizes(num_configs, num_reads, eta=ETA, min_reads=MIN_READS):
+	"""
+	Reads per rung, ending with all of them: enough rungs to halve (by eta)
+	the candidates down to a handful, but no rung smaller than min_reads.
+	"""
+	rungs = max(int(math.ceil(math.log(max(num_configs, 1), eta))) - 1, 0)
+	sizes = [int(math.ceil(num_reads / eta ** k)) for k in range(rungs, 0, -1)]
+	return [size for size in sizes if size >= min(min_reads, num_reads) and size < num_reads] + [num_reads]
+
+def write_sample(records, order, size, path):
+	with open(path, "w") as f:
+		for k in order[:size]:
+			f.write(records[k].rstrip("\n") + "\n")
+	return path
+
+def evaluate(config, args, query, statfile, pool=None):
+	cmd = [os.path.join(args.bindir, config)] + (args.on_cpu and ["-C"] or []) + \
+	      ["-s", statfile, "-l", str(args.min_match)] + args.mummergpu_args + [args.reference, query]
+	cores = pool and pool.acquire(args.threads) or None
+	try:
+		wall_time = run_timed(cmd, os.devnull, cores)
+	finally:
+		if cores:
+			pool.release(cores)
+	stats = get_stats(statfile)
+	return wall_time, args.metric == "wall" and wall_time * 1000.0 or stat(stats, args.metric)
+
+def successive_halving(configs, args, workdir):
+	"""Rows of every evaluation; the last rung's best configuration is the answer."""
+	records = read_records(args.query)
+	order = list(range(len(records)))
+	random.Random(args.seed).shuffle(order)
+	sizes = rung_sizes(len(configs), len(records), args.eta, args.min_reads)
+	pool = args.on_cpu and CorePool(args.cpus) or None
+
+	rows, survivors = [], list(configs)
+	for rung, size in enumerate(sizes):
+		query = size == len(records) and args.query or \
+		        write_sample(records, order, size, os.path.join(workdir, "sample%d.fna" % rung))
+		print("rung %d: %d configurations on %d/%d reads" % (rung, len(survivors), size, len(records)), file=sys.stderr)
+
+		def run(config):
+			return evaluate(config, args, query, os.path.join(workdir, "%s.%d.stats" % (config, rung)), pool)
+		if pool:
+			with ThreadPoolExecutor(max_workers=max(len(args.cpus) // args.threads, 1)) as executor:
+				results = list(executor.map(run, survivors))
+		else:
+			results = [run(config) for config in survivors]
+
+		ranked = sorted(zip(survivors, results), key=lambda item: item[1][1])
+		keep = rung == len(sizes) - 1 and 1 or max(int(math.ceil(len(ranked) / float(args.eta))), 1)
+		for position, (config, (wall_time, metric)) in enumerate(ranked):
+			rows.append({"rung": rung, "reads": size, "config": config, "rank": position + 1,
+			             "metric": metric, "wall_time": wall_time, "kept": int(position < keep),
+			             "cost": float(size) / len(records)})
+		survivors = [config for config, _ in ranked[:keep]]
+	return rows
+
+def write_rows(rows, path):
+	with open(path, "w") as f:
+		writer = csv.DictWriter(f, ["rung", "reads", "config", "rank", "metric", "wall_time", "kept", "cost"])
+		writer.writeheader()
+		writer.writerows(rows)
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Successive halving search over MUMmerGPU layout configurations")
+	parser.add_argument("reference")
+	parser.add_argument("query")
+	parser.add_argument("-l", type=int, default=20, dest="min_match", help="minimum match length (default 20)")
+	parser.add_argument("-C", action="store_true", dest="on_cpu",
+	                    help="run candidates on the CPU (-C), concurrently on pinned cores")
+	parser.add_argument("--bindir", default=BINDIR, help="where the configuration binaries are (make -j test)")
+	parser.add_argument("--configs", help="comma separated configurations (default: all %d)" % CONFIGS)
+	parser.add_argument("--eta", type=int, default=ETA, help="keep 1/eta per rung, samples grow eta-fold (default %d)" % ETA)
+	parser.add_argument("--min-reads", type=int, default=MIN_READS, help="smallest sample (default %d)" % MIN_READS)
+	parser.add_argument("--metric", default="Total", help="stats file statistic to minimise, or 'wall' (default Total)")
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--cpus", type=parse_cpus, default=sorted(os.sched_getaffinity(0)),
+	                    help="cores for -C runs, e.g. 0-15 (default: all usable)")
+	parser.add_argument("-t", "--threads", type=int, default=CPU_THREADS,
+	                    help="cores per -C run (default %d)" % CPU_THREADS)
+	parser.add_argument("-o", "--output", default="sh_tuner.csv")
+	parser.add_argument("--keep-samples", action="store_true", help="keep the sampled query files and stats")
+	parser.add_argument("mummergpu_args", nargs=argparse.REMAINDER, help="further mummergpu options, after --")
+	args = parser.parse_args()
+	args.mummergpu_args = args.mummergpu_args[1:] if args.mummergpu_args[:1] == ["--"] else args.mummergpu_args
+	if args.eta < 2:
+		parser.error("--eta must be at least 2")
+
+	configs = args.configs and args.configs.split(",") or [get_bin_name(i) for i in range(CONFIGS)]
+	missing = [c for c in configs if not os.path.exists(os.path.join(args.bindir, c))]
+	if missing:
+		print("WARNING: %d configurations not built in %s, skipping: %s"
+		      % (len(missing), args.bindir, " ".join(missing)), file=sys.stderr)
+		configs = [c for c in configs if c not in missing]
+	if not configs:
+		parser.error("no configuration binaries in %s" % args.bindir)
+	if args.on_cpu:
+		distinct = distinct_on_cpu(configs)
+		if len(distinct) < len(configs):
+			print("-C: %d of %d configurations differ in CPU code (%s): %s"
+			      % (len(distinct), len(configs), ", ".join(CPU_FLAG_NAMES), " ".join(distinct)), file=sys.stderr)
+		configs = distinct
+
+	workdir = tempfile.mkdtemp(prefix="sh_tuner.")
+	try:
+		rows = successive_halving(configs, args, workdir)
+	finally:
+		if args.keep_samples:
+			print("samples and stats kept in %s" % workdir, file=sys.stderr)
+		else:
+			shutil.rmtree(workdir)
+	write_rows(rows, args.output)
+
+	best = [row for row in rows if row["kept"] and row["rung"] == rows[-1]["rung"]][0]
+	cost = sum(row["cost"] for row in rows)
+	print("best: %s (%s %.3f on the full input)" % (best["config"], args.metric, best["metric"]))
+	print("cost: %.1f full-input runs over %d rungs, against %d for the exhaustive sweep (%.1fx cheaper)"
+	      % (cost, rows[-1]["rung"] + 1, len(configs), len(configs) / cost))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+verify_stream.py
+
+Checks MUMmerGPU/MUMmer match output as it streams out of the aligner, so the
+output never lands on disk. The stream is hashed incrementally (MD5, as in
+the experiments' .md5 files) and parsed for match statistics: matches per
+query and the match length histogram.
+
+Output is "> query" header lines, each followed by "ref_pos qry_pos length"
+match lines; a "> query Reverse" header (-b) continues the same query.
+Queries without matches print no header, so they are not counted.
+
+	# run the aligner through the verifier
+	python3 verify_stream.py --check org.ref.qry.20.md5 --name CONTROL.out -- mummergpu -l 20 ref.fna qry.fna
+	# or verify a pipe
+	mummergpu -l 20 ref.fna qry.fna | python3 verify_stream.py --stats CONTROL.matches
+
+The md5sum-style line "<md5>  <name>" goes to stdout; the exit status is 1
+when the digest does not match the --check file.
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+CHUNK_BYTES = 1 << 20
+
+NEWLINE, GT, ZERO = ord("\n"), ord(">"), ord("0")
+REVERSE = b" Reverse"
+
+
+def accumulate(hist, values):
+	"""hist + bincount(values), growing hist as needed."""
+	counts = np.bincount(values)
+	if len(counts) > len(hist):
+		hist = np.concatenate((hist, np.zeros(len(counts) - len(hist), dtype=np.int64)))
+	hist[:len(counts)] += counts
+	return hist
+
+def same_ranges(buf, a, b, len_a, len_b):
+	"""Whether buf[a[i]:a[i] + len_a[i]] == buf[b[i]:b[i] + len_b[i]], for every i."""
+	same = len_a == len_b
+	n = np.where(same, len_a, 0)
+	if n.sum():
+		pair = np.repeat(np.arange(len(n)), n)
+		offset = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+		differs = buf[a[pair] + offset] != buf[b[pair] + offset]
+		same &= np.bincount(pair[differs], minlength=len(n)) == 0
+	return same
+
+def is_space(c):
+	return (c == 32) | ((c >= 9) & (c <= 13))
+
+def is_digit(c):
+	return (c >= ZERO) & (c <= ZERO + 9)
+
+def step_while(buf, pos, limit, step, test):
+	"""
+	Every pos moved by step while the byte it moves over passes test and the
+	limit is not reached: backwards (step -1) over buf[pos - 1], forwards over buf[pos].
+	"""
+	pos = pos.copy()
+	ahead = step < 0 and -1 or 0
+	while True:
+		move = (pos > limit if step < 0 else pos < limit)
+		move &= test(buf[np.clip(pos + ahead, 0, len(buf) - 1)])
+		if not move.any():
+			return pos
+		pos[move] += step
+
+class OutputDigest:
+	"""Incremental MD5 and match statistics of aligner output fed in arbitrary chunks."""
+
+	def __init__(self):
+		self.md5 = hashlib.md5()
+		self.bytes = 0
+		self.queries = 0
+		self.matches = 0
+		# length_hist[l]: matches of length l; per_query_hist[k]: queries with k matches
+		self.length_hist = np.zeros(0, dtype=np.int64)
+		self.per_query_hist = np.zeros(0, dtype=np.int64)
+		self._tail = b""
+		self._query = None
+		self._query_matches = 0
+
+	def update(self, chunk):
+		self.md5.update(chunk)
+		self.bytes += len(chunk)
+		data = self._tail + chunk
+		end = data.rfind(b"\n") + 1
+		self._tail = data[end:]
+		self._parse(data[:end])
+
+	def _parse(self, data):
+		"""
+		Whole chunk at once, with NumPy over its lines: no Python work per line
+		or per query, so the parser keeps up with the aligner's output pipe.
+		"""
+		if not data:
+			return
+		buf = np.frombuffer(data, dtype=np.uint8)
+		ends = np.flatnonzero(buf == NEWLINE)
+		starts = np.concatenate(([0], ends[:-1] + 1))
+		header = buf[starts] == GT
+
+		# Match length: the last field of every other line, when it is a number
+		stop = step_while(buf, ends, starts, -1, is_space)
+		first = step_while(buf, stop, starts, -1, is_digit)
+		numeric = ~header & (first < stop) & ((first == starts) | is_space(buf[np.maximum(first - 1, 0)]))
+		first, width = first[numeric], (stop - first)[numeric]
+		lengths = np.zeros(len(first), dtype=np.int64)
+		for k in range(int(width.max(initial=0))):
+			more = width > k
+			lengths[more] = lengths[more] * 10 + (buf[first[more] + k] - ZERO)
+		self.length_hist = accumulate(self.length_hist, lengths)
+		self.matches += len(lengths)
+
+		# Query names: header text stripped, " Reverse" (-b) continuing the same query
+		h = np.flatnonzero(header)
+		if not len(h):
+			self._query_matches += len(lengths)
+			return
+		name_end = stop[h]
+		name_start = step_while(buf, starts[h] + 1, name_end, 1, is_space)
+		reverse = name_end - name_start >= len(REVERSE)
+		for k, c in enumerate(REVERSE):
+			reverse &= buf[np.maximum(name_end - len(REVERSE) + k, 0)] == c
+		name_end = np.where(reverse, name_end - len(REVERSE), name_end)
+		new = np.ones(len(h), dtype=bool)
+		new[0] = bytes(buf[name_start[0]:name_end[0]]) != self._query
+		new[1:] = ~same_ranges(buf, name_start[:-1], name_start[1:], name_end[:-1] - name_start[:-1],
+		                       name_end[1:] - name_start[1:])
+
+		# Matches per query, queries numbered by the new headers before each line
+		query = np.zeros(len(ends), dtype=np.int64)
+		query[h[new]] = 1
+		query = np.cumsum(query)
+		counts = np.bincount(query[numeric], minlength=query[-1] + 1)
+		self._query_matches += counts[0]
+		if len(counts) > 1:
+			self._end_query()
+			self.queries += len(counts) - 2
+			self.per_query_hist = accumulate(self.per_query_hist, counts[1:-1])
+			self._query_matches = counts[-1]
+		self._query = bytes(buf[name_start[-1]:name_end[-1]])
+
+	def _end_query(self):
+		if self._query is not None:
+			self.queries += 1
+			self.per_query_hist = accumulate(self.per_query_hist, [self._query_matches])
+		self._query_matches = 0
+
+	def finish(self):
+		"""Parse whatever is left (output not ending in a newline) and close the last query."""
+		if self._tail:
+			self._parse(self._tail + b"\n")
+			self._tail = b""
+		self._end_query()
+		self._query = None
+		return self
+
+	def hexdigest(self):
+		return self.md5.hexdigest()
+
+	def summary(self):
+		lengths = np.flatnonzero(self.length_hist)
+		return {
+			"bytes": self.bytes,
+			"queries": self.queries,
+			"matches": self.matches,
+			"matches_per_query": self.queries and float(self.matches) / self.queries or 0.0,
+			"mean_length": self.matches and float(np.dot(np.arange(len(self.length_hist)), self.length_hist))
+			               / self.matches or 0.0,
+			"max_length": len(lengths) and int(lengths[-1]) or 0,
+		}
+
+	def write_stats(self, path):
+		"""Both histograms as kind,value,count rows."""
+		with open(path, "w") as f:
+			f.write("kind,value,count\n")
+			for kind, hist in (("length", self.length_hist), ("matches_per_query", self.per_query_hist)):
+				for value in np.flatnonzero(hist):
+					f.write("%s,%d,%d\n" % (kind, value, hist[value]))
+
+def stream(src, digest=None, chunk_bytes=CHUNK_BYTES):
+	"""Feed a binary file object to digest until EOF."""
+	digest = digest or OutputDigest()
+	while True:
+		chunk = src.read(chunk_bytes)
+		if not chunk:
+			break
+		digest.update(chunk)
+	return digest.finish()
+
+def run_streamed(cmd, cores=None):
+	"""Wall time and OutputDigest of cmd's stdout, pinned to cores if given."""
+	if cores:
+		cmd = ["taskset", "-c", ",".join(str(c) for c in cores)] + cmd
+	print(" ".join(cmd), file=sys.stderr)
+	start = time.perf_counter()
+	proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+	digest = stream(proc.stdout)
+	if proc.wait() != 0:
+		raise subprocess.CalledProcessError(proc.returncode, cmd)
+	return time.perf_counter() - start, digest
+
+def expected_md5(md5_file, name):
+	"""
+	Digest recorded for name in an md5sum-format file (matched on the file
+	name); when name is not listed but every entry agrees, that digest.
+	"""
+	digests = {}
+	with open(md5_file) as f:
+		for line in f:
+			parts = line.split(None, 1)
+			if len(parts) == 2:
+				digests[os.path.basename(parts[1].strip())] = parts[0]
+	if name and os.path.basename(name) in digests:
+		return digests[os.path.basename(name)]
+	if len(set(digests.values())) == 1:
+		return list(digests.values())[0]
+	return None
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Hash and summarise aligner output without writing it to disk")
+	parser.add_argument("--name", default="-", help="name printed with the digest and looked up in --check")
+	parser.add_argument("--check", metavar="MD5_FILE", help="md5sum-format file holding the expected digest")
+	parser.add_argument("--stats", metavar="CSV", help="write the match length and matches-per-query histograms")
+	parser.add_argument("cmd", nargs=argparse.REMAINDER, help="aligner command (default: read stdin)")
+	args = parser.parse_args()
+
+	cmd = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+	if cmd:
+		wall_time, digest = run_streamed(cmd)
+		print("wall time: %f s" % wall_time, file=sys.stderr)
+	else:
+		digest = stream(sys.stdin.buffer)
+
+	print("%s  %s" % (digest.hexdigest(), args.name))
+	print(", ".join("%s: %g" % item for item in digest.summary().items()), file=sys.stderr)
+	if args.stats:
+		digest.write_stats(args.stats)
+
+	if args.check and os.path.exists(args.check):
+		expected = expected_md5(args.check, args.name)
+		if expected is None:
+			print("WARNING: no digest for %s in %s" % (args.name, args.check), file=sys.stderr)
+		elif expected != digest.hexdigest():
+			print("MISMATCH: %s is %s, %s expects %s" % (args.name, digest.hexdigest(), args.check, expected),
+			      file=sys.stderr)
+			sys.exit(1)
+		else:
+			print("OK: %s matches %s" % (args.name, args.check), file=sys.stderr)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+"""
+whatif.py
+
+Amdahl's law projections from MUMmerGPU phase timings: what Total becomes
+when phases get faster, or run overlapped with each other.
+
+Phases are results_db columns (match_kernel, tree_flatten, ...) or their
+categories: io, tree, transfer, kernel, output. Time not covered by any
+phase stays as it is. An overlap runs its parts concurrently, so it costs
+the longest of them instead of their sum.
+
+Without a scenario, the sensitivity table gives for every dataset each
+category's share of Total, the speedup if it alone became --factor times
+faster, and the Amdahl limit if it took no time at all; "bound" names the
+category with the largest share, where optimization effort pays most.
+
+	python3 whatif.py                                    # best GPU configuration of every dataset
+	python3 whatif.py --speedup kernel=4 --overlap transfer,kernel --overlap io,tree
+	python3 whatif.py --config Tn --speedup tree_construction=2 ../experiments/e2e
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+import numpy as np
+
+import results_db
+
+EXPERIMENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "experiments")
+PHASES = [col for col, _ in results_db.PHASE_COLUMNS if col != "total"]
+CATEGORIES = dict((key, cols) for key, _, cols in results_db.PHASE_CATEGORIES)
+FACTOR = 2.0
+KEYS = ["dataset", "query", "min_match", "config", "on_cpu"]
+
+
+def load(paths, on_cpu=False, config=None, every=False):
+	"""
+	Mean phase times (ms) per dataset, query, min match and configuration:
+	(key rows, Total array, {phase: array}). Unless every or config is
+	given, only the fastest configuration of each dataset is kept.
+	"""
+	db = results_db.connect(":memory:")
+	for path in paths:
+		results_db.import_path(db, path)
+	sql = "SELECT %s, AVG(total) AS total, %s FROM runs WHERE on_cpu = ? AND total IS NOT NULL %s GROUP BY %s" % (
+		", ".join(KEYS), ", ".join("AVG(%s) AS %s" % (col, col) for col in PHASES),
+		config and "AND config = ?" or "", ", ".join(KEYS))
+	rows = db.execute(sql, [int(on_cpu)] + (config and [config] or [])).fetchall()
+	if not every and not config:
+		best = {}
+		for row in rows:
+			key = (row["dataset"], row["query"], row["min_match"])
+			if key not in best or row["total"] < best[key]["total"]:
+				best[key] = row
+		rows = list(best.values())
+	rows.sort(key=lambda row: [str(row[k]) for k in KEYS])
+	total = np.array([row["total"] for row in rows], dtype=float)
+	phases = dict((col, np.array([row[col] or 0.0 for row in rows], dtype=float)) for col in PHASES)
+	return rows, total, phases
+
+def parts_of(name):
+	if name in CATEGORIES:
+		return CATEGORIES[name]
+	if name in PHASES:
+		return [name]
+	raise ValueError("unknown phase %s (phases: %s; categories: %s)" % (name, ", ".join(PHASES), ", ".join(CATEGORIES)))
+
+def group_times(phases, names):
+	"""Time of each named part (phase or category), the named phases taken out of their categories."""
+	explicit = set(name for name in names if name in PHASES)
+	times = {}
+	for name in names:
+		cols = name in PHASES and [name] or [col for col in parts_of(name) if col not in explicit]
+		times[name] = sum((phases[col] for col in cols), np.zeros_like(phases[PHASES[0]]))
+	return times
+
+def project(total, phases, speedups=None, overlaps=()):
+	"""
+	Projected Total: the named parts divided by their speedup factors, each
+	overlap costing its longest part, everything else unchanged.
+	"""
+	speedups = speedups or {}
+	names = list(dict.fromkeys(list(speedups) + [name for overlap in overlaps for name in overlap]))
+	seen = [name for overlap in overlaps for name in overlap]
+	if len(seen) != len(set(seen)):
+		raise ValueError("a phase can only be in one overlap")
+	for a in names:
+		for b in names:
+			if a != b and a in CATEGORIES and b in PHASES and b in CATEGORIES[a] and \
+			   any(a in o and b in o for o in overlaps):
+				raise ValueError("%s cannot overlap its own phase %s" % (a, b))
+	times = group_times(phases, names)
+	untouched = total - sum((times[name] for name in names), np.zeros_like(total))
+	projected = untouched + sum((times[name] / speedups.get(name, 1.0) for name in names if name not in seen),
+	                            np.zeros_like(total))
+	for overlap in overlaps:
+		projected += np.max([times[name] / speedups.get(name, 1.0) for name in overlap], axis=0)
+	return projected
+
+def sensitivity(total, phases, factor=FACTOR):
+	"""Per category: (share of Total, speedup at factor, Amdahl limit) arrays; and the bounding category."""
+	table = {}
+	for name in CATEGORIES:
+		t = group_times(phases, [name])[name]
+		with np.errstate(divide="ignore"):
+			table[name] = (t / total, total / (total - t + t / factor), total / (total - t))
+	shares = np.stack([table[name][0] for name in CATEGORIES], axis=1)
+	bound = [list(CATEGORIES)[k] for k in np.argmax(shares, axis=1)]
+	return table, bound
+
+def parse_speedup(spec):
+	name, _, factor = spec.partition("=")
+	parts_of(name)
+	if float(factor) <= 0:
+		raise ValueError("speedup factor of %s must be positive" % name)
+	return name, float(factor)
+
+def parse_overlap(spec):
+	names = spec.split(",")
+	for name in names:
+		parts_of(name)
+	if len(names) < 2:
+		raise ValueError("an overlap needs at least two phases")
+	return names
+
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Amdahl what-if projections from MUMmerGPU phase timings")
+	parser.add_argument("paths", nargs="*", help="stats files or directories (default: ../experiments)")
+	parser.add_argument("--speedup", action="append", default=[], metavar="PHASE=FACTOR",
+	                    help="make a phase or category FACTOR times faster (repeatable)")
+	parser.add_argument("--overlap", action="append", default=[], metavar="PHASE,PHASE",
+	                    help="run phases or categories concurrently (repeatable)")
+	parser.add_argument("--factor", type=float, default=FACTOR,
+	                    help="per-category speedup in the sensitivity table (default %g)" % FACTOR)
+	parser.add_argument("--config", help="this configuration instead of each dataset's fastest")
+	parser.add_argument("--all", action="store_true", dest="every", help="every configuration")
+	parser.add_argument("--cpu", action="store_true", help="CPU (-C) runs instead of GPU runs")
+	args = parser.parse_args()
+	try:
+		speedups = dict(parse_speedup(spec) for spec in args.speedup)
+		overlaps = [parse_overlap(spec) for spec in args.overlap]
+	except ValueError as err:
+		parser.error(str(err))
+
+	rows, total, phases = load(args.paths or [EXPERIMENTS], args.cpu, args.config, args.every)
+	if not rows:
+		parser.error("no runs with phase timings found")
+	table, bound = sensitivity(total, phases, args.factor)
+	scenario = speedups or overlaps
+	if scenario:
+		try:
+			projected = project(total, phases, speedups, overlaps)
+		except ValueError as err:
+			parser.error(str(err))
+
+	writer = csv.writer(sys.stdout)
+	header = KEYS + ["total_s"]
+	for name in CATEGORIES:
+		header += ["%s_share" % name, "%s_x%g" % (name, args.factor), "%s_limit" % name]
+	header += ["bound"] + (scenario and ["projected_s", "speedup"] or [])
+	writer.writerow(header)
+	for k, row in enumerate(rows):
+		line = [row[key] for key in KEYS] + ["%.3f" % (total[k] / 1000.0)]
+		for name in CATEGORIES:
+			share, at_factor, limit = (v[k] for v in table[name])
+			line += ["%.3f" % share, "%.3f" % at_factor, np.isfinite(limit) and "%.3f" % limit or "inf"]
+		line.append(bound[k])
+		if scenario:
+			line += ["%.3f" % (projected[k] / 1000.0), "%.3f" % (total[k] / projected[k])]
+		writer.writerow(line)
+	if scenario:
+		print("scenario: %s; speedup %.2f-%.2fx across %d rows"
+		      % ("; ".join(["%s x%g" % item for item in speedups.items()] + ["overlap " + "+".join(o) for o in overlaps]),
+		         (total / projected).min(), (total / projected).max(), len(rows)), file=sys.stderr)
@@ -0,0 +1,172 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+
+# sg_loader.py lives with the gapbs sources
+GAPBS_DIR = os.environ.get(
+    "GAPBS_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "P1_B2", "gapbs"))
+sys.path.insert(0, GAPBS_DIR)
+import sg_loader  # noqa: E402
+from sg_loader import ragged_arange  # noqa: E402
+
+# Vertices whose reuse distances are measured (sampled, so the cost stays one pass over the edges)
+REUSE_SAMPLE = 4096
+# Reuses closer than this many neighbour entries count as short (512 KiB L2 of 4-byte ids)
+SHORT_REUSE_EDGES = (512 * 1024) // 4
+RANDOM_STATE = 42
+
+# Run names like bfs_g20 (reproduce_perf_counters.sh) or bfs_g20_perf give kernel and scale
+RUN_RE = re.compile(r"(?P<kernel>[a-z_]+?)_g(?P<scale>\d+)")
+WEIGHTED_KERNELS = {"sssp"}
+
+FEATURES = [
+    "num_nodes", "num_edges", "avg_degree", "max_degree", "degree_skew",
+    "avg_neighbor_gap", "reuse_distance_median", "reuse_distance_p90", "short_reuse_frac",
+    "diameter_estimate",
+]
+
+
+def degree_features(g):
+    """
+    Degree statistics; degree_skew is the sample skewness of the degree
+    distribution (large for the heavy-tailed Kronecker graphs).
+    """
+    deg = g.out_degrees().astype(float)
+    std = deg.std()
+    return {
+        "num_nodes": g.num_nodes,
+        "num_edges": g.num_edges,
+        "avg_degree": deg.mean(),
+        "max_degree": int(deg.max()),
+        "degree_skew": float(np.mean((deg - deg.mean()) ** 3) / std ** 3) if std > 0 else 0.0,
+    }
+
+
+def reuse_features(g, sample=REUSE_SAMPLE, chunk_edges=sg_loader.CHUNK_EDGES, seed=RANDOM_STATE):
+    """
+    Estimated reuse distance of vertex data in a CSR sweep: for a random
+    sample of vertices, the number of neighbour entries between consecutive
+    appearances of the vertex in the neighbour array (how long its property,
+    e.g. parent[v], must stay cached to be hit again).
+    """
+    rng = np.random.default_rng(seed)
+    candidates = np.flatnonzero(g.in_degrees() > 1)
+    if len(candidates) == 0:
+        return {"reuse_distance_median": 0.0, "reuse_distance_p90": 0.0, "short_reuse_frac": 0.0}
+    picked = np.zeros(g.num_nodes, dtype=bool)
+    picked[rng.choice(candidates, min(sample, len(candidates)), replace=False)] = True
+
+    vertices, positions = [], []
+    for _, _, e0, e1 in g.vertex_chunks(chunk_edges):
+        nb = g.neighbors[e0:e1]
+        hit = np.flatnonzero(picked[nb])
+        vertices.append(nb[hit])
+        positions.append(hit + e0)
+    vertices, positions = np.concatenate(vertices), np.concatenate(positions)
+    by_vertex = np.lexsort((positions, vertices))
+    vertices, positions = vertices[by_vertex], positions[by_vertex]
+    same = vertices[1:] == vertices[:-1]
+    distances = np.diff(positions)[same]
+    return {
+        "reuse_distance_median": float(np.median(distances)),
+        "reuse_distance_p90": float(np.percentile(distances, 90)),
+        "short_reuse_frac": float(np.mean(distances <= SHORT_REUSE_EDGES)),
+    }
+
+
+def bfs_depths(g, source, chunk_edges=sg_loader.CHUNK_EDGES):
+    """Level-synchronous BFS over out-edges; depth per vertex, -1 if unreached."""
+    deg = g.out_degrees()
+    depth = np.full(g.num_nodes, -1, dtype=np.int64)
+    depth[source] = 0
+    frontier, level = np.array([source]), 0
+    while len(frontier):
+        level += 1
+        found = []
+        cuts = np.searchsorted(np.cumsum(deg[frontier]), np.arange(chunk_edges, deg[frontier].sum(), chunk_edges))
+        for part in np.split(frontier, cuts):
+            nb = g.neighbors[ragged_arange(g.offsets[part], deg[part])]
+            nb = np.unique(nb[depth[nb] < 0])
+            depth[nb] = level
+            found.append(nb)
+        frontier = np.concatenate(found)
+    return depth
+
+
+def diameter_estimate(g):
+    """
+    Double-sweep lower bound on the diameter: BFS from the highest-degree
+    vertex, then again from the farthest vertex found; the second BFS's depth.
+    """
+    if g.num_edges_directed == 0:
+        return 0
+    first = bfs_depths(g, int(np.argmax(g.out_degrees())))
+    far = int(np.argmax(first))
+    return int(bfs_depths(g, far).max())
+
+
+def graph_features(path):
+    """All structural features of one .sg/.wsg graph."""
+    g = sg_loader.load(path)
+    features = degree_features(g)
+    features["avg_neighbor_gap"] = sg_loader.avg_neighbor_gap(g)
+    features.update(reuse_features(g))
+    features["diameter_estimate"] = diameter_estimate(g)
+    return features
+
+
+def resolve_graph(run, gapbs_dir=GAPBS_DIR):
+    """Graph of a run named <kernel>_g<scale>..., taken from the gapbs graph cache."""
+    match = RUN_RE.match(run)
+    if not match:
+        return None
+    cmd = ["python3", "graph_cache.py", "path", "--scale", match.group("scale")]
+    if match.group("kernel") in WEIGHTED_KERNELS:
+        cmd.append("--weighted")
+    out = subprocess.run(cmd, cwd=gapbs_dir, capture_output=True, text=True, check=True).stdout.strip()
+    return os.path.join(gapbs_dir, out)
+
+
+def extract(run_graphs):
+    """One row of features per (run, graph); graphs shared by several runs are analysed once."""
+    cache = {}
+    rows = []
+    for run, path in run_graphs:
+        if path not in cache:
+            print(f"Extracting features of {path} ...")
+            cache[path] = graph_features(path)
+        rows.append({"run": run, "graph": os.path.basename(path), **cache[path]})
+    return pd.DataFrame(rows, columns=["run", "graph"] + FEATURES)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Structural graph features per gapbs run")
+    parser.add_argument("graphs", nargs="*", metavar="RUN=GRAPH",
+                        help="explicit run name and .sg/.wsg path pairs")
+    parser.add_argument("--runs-from", metavar="CSV",
+                        help="also take the runs of this dataset (its 'run' column), "
+                             "resolving <kernel>_g<scale> names through the gapbs graph cache")
+    parser.add_argument("--gapbs-dir", default=GAPBS_DIR)
+    parser.add_argument("-o", "--output", default="graph_features.csv")
+    args = parser.parse_args()
+
+    run_graphs = [tuple(item.split("=", 1)) for item in args.graphs]
+    if args.runs_from:
+        for run in pd.read_csv(args.runs_from)["run"].unique():
+            path = resolve_graph(run, args.gapbs_dir)
+            if path is None:
+                print(f"WARNING: cannot tell the graph of run {run}, skipping")
+                continue
+            run_graphs.append((run, path))
+    if not run_graphs:
+        parser.error("no runs given (RUN=GRAPH pairs or --runs-from)")
+
+    df = extract(run_graphs)
+    df.to_csv(args.output, index=False)
+    print(f"Done! Features of {len(df)} runs saved to {args.output}")
@@ -19,6 +19,14 @@ EVENTS = [
     "fp_ret_sse_avx_ops.all"
 ]
 
+# Optional per-run graph features (graph_features.py), joined on the run column
+GRAPH_FEATURES_FILE = "graph_features.csv"
+
+def run_name(filepath):
+    """Run id of a perf file: its name without the _perf.txt suffix (e.g. bfs_g20)."""
+    name = os.path.basename(filepath)
+    return name[:-len("_perf.txt")] if name.endswith("_perf.txt") else os.path.splitext(name)[0]
+
 def parse_perf_file(filepath):
     """
     Parse a single perf txt file and return a dataframe.
@@ -104,14 +112,27 @@ def process_all_files(file_pattern="*_perf.txt", instr_threshold=100_000_000):
         print(f"Processing {f} ...")
         df = parse_perf_file(f)
         df = merge_contiguous(df, instr_threshold)
+        df.insert(0, "run", run_name(f))
         combined_df = pd.concat([combined_df, df], ignore_index=True)
     return combined_df
 
+def join_graph_features(df, features_file=GRAPH_FEATURES_FILE):
+    """
+    Add the structural features of each run's graph as columns.
+    Runs without features keep NaN there.
+    """
+    if not os.path.exists(features_file):
+        return df
+    features = pd.read_csv(features_file)
+    print(f"Joining graph features from {features_file} ...")
+    return df.merge(features, on="run", how="left")
+
 def save_outputs(df, csv_file="combined_perf.csv", json_file="combined_perf.json"):
     df.to_csv(csv_file, index_label="Index")
     df.to_json(json_file, orient="records", indent=2)
 
 if __name__ == "__main__":
     combined_df = process_all_files(file_pattern="*_perf.txt", instr_threshold=100_000_000)
+    combined_df = join_graph_features(combined_df)
     save_outputs(combined_df)
     print(f"Done! CSV and JSON saved. Total rows: {len(combined_df)}")
@@ -56,6 +56,13 @@ FEATURE_COLUMN_CANDIDATES = {
     ]
 }
 
+# Structural features of the traversed graph (graph_features.py, joined per run by make_dataset.py).
+# Used with --graph-features; they are constant within a run, so they explain CPI differences between
+# runs (scales, orderings) rather than within one. Like the counters, their coefficients are non-negative.
+GRAPH_FEATURE_COLUMNS = [
+    "degree_skew", "avg_neighbor_gap", "reuse_distance_median", "short_reuse_frac", "diameter_estimate"
+]
+
 # Column names we expect / will compute
 CYCLES_COL = "cycles"
 INSTR_COL = "instructions"
@@ -76,10 +83,11 @@ def find_column(df, candidate_names):
                 return c
     return None
 
-def build_feature_matrix(df):
+def build_feature_matrix(df, graph_features=False):
     """
     Build X (features) and feature_names from dataframe using FEATURE_COLUMN_CANDIDATES.
     If none of the candidate names are found for a feature, fill that column with zeros and warn.
+    With graph_features, the GRAPH_FEATURE_COLUMNS present in df are appended.
     """
     X_cols = []
     feature_names = []
@@ -94,6 +102,13 @@ def build_feature_matrix(df):
             X_cols.append(np.zeros(len(df), dtype=float))
             feature_names.append(feat)
             missing.append(feat)
+    if graph_features:
+        for col in GRAPH_FEATURE_COLUMNS:
+            if col in df.columns and df[col].notna().any():
+                X_cols.append(df[col].astype(float).fillna(df[col].mean()).values)
+                feature_names.append(col)
+            else:
+                missing.append(col)
     X = np.vstack(X_cols).T  # shape (n_samples, n_features)
     return X, feature_names, missing
 
@@ -134,7 +149,7 @@ def compute_metrics(y_true, y_pred, p):
     }
 
 # ---------- main ----------
-def main(csv_path):
+def main(csv_path, graph_features=False):
     if not os.path.exists(csv_path):
         print("CSV file not found:", csv_path)
         sys.exit(1)
@@ -153,7 +168,7 @@ def main(csv_path):
     print(f"Samples after dropping NaN CPI: {n_samples}")
 
     # Build features matrix X
-    X, feature_names, missing_features = build_feature_matrix(df)
+    X, feature_names, missing_features = build_feature_matrix(df, graph_features)
     if missing_features:
         print("WARNING: Some conceptual features not found in CSV. These will be zero columns:", missing_features)
     print("Feature names used (in order):", feature_names)
@@ -228,6 +243,8 @@ def main(csv_path):
         "y_pred": y_pred,
         "residual": residuals
     }).sort_values("index").reset_index(drop=True)
+    if "run" in df.columns:
+        df_res.insert(1, "run", df.loc[df_res["index"], "run"].values)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     residuals_file = f"residuals_{timestamp}.csv"
@@ -284,8 +301,9 @@ def main(csv_path):
     print("Plot:", plot_file)
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 regress_cpi.py combined_perf.csv")
+    args = [a for a in sys.argv[1:] if a != "--graph-features"]
+    if len(args) < 1:
+        print("Usage: python3 regress_cpi.py combined_perf.csv [--graph-features]")
         sys.exit(1)
-    csv_path = sys.argv[1]
-    main(csv_path)
+    csv_path = args[0]
+    main(csv_path, graph_features="--graph-features" in sys.argv[1:])